@@ -3,7 +3,12 @@ Core utilities for parameter handling, validation, and thermophysics.
 
 Modules:
 - params: Unified schema (YAML), loader for legacy files, strict validation.
-- thermo: Thermophysical helper functions (e.g., p_sat(T)).
+- thermo: Vectorized thermophysics (Psat, dPsat/dT, J_evap, recoil) with a material registry.
+- pulse: Compile COMSOL pulse expressions (Ppp, flc2hs) into vectorized NumPy callables.
+- diffusivity: Gas diffusivity laws D(T, p) for tin-vapour transport (environment.diffusivity_law).
+- properties: Temperature-dependent tin properties (Andrade mu, sigma, k, cp) shared by the
+  Python solvers and the COMSOL interpolation tables.
+- surrogate: Gaussian-process surrogates trained on sweep manifests (vectorized predict with uncertainty).
 - utils: Small helpers (units parsing, safe eval sandbox for expressions).
 """
 
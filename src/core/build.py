@@ -60,6 +60,41 @@ def resolve_inputs(params_dir: Optional[Path]):
     return gp, lp, px
 
 
+def run_input_files(params_dir: Optional[Path], absorption_model: str = "fresnel") -> list:
+    """Existing input files a build with ``params_dir`` reads (e.g. to key a result cache).
+
+    The YAML config `params.load_config` reads (<params_dir or ./data>/config.yaml), the legacy
+    TXT files `resolve_inputs` finds (missing ones are skipped, not an error) and, for Fresnel,
+    the Sizyuk tables plus the oblique table (absorption.angle_resolved) and the n,k workbook
+    (absorption.use_nk or autogenerate_if_missing).
+    """
+    files = []
+    yaml_path = (params_dir or Path("data")).resolve() / "config.yaml"
+    absorption = {}
+    if yaml_path.is_file():
+        files.append(yaml_path)
+        try:
+            import yaml
+            absorption = (yaml.safe_load(yaml_path.read_text(encoding="utf-8")) or {}).get("absorption") or {}
+        except Exception:
+            absorption = {}
+    here = Path(__file__).resolve().parent.parent
+    search_dirs = [params_dir.resolve()] if params_dir else [here, Path.cwd().resolve()]
+    for fname in ("global_parameters_pp_v2.txt", "laser_parameters_pp_v2.txt", "Ppp_analytic_expression.txt"):
+        p = find_first([d / fname for d in search_dirs])
+        if p:
+            files.append(p)
+    if absorption_model == "fresnel":
+        sizyuk = Path.cwd() / "data" / "derived" / "sizyuk"
+        files += sorted(sizyuk.glob("*.csv"))
+        files.append(sizyuk / "sizyuk_manifest.json")
+        if absorption.get("angle_resolved"):
+            files.append(sizyuk / "absorptivity_oblique.npz")
+        if absorption.get("nk_file") and (absorption.get("use_nk") or absorption.get("autogenerate_if_missing")):
+            files.append(Path(absorption["nk_file"]))
+    return [p for p in files if p.is_file()]
+
+
 def _strip_inline_comment(s: str) -> str:
     cut = len(s)
     h = s.find('#')
@@ -209,16 +244,9 @@ def build_model(no_solve: bool, params_dir: Optional[Path], out_dir: Optional[Pa
     Ppp.property("funcname", "Ppp")
     Ppp.property("args", ["t"])
     P_expr = read_pulse_expression(pulse_path)
-    if cfg is not None and getattr(cfg, "laser", None) is not None and cfg.laser.temporal_profile:
-        eps = "1e-12[s]"; t0 = "0[s]"
-        if cfg.laser.temporal_profile == "square" and cfg.laser.tau_square:
-            P_expr = f"(E_PP_total/{cfg.laser.tau_square})*(flc2hs(t-{t0},{eps})-flc2hs(t-({t0}+{cfg.laser.tau_square}),{eps}))"
-        elif cfg.laser.temporal_profile in ("ramp_square", "ramp+square") and cfg.laser.tau_square:
-            tau_r = cfg.laser.tau_ramp or 0.0; tau_s = cfg.laser.tau_square
-            P_expr = (
-                f"(E_PP_total/{tau_s})*min( (t-{t0})/({tau_r}+{eps}), 1)"
-                f"*(flc2hs(t-{t0},{eps})-flc2hs(t-({t0}+{tau_r}+{tau_s}),{eps}))"
-            )
+    if cfg is not None:
+        from .pulse import config_pulse_expression
+        P_expr = config_pulse_expression(getattr(cfg, "laser", None)) or P_expr
     Ppp.property("expr", P_expr)
 
     psat = functions.create("Analytic", name="psat")
@@ -239,9 +267,9 @@ def build_model(no_solve: bool, params_dir: Optional[Path], out_dir: Optional[Pa
     if absorption_model == "fresnel":
         Acalc = None
         if cfg is not None and getattr(cfg, "absorption", None) is not None and cfg.absorption.use_precomputed:
-            Acalc = _pick_A_from_precomputed(cfg, repo_root=Path.cwd())
-            # If missing and allowed to autogenerate, run pp_sizyuk to create tables
-            if Acalc is None and cfg.absorption.autogenerate_if_missing and cfg.absorption.nk_file:
+            # If allowed to autogenerate, let pp_sizyuk (re)build missing or stale tables;
+            # its manifest makes this a hash check when the tables are already fresh
+            if cfg.absorption.autogenerate_if_missing and cfg.absorption.nk_file and Path(cfg.absorption.nk_file).is_file():
                 try:
                     from ..pp_sizyuk import run_sizyuk
                 except Exception:
@@ -249,13 +277,28 @@ def build_model(no_solve: bool, params_dir: Optional[Path], out_dir: Optional[Pa
                 nkp = Path(cfg.absorption.nk_file)
                 out_tables = Path.cwd() / "data" / "derived" / "sizyuk"
                 out_plots = Path.cwd() / "results" / "sizyuk" / "plots"
-                run_sizyuk(nkp, out_tables, out_plots, config=None)
-                Acalc = _pick_A_from_precomputed(cfg, repo_root=Path.cwd())
+                run_sizyuk(nkp, out_tables, out_plots,
+                           config={"n_medium": getattr(cfg.absorption, "n_medium", None)})
+            Acalc = _pick_A_from_precomputed(cfg, repo_root=Path.cwd())
         if Acalc is None:
             Acalc = compute_A_PP_from_nk(cfg)
         if Acalc is not None:
             model.parameter("A_PP", f"{Acalc:.6g}")
 
+    # Optional angle-resolved absorptivity A(θ_inc) at lambda_um from the oblique table
+    A_theta = None
+    if absorption_model == "fresnel" and cfg is not None and getattr(cfg.absorption, "angle_resolved", None):
+        A_theta = _pick_A_theta_from_precomputed(cfg, repo_root=Path.cwd())
+        if A_theta is not None:
+            th_tab, A_tab = A_theta
+            A_inc = functions.create("Interpolation", name="A_inc")
+            A_inc.property("funcname", "A_inc")
+            A_inc.property("table", [[f"{th:.8g}", f"{a:.8g}"] for th, a in zip(th_tab, A_tab)])
+            A_inc.property("interp", "linear")
+            A_inc.property("extrap", "const")
+            A_inc.property("argunit", ["rad"])
+            A_inc.property("fununit", ["1"])
+
     components = model / "components"
     components.create(True, name="component"); comp = components / "component"
     geometries = model / "geometries"; geom = geometries.create(2, name="geometry")
@@ -313,6 +356,12 @@ def build_model(no_solve: bool, params_dir: Optional[Path], out_dir: Optional[Pa
         'Radius helper'
     ])
 
+    if A_theta is not None:
+        # Replace constant A_PP by the tabulated A(θ_inc); θ_inc = acos(incidence factor)
+        var_ob = cdefs.create("Variables", name="variables_oblique")
+        var_ob.property("expr", ["q_abs_2D = A_inc(acos(min(inc_factor,1)))*I_xy*inc_factor"])
+        var_ob.property("unit", ['W/m^2'])
+
     int_surf = cdefs.create("Integration", name="intop_surf"); int_surf.property("entitydim", 1); int_surf.property("probetag", "none"); int_surf.select("s_surf")
     max_surf = cdefs.create("Maximum", name="maxop_surf"); max_surf.property("entitydim", 1); max_surf.property("probetag", "none"); max_surf.select("s_surf")
     int_drop = cdefs.create("Integration", name="intop_drop"); int_drop.property("entitydim", 2); int_drop.property("probetag", "none"); int_drop.select("s_drop")
@@ -342,12 +391,10 @@ def build_model(no_solve: bool, params_dir: Optional[Path], out_dir: Optional[Pa
     evap = tds.create("Flux", 1, name="evaporation flux"); evap.select("s_surf"); evap.property("N0", "-J_evap")
     # Optional gas diffusion law
     if cfg is not None and getattr(cfg, "environment", None) is not None and cfg.environment.diffusivity_law:
+        from .diffusivity import law_from_config
         cdm_g = tds.create("ConvectionDiffusion", 2, name="gas transport"); cdm_g.select("s_gas")
-        if cfg.environment.diffusivity_law == "t175_over_p":
-            Dm0 = cfg.environment.Dm0 or 1.0e-3
-            cdm_g.property("Dc", [[f"{Dm0}*(T/300[K])^1.75/max(p_amb,1[Pa])", "0", "0", "0",
-                                     f"{Dm0}*(T/300[K])^1.75/max(p_amb,1[Pa])", "0", "0", "0",
-                                     f"{Dm0}*(T/300[K])^1.75/max(p_amb,1[Pa])"]])
+        D_expr = law_from_config(cfg).comsol_expression("T", "p_amb")
+        cdm_g.property("Dc", [[D_expr, "0", "0", "0", D_expr, "0", "0", "0", D_expr]])
 
     spf = physics.create("LaminarFlow", geom, name="spf"); spf.select("s_drop")
     st = spf.create("SurfaceTension", 1, name="surface tension"); st.select("s_surf"); st.property("gamma", "sigmaT")
@@ -506,23 +553,41 @@ def compute_A_PP_from_nk(cfg) -> Optional[float]:
 
 
 def _pick_A_from_precomputed(cfg, repo_root: Path) -> Optional[float]:
-    """Load A(λ) from data/derived/sizyuk/ CSVs and return A at cfg.absorption.lambda_um (nearest)."""
+    """A at cfg.absorption.lambda_um, linearly interpolated from the data/derived/sizyuk/ A(λ) table.
+
+    The table is parsed once per process and shared through `io.absorptivity.load_table`.
+    """
     try:
-        import pandas as pd
+        try:
+            from ..io.absorptivity import load_sizyuk_absorptivity
+        except Exception:
+            from src.io.absorptivity import load_sizyuk_absorptivity
         if cfg is None or getattr(cfg, "absorption", None) is None:
             return None
         lam_sel = float(cfg.absorption.lambda_um or 0.0)
         if lam_sel <= 0:
             return None
-        base = repo_root / "data" / "derived" / "sizyuk"
-        fA = base / "absorptivity_vs_lambda.csv"
-        if not fA.is_file():
+        table = load_sizyuk_absorptivity(repo_root)
+        return float(table(lam_sel)) if table is not None else None
+    except Exception:
+        return None
+
+
+def _pick_A_theta_from_precomputed(cfg, repo_root: Path):
+    """Return (θ_rad, A(θ)) at cfg.absorption.lambda_um from the oblique Sizyuk table, or None."""
+    try:
+        try:
+            from ..pp_sizyuk import ObliqueAbsorptivity, OBLIQUE_TABLE_NAME
+        except Exception:
+            from src.pp_sizyuk import ObliqueAbsorptivity, OBLIQUE_TABLE_NAME
+        lam_sel = float(cfg.absorption.lambda_um or 0.0)
+        if lam_sel <= 0:
             return None
-        df = pd.read_csv(fA)
-        if df.empty:
+        f = repo_root / "data" / "derived" / "sizyuk" / OBLIQUE_TABLE_NAME
+        if not f.is_file():
             return None
-        # find nearest wavelength
-        idx = (df["lambda_um"] - lam_sel).abs().idxmin()
-        return float(df.loc[idx, "A"]) if "A" in df.columns else None
+        table = ObliqueAbsorptivity.load(f)
+        pol = getattr(cfg.absorption, "polarization", None) or "unpolarized"
+        return table.theta_rad, table(lam_sel, table.theta_rad, pol)
     except Exception:
         return None
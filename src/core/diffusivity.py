@@ -0,0 +1,116 @@
+"""
+Gas diffusivity laws D(T, p) for the tin-vapour transport (TDS) interface.
+
+``environment.diffusivity_law`` selects a law, ``environment.Dm0`` its prefactor:
+
+    t175_over_p:  D = Dm0*(T/300 K)^1.75*(1 Pa/max(p, 1 Pa))   (Fuller-type T^1.75/p scaling)
+    constant:     D = Dm0
+
+Laws evaluate over broadcast NumPy arrays of T [K] and p [Pa], render the matching COMSOL
+expression (used by `core.build`), and are tabulated at the operating pressure by
+`mph_core.physics.PhysicsManager` as a ``D_tab(T)`` Interpolation function.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import numpy as np
+
+from .errors import ConfigError
+
+TORR = 101325.0 / 760.0  # Pa
+DM0_DEFAULT = 1.0e-3  # core.build fallback when environment.Dm0 is unset
+
+
+@dataclass(frozen=True)
+class DiffusivityLaw:
+    """D = D0*(T/T0)^T_exp*(p0/max(p, p_min))^p_exp [m^2/s]."""
+    name: str
+    D0: float
+    T0: float = 300.0
+    T_exp: float = 1.75
+    p0: float = 1.0
+    p_exp: float = 1.0
+    p_min: float = 1.0
+
+    def __call__(self, T, p=None) -> np.ndarray:
+        T = np.asarray(T, dtype=float)
+        D = self.D0 * (T / self.T0) ** self.T_exp
+        if self.p_exp:
+            if p is None:
+                raise ConfigError(f"Diffusivity law '{self.name}' needs the gas pressure",
+                                  suggested_fix="Set environment.p_amb or environment.pressure_torr")
+            D = D * (self.p0 / np.maximum(np.asarray(p, dtype=float), self.p_min)) ** self.p_exp
+        return D
+
+    def comsol_expression(self, T: str = "T", p: str = "p_amb") -> str:
+        """The same law as a COMSOL expression in the variables ``T`` and ``p``."""
+        expr = f"{self.D0:.10g}[m^2/s]"
+        if self.T_exp:
+            expr += f"*({T}/{self.T0:g}[K])^{self.T_exp:g}"
+        if self.p_exp:
+            ratio = f"{self.p0:g}[Pa]/max({p},{self.p_min:g}[Pa])"
+            expr += f"*({ratio})" if self.p_exp == 1 else f"*({ratio})^{self.p_exp:g}"
+        return expr
+
+
+def _t175_over_p(D0: float) -> DiffusivityLaw:
+    return DiffusivityLaw("t175_over_p", D0)
+
+
+def _constant(D0: float) -> DiffusivityLaw:
+    return DiffusivityLaw("constant", D0, T_exp=0.0, p_exp=0.0)
+
+
+LAWS = {"t175_over_p": _t175_over_p, "constant": _constant}
+
+
+def get_law(name: str, D0: Optional[float] = None) -> DiffusivityLaw:
+    """Law ``name`` with prefactor ``D0`` (default `DM0_DEFAULT`)."""
+    key = str(name).lower()
+    if key not in LAWS:
+        raise ConfigError(f"Unknown diffusivity law '{name}'",
+                          suggested_fix=f"Use one of {sorted(LAWS)}")
+    return LAWS[key](float(D0) if D0 is not None else DM0_DEFAULT)
+
+
+def law_from_config(cfg) -> Optional[DiffusivityLaw]:
+    """The configured law, or None when ``environment.diffusivity_law`` is unset."""
+    env = cfg.environment
+    if not env.diffusivity_law:
+        return None
+    return get_law(env.diffusivity_law, env.Dm0)
+
+
+def operating_pressure(env) -> Optional[float]:
+    """Gas pressure [Pa]: ``p_amb``, else ``pressure_torr`` converted, else None."""
+    if env.p_amb is not None:
+        return float(env.p_amb)
+    if env.pressure_torr is not None:
+        return float(env.pressure_torr) * TORR
+    return None
+
+
+def diffusion_time(L, T, p, law: DiffusivityLaw) -> np.ndarray:
+    """Diffusion time L^2/D(T, p) [s] over a length L [m]."""
+    return np.asarray(L, dtype=float) ** 2 / law(T, p)
+
+
+def pressure_table(law: DiffusivityLaw, T, pressures_torr) -> Dict[float, np.ndarray]:
+    """D(T) [m^2/s] at each pressure in Torr (keys), e.g. for H2 operating points."""
+    return {float(pt): law(T, float(pt) * TORR) for pt in np.atleast_1d(pressures_torr)}
+
+
+__all__ = [
+    "TORR",
+    "DM0_DEFAULT",
+    "DiffusivityLaw",
+    "LAWS",
+    "get_law",
+    "law_from_config",
+    "operating_pressure",
+    "diffusion_time",
+    "pressure_table",
+]
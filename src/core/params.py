@@ -42,6 +42,13 @@ class MaterialsConfig:
     sigma0: float
     dSigma_dT: float
     T_ref: float
+    # Optional T dependence (core.properties): Andrade mu = mu_A*exp(mu_B/T) >= mu_floor,
+    # linear cp/k slopes about T_ref. None keeps the constant values / literature defaults.
+    mu_A: Optional[float] = None
+    mu_B: Optional[float] = None
+    mu_floor: Optional[float] = None
+    dcp_dT: Optional[float] = None
+    dk_dT: Optional[float] = None
 
 
 @dataclass
@@ -50,7 +57,7 @@ class EnvironmentConfig:
     pressure_torr: Optional[float] = None
     p_amb: Optional[float] = None
     T_amb: Optional[float] = 300.0
-    diffusivity_law: Optional[str] = None  # None|t175_over_p
+    diffusivity_law: Optional[str] = None  # None|t175_over_p|constant (core.diffusivity)
     Dm0: Optional[float] = None  # base diffusivity [m^2/s]
 
 
@@ -74,6 +81,9 @@ class AbsorptionConfig:
     lambda_um: Optional[float] = None
     use_precomputed: Optional[bool] = None
     autogenerate_if_missing: Optional[bool] = None
+    angle_resolved: Optional[bool] = None  # use precomputed A(λ, θ) instead of constant A_PP
+    polarization: Optional[str] = None  # s|p|unpolarized (with angle_resolved)
+    n_medium: Optional[float] = None  # ambient refractive index for the Sizyuk tables (default 1)
 
 
 @dataclass
@@ -120,6 +130,20 @@ class UnifiedConfig:
     raw: Dict[str, Any] = field(default_factory=dict)
 
 
+# Allowed ranges of numeric inputs, checked by `validate_schema` when the key is set; also the
+# default bounds of space-filling sweep designs (core.solvers.designs).
+PARAM_RANGES: Dict[str, Tuple[float, float]] = {
+    "geometry.R": (1e-9, 1.0),
+    "geometry.Lx": (1e-9, 1.0),
+    "geometry.Ly": (1e-9, 1.0),
+    "laser.A_PP": (0.0, 1.0),
+    "laser.w0": (1e-9, 1.0),
+    "laser.E_PP_total": (0.0, 1.0),
+    "evaporation.beta_r": (0.0, 1.0),
+    "evaporation.HK_gamma": (0.0, 1.0),
+}
+
+
 def _require_range(name: str, val: float, lo: float, hi: float, closed: bool = True):
     if closed:
         ok = (lo <= val <= hi)
@@ -143,21 +167,28 @@ def validate_schema(cfg: Dict[str, Any]) -> None:
     for k in ("R", "Lx", "Ly"):
         if not isinstance(geom.get(k), (int, float)):
             raise TypeError(f"geometry.{k} must be a number (meters)")
-        _require_range(f"geometry.{k}", geom[k], 1e-9, 1.0)
 
     las = cfg["laser"]
-    _require_range("laser.A_PP", las["A_PP"], 0.0, 1.0)
+    for dotted, (lo, hi) in PARAM_RANGES.items():
+        root, leaf = dotted.split(".")
+        val = (cfg.get(root) or {}).get(leaf)
+        if val is not None:
+            _require_range(dotted, float(val), lo, hi)
     if las.get("laser_theta_deg") is not None:
         _require_range("laser.laser_theta_deg", float(las["laser_theta_deg"]), 0.0, 360.0, closed=False)
     if las.get("illum_mode") not in ("cos_inc", "nx_shadow"):
         raise ValueError("laser.illum_mode must be one of {'cos_inc','nx_shadow'}")
 
     evap = cfg["evaporation"]
-    if evap.get("beta_r") is not None:
-        _require_range("evaporation.beta_r", float(evap["beta_r"]), 0.0, 1.0)
     if evap.get("clamp_nonneg") is not None and not isinstance(evap.get("clamp_nonneg"), bool):
         raise TypeError("evaporation.clamp_nonneg must be boolean if provided")
 
+    env = cfg.get("environment", {})
+    if env.get("diffusivity_law") is not None:
+        from .diffusivity import LAWS
+        if str(env["diffusivity_law"]).lower() not in LAWS:
+            raise ValueError(f"environment.diffusivity_law must be one of {sorted(LAWS)}")
+
     # Units sanity for a few key fields (if provided as strings)
     hints: List[Tuple[str, str]] = [
         ("materials.M_Sn", "kg/mol"),
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+# Andrade fit for liquid tin, Assael et al., J. Phys. Chem. Ref. Data 39, 033105 (2010):
+# log10(mu/mPa s) = -0.408 + 343.4/T  ->  mu = 3.908e-4 Pa s * exp(790.7 K / T)
+ANDRADE_SN = (3.908e-4, 790.7)
+MU_FLOOR = 3e-4  # Pa s, KUMAR-2D mu_floor (keeps Navier-Stokes stable)
+
+
+@dataclass(frozen=True)
+class PropertyLaw:
+    """Temperature law of one property, evaluated over NumPy arrays of T [K].
+
+    kind="linear":  a + b*(T - T_ref)                      (sigma0 + dSigma_dT*(T - T_ref))
+    kind="andrade": a*exp(b/T)                             (viscosity; b in K)
+    kind="table":   linear interpolation in (T_table, v_table), clamped at the ends
+    The result is clipped to [lo, hi] where given.
+    """
+    name: str
+    unit: str
+    kind: str = "linear"
+    a: float = 0.0
+    b: float = 0.0
+    T_ref: float = 0.0
+    lo: Optional[float] = None
+    hi: Optional[float] = None
+    T_table: Tuple[float, ...] = ()
+    v_table: Tuple[float, ...] = ()
+
+    def __post_init__(self):
+        if self.kind not in ("linear", "andrade", "table"):
+            raise ValueError(f"Unknown property law kind '{self.kind}'")
+        if self.kind == "table" and (len(self.T_table) < 2 or len(self.T_table) != len(self.v_table)):
+            raise ValueError(f"{self.name}: table laws need matching T/value tables of length >= 2")
+
+    def __call__(self, T) -> np.ndarray:
+        T = np.asarray(T, dtype=float)
+        if self.kind == "linear":
+            v = self.a + self.b * (T - self.T_ref)
+        elif self.kind == "andrade":
+            v = self.a * np.exp(self.b / T)
+        else:
+            v = np.interp(T, self.T_table, self.v_table)
+        if self.lo is not None or self.hi is not None:
+            v = np.clip(v, self.lo, self.hi)
+        return v
+
+    @classmethod
+    def constant(cls, name: str, value: float, unit: str) -> "PropertyLaw":
+        return cls(name, unit, a=float(value))
+
+
+@dataclass(frozen=True)
+class TinProperties:
+    """One source of liquid-tin properties for the Python solvers and the COMSOL tables."""
+    rho: PropertyLaw
+    cp: PropertyLaw
+    k: PropertyLaw
+    mu: PropertyLaw
+    sigma: PropertyLaw
+
+    def laws(self) -> Dict[str, PropertyLaw]:
+        return {"rho": self.rho, "cp": self.cp, "k": self.k, "mu": self.mu, "sigma": self.sigma}
+
+    def evaluate(self, T) -> Dict[str, np.ndarray]:
+        """All properties at ``T`` (any shape)."""
+        return {name: law(T) for name, law in self.laws().items()}
+
+    @classmethod
+    def from_values(cls, rho: float = 6980.0, cp: float = 237.0, k: float = 31.0, T_ref: float = 505.0,
+                    sigma0: float = 0.55, dSigma_dT: float = -3e-4, dcp_dT: float = 0.0, dk_dT: float = 0.0,
+                    mu_A: float = ANDRADE_SN[0], mu_B: float = ANDRADE_SN[1],
+                    mu_floor: Optional[float] = MU_FLOOR) -> "TinProperties":
+        """Linear cp/k/sigma about ``T_ref`` and an Andrade viscosity with a lower floor."""
+        if mu_A <= 0.0:
+            raise ValueError("Andrade prefactor mu_A must be positive")
+        mu = PropertyLaw("mu", "Pa*s", "andrade", a=mu_A, b=mu_B, lo=mu_floor)
+        mu_melt = float(mu(T_ref))
+        if not 1e-4 <= mu_melt <= 1e-1:
+            warnings.warn(f"Andrade viscosity mu({T_ref:g} K) = {mu_melt:.3g} Pa*s is implausible for liquid "
+                          f"tin (~1.9e-3 Pa*s); check mu_A/mu_B")
+        return cls(rho=PropertyLaw.constant("rho", rho, "kg/m^3"),
+                   cp=PropertyLaw("cp", "J/(kg*K)", a=cp, b=dcp_dT, T_ref=T_ref),
+                   k=PropertyLaw("k", "W/(m*K)", a=k, b=dk_dT, T_ref=T_ref),
+                   mu=mu,
+                   sigma=PropertyLaw("sigma", "N/m", a=sigma0, b=dSigma_dT, T_ref=T_ref))
+
+    @classmethod
+    def from_config(cls, cfg) -> "TinProperties":
+        """From ``UnifiedConfig.materials`` (optional mu_A/mu_B/mu_floor, dk_dT, dcp_dT)."""
+        m = cfg.materials
+        opt = lambda name, default: float(getattr(m, name)) if getattr(m, name, None) is not None else default
+        return cls.from_values(rho=float(m.rho_Sn), cp=float(m.cp_Sn), k=float(m.k_Sn), T_ref=float(m.T_ref),
+                               sigma0=float(m.sigma0), dSigma_dT=float(m.dSigma_dT),
+                               dcp_dT=opt("dcp_dT", 0.0), dk_dT=opt("dk_dT", 0.0),
+                               mu_A=opt("mu_A", ANDRADE_SN[0]), mu_B=opt("mu_B", ANDRADE_SN[1]),
+                               mu_floor=opt("mu_floor", MU_FLOOR))
+
+    @classmethod
+    def from_params(cls, params: Mapping[str, Union[str, float]]) -> "TinProperties":
+        """From a COMSOL parameter table (ModelBuilder names: rho_sn, Cp_sn, k_sn, mu_A, ...).
+
+        Values may carry units or refer to other parameters; missing entries use the
+        `from_values` defaults.
+        """
+        from .pulse import resolve_parameters
+
+        keys = {"rho": "rho_sn", "cp": "Cp_sn", "k": "k_sn", "T_ref": "T_ref", "sigma0": "sigma0",
+                "dSigma_dT": "dSigma_dT", "dcp_dT": "dCp_dT", "dk_dT": "dk_dT", "mu_A": "mu_A",
+                "mu_B": "mu_B", "mu_floor": "mu_floor"}
+        present = [p for p in keys.values() if p in params]
+        resolved = resolve_parameters(params, present)
+        return cls.from_values(**{arg: resolved[p] for arg, p in keys.items() if p in resolved})
+
+
+def load_andrade_parameters(path: Union[str, Path]) -> Dict[str, float]:
+    """mu_A, mu_B and mu_floor (SI) from a COMSOL parameter file such as
+    ``KUMAR-2D/Andrade_parameters_for_Sn.txt`` (``name value[unit] "description"`` rows)."""
+    from .pulse import resolve_parameters
+
+    params: Dict[str, str] = {}
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        parts = line.split(None, 2)
+        if len(parts) >= 2 and not parts[0].startswith(("#", "%")):
+            params[parts[0]] = parts[1]
+    names = [n for n in ("mu_A", "mu_B", "mu_floor") if n in params]
+    return resolve_parameters(params, names)
+
+
+def tin_properties(cfg=None, params: Optional[Mapping[str, Union[str, float]]] = None) -> TinProperties:
+    """`TinProperties` from a config, else a COMSOL parameter table, else the defaults."""
+    if cfg is not None:
+        return TinProperties.from_config(cfg)
+    if params is not None:
+        return TinProperties.from_params(params)
+    return TinProperties.from_values()
+
+
+def kinematic_viscosity(T, props: Optional[TinProperties] = None) -> np.ndarray:
+    """mu(T)/rho(T) [m^2/s]."""
+    props = props or TinProperties.from_values()
+    return props.mu(T) / props.rho(T)
+
+
+def capillary_time(R: float, T, props: Optional[TinProperties] = None) -> np.ndarray:
+    """Capillary time sqrt(rho*R^3/sigma(T)) [s] of a droplet of radius R."""
+    props = props or TinProperties.from_values()
+    return np.sqrt(props.rho(T) * R ** 3 / props.sigma(T))
+
+
+__all__ = [
+    "ANDRADE_SN",
+    "MU_FLOOR",
+    "PropertyLaw",
+    "TinProperties",
+    "load_andrade_parameters",
+    "tin_properties",
+    "kinematic_viscosity",
+    "capillary_time",
+]
@@ -0,0 +1,398 @@
+"""
+Compile COMSOL-style pulse expressions (e.g. ``data/Ppp_analytic_expression.txt``) into
+vectorized NumPy callables P(t).
+
+The expression and its parameters (``laser_parameters_pp_v2.txt``) are parsed exactly as
+COMSOL sees them: ``^`` powers, ``[unit]`` suffixes scaled to SI, parameters that refer to
+other parameters, and the smoothed step functions ``flc1hs``/``flc2hs``. Each smoothed step
+whose argument is affine in t becomes a pulse *event*; between event edges the pulse is a
+low-order polynomial, so energies are integrated piece by piece with Gauss–Legendre and
+time grids are refined only where the pulse actually changes.
+
+Public API:
+- `flc2hs(x, scale)`, `flc1hs(x, scale)` — COMSOL smoothed Heavisides (C2 quintic / C1 cubic).
+- `unit_scale(unit)` — SI factor of a COMSOL unit string such as ``mJ`` or ``J/(kg*K)``.
+- `compile_pulse(expr, params)` → `CompiledPulse` with ``__call__``, ``events``,
+  ``breakpoints``, ``support``, ``energy``, ``piecewise_energy`` and ``time_grid``.
+- `load_pulse(expr_path, params_path)` — read the legacy TXT files and compile.
+- `config_pulse_expression(laser)` — the square/ramp_square ``Ppp`` used by `core.build`.
+- `compile_expression(expr, params, variable)` — other one-variable expressions (``p_sat_expr``).
+- `step_energies(pulse, t)` — energy per time step, for step-averaged implicit solvers.
+"""
+
+from __future__ import annotations
+
+import ast
+import math
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .errors import ConfigError
+
+
+def flc2hs(x, scale):
+    """COMSOL ``flc2hs``: smoothed Heaviside with continuous second derivative.
+
+    Zero for x ≤ −scale, one for x ≥ scale, and the quintic
+    1/2 + 15/16 u − 5/8 u^3 + 3/16 u^5 (u = x/scale) in between (no overshoot).
+    """
+    x = np.asarray(x, dtype=float)
+    u = np.clip(x / scale, -1.0, 1.0)
+    u2 = u * u
+    return 0.5 + u * (0.9375 + u2 * (-0.625 + 0.1875 * u2))
+
+
+def flc1hs(x, scale):
+    """COMSOL ``flc1hs``: smoothed Heaviside with continuous first derivative (cubic)."""
+    x = np.asarray(x, dtype=float)
+    u = np.clip(x / scale, -1.0, 1.0)
+    return 0.5 + u * (0.75 - 0.25 * u * u)
+
+
+_PREFIX = {"f": 1e-15, "p": 1e-12, "n": 1e-9, "u": 1e-6, "µ": 1e-6, "m": 1e-3,
+           "c": 1e-2, "k": 1e3, "M": 1e6, "G": 1e9}
+_BASE_UNITS = {"m": 1.0, "s": 1.0, "g": 1e-3, "J": 1.0, "W": 1.0, "K": 1.0, "Pa": 1.0,
+               "N": 1.0, "mol": 1.0, "A": 1.0, "V": 1.0, "Hz": 1.0, "rad": 1.0,
+               "deg": math.pi / 180.0, "1": 1.0, "torr": 101325.0 / 760.0, "atm": 101325.0,
+               "bar": 1e5, "L": 1e-3, "min": 60.0, "h": 3600.0}
+_UNIT_TOKEN = re.compile(r"[A-Za-zµ]+")
+
+
+def _unit_factor(token: str) -> float:
+    if token in _BASE_UNITS:
+        return _BASE_UNITS[token]
+    if len(token) > 1 and token[0] in _PREFIX and token[1:] in _BASE_UNITS:
+        return _PREFIX[token[0]] * _BASE_UNITS[token[1:]]
+    raise ConfigError(f"Unknown unit '{token}'", suggested_fix="Use SI base units with standard prefixes")
+
+
+def unit_scale(unit: str) -> float:
+    """SI scale factor of a COMSOL unit string, e.g. ``um`` → 1e-6, ``mJ`` → 1e-3, ``J/(kg*K)`` → 1."""
+    expr = _UNIT_TOKEN.sub(lambda m: repr(_unit_factor(m.group(0))), unit.strip()).replace("^", "**")
+    try:
+        return float(eval(expr, {"__builtins__": {}}, {}))
+    except Exception as e:  # malformed unit expression
+        raise ConfigError(f"Cannot parse unit '[{unit}]'") from e
+
+
+_OPERAND_LEFT = re.compile(r"(?:\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?|[A-Za-z_]\w*)\s*$")
+
+
+def _to_python(expr: str) -> str:
+    """COMSOL expression syntax → Python syntax (units scaled, ``^`` → ``**``).
+
+    A unit binds to the operand right before it, so ``x/1[ns]`` becomes ``x/(1*1e-09)``.
+    """
+    s = expr.strip()
+    while True:
+        m = re.search(r"\[([^\]]+)\]", s)
+        if not m:
+            break
+        left, right = s[:m.start()].rstrip(), s[m.end():]
+        if left.endswith(")"):
+            depth, i = 0, len(left) - 1
+            for i in range(len(left) - 1, -1, -1):
+                depth += {")": 1, "(": -1}.get(left[i], 0)
+                if depth == 0:
+                    break
+            j = i
+            k = _OPERAND_LEFT.search(left[:j])  # function call such as sqrt(...)[m]
+            if k and not k.group(0)[0].isdigit():
+                j = k.start()
+        else:
+            k = _OPERAND_LEFT.search(left)
+            if not k:
+                raise ConfigError(f"Unit [{m.group(1)}] has no operand in '{expr}'")
+            j = k.start()
+        s = f"{left[:j]}({left[j:]}*{unit_scale(m.group(1))!r}){right}"
+    return s.replace("^", "**").replace("&&", "&").replace("||", "|")
+
+
+def _np_if(cond, a, b):
+    return np.where(cond, a, b)
+
+
+_FUNCTIONS: Dict[str, Callable] = {
+    "flc2hs": flc2hs, "flc1hs": flc1hs,
+    "exp": np.exp, "log": np.log, "log10": np.log10, "sqrt": np.sqrt, "abs": np.abs,
+    "sin": np.sin, "cos": np.cos, "tan": np.tan, "asin": np.arcsin, "acos": np.arccos,
+    "atan": np.arctan, "atan2": np.arctan2, "sinh": np.sinh, "cosh": np.cosh, "tanh": np.tanh,
+    "min": np.minimum, "max": np.maximum, "sign": np.sign, "if": _np_if,
+}
+_CONSTANTS = {"pi": math.pi, "e_const": math.e}
+_STEP_FUNCTIONS = ("flc2hs", "flc1hs")
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load, ast.Constant,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.USub, ast.UAdd, ast.Mod,
+    ast.Compare, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.Eq, ast.NotEq, ast.BitAnd, ast.BitOr,
+)
+
+
+def _parse(expr: str) -> ast.Expression:
+    src = _to_python(expr)
+    # `if` is a keyword in Python; rename COMSOL's if(cond,a,b) before parsing
+    src = re.sub(r"\bif\s*\(", "_if(", src)
+    try:
+        tree = ast.parse(src, mode="eval")
+    except SyntaxError as e:
+        raise ConfigError(f"Cannot parse expression '{expr}'") from e
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ConfigError(f"Unsupported syntax {type(node).__name__} in '{expr}'")
+        if isinstance(node, ast.Call) and not (isinstance(node.func, ast.Name)
+                                               and (node.func.id in _FUNCTIONS or node.func.id == "_if")):
+            raise ConfigError(f"Unsupported function in '{expr}'")
+    return tree
+
+
+def _names(tree: ast.AST) -> List[str]:
+    funcs = {n.func.id for n in ast.walk(tree) if isinstance(n, ast.Call)}
+    return sorted({n.id for n in ast.walk(tree) if isinstance(n, ast.Name)} - funcs)
+
+
+def _namespace() -> Dict[str, object]:
+    ns: Dict[str, object] = dict(_FUNCTIONS)
+    ns["_if"] = _np_if
+    ns.update(_CONSTANTS)
+    return ns
+
+
+def resolve_parameters(params: Mapping[str, Union[str, float]], names: Sequence[str],
+                       free: Sequence[str] = ("t",)) -> Dict[str, float]:
+    """Evaluate the parameters ``names`` depend on (recursively) to SI floats.
+
+    Values may be numbers or COMSOL expressions referencing other parameters. Only the
+    dependency closure of ``names`` is evaluated, so unrelated entries (``illum_mode``,
+    ``p_sat_expr`` in T, ...) never need to be parseable.
+    """
+    resolved: Dict[str, float] = {}
+    active: List[str] = []
+
+    def value(name: str) -> float:
+        if name in resolved:
+            return resolved[name]
+        if name in _CONSTANTS:
+            return _CONSTANTS[name]
+        if name not in params:
+            raise ConfigError(f"Undefined parameter '{name}'",
+                              suggested_fix="Add it to the laser/global parameter file")
+        if name in active:
+            raise ConfigError(f"Circular parameter definition: {' -> '.join(active + [name])}")
+        raw = params[name]
+        if isinstance(raw, (int, float)):
+            resolved[name] = float(raw)
+            return resolved[name]
+        active.append(name)
+        tree = _parse(str(raw))
+        ns = _namespace()
+        for dep in _names(tree):
+            ns[dep] = value(dep)
+        active.pop()
+        resolved[name] = float(eval(compile(tree, f"<param {name}>", "eval"), {"__builtins__": {}}, ns))
+        return resolved[name]
+
+    for n in names:
+        if n not in free:
+            value(n)
+    return resolved
+
+
+@dataclass(frozen=True)
+class PulseEvent:
+    """A smoothed step located at ``t`` with transition half-width ``half_width`` [s]."""
+    t: float
+    half_width: float
+    kind: str = "flc2hs"
+
+
+def _gauss_legendre_piece(f: Callable, a: np.ndarray, b: np.ndarray, order: int) -> np.ndarray:
+    x, w = np.polynomial.legendre.leggauss(order)
+    mid, half = 0.5 * (a + b), 0.5 * (b - a)
+    nodes = mid[:, None] + half[:, None] * x[None, :]
+    vals = np.asarray(f(nodes.ravel()), dtype=float).reshape(nodes.shape)
+    return half * (vals @ w)
+
+
+@dataclass
+class CompiledPulse:
+    """Vectorized P(t) [W] compiled from a COMSOL expression.
+
+    ``events`` are the smoothed steps found in the expression; ``breakpoints`` are their
+    edges (t ± half_width) and centres, between which the pulse is smooth (polynomial for the
+    legacy ramp + square), so piecewise Gauss–Legendre integration is exact to round-off.
+    """
+    expression: str
+    params: Dict[str, float]
+    events: List[PulseEvent]
+    _fn: Callable = field(repr=False)
+
+    def __call__(self, t):
+        t = np.asarray(t, dtype=float)
+        return np.broadcast_to(self._fn(t), t.shape).astype(float, copy=False)
+
+    @property
+    def breakpoints(self) -> np.ndarray:
+        pts = [p for e in self.events for p in (e.t - e.half_width, e.t, e.t + e.half_width)]
+        return np.unique(np.asarray(pts, dtype=float))
+
+    @property
+    def support(self) -> Tuple[float, float]:
+        """Interval outside which every smoothed step has settled (pulse constant, usually 0)."""
+        bp = self.breakpoints
+        if bp.size == 0:
+            raise ConfigError("Pulse has no smoothed-step events; pass an explicit time span")
+        return float(bp[0]), float(bp[-1])
+
+    def _pieces(self, t0: float, t1: float) -> np.ndarray:
+        bp = self.breakpoints
+        return np.unique(np.concatenate([[t0, t1], bp[(bp > t0) & (bp < t1)]]))
+
+    def piecewise_energy(self, t0: Optional[float] = None, t1: Optional[float] = None,
+                         order: int = 8) -> Tuple[np.ndarray, np.ndarray]:
+        """Breakpoint array and ∫P dt over each piece between consecutive breakpoints [J]."""
+        s0, s1 = self.support if (t0 is None or t1 is None) else (t0, t1)
+        t0 = s0 if t0 is None else float(t0)
+        t1 = s1 if t1 is None else float(t1)
+        edges = self._pieces(t0, t1)
+        E = _gauss_legendre_piece(self, edges[:-1], edges[1:], order)
+        return edges, E
+
+    def energy(self, t0: Optional[float] = None, t1: Optional[float] = None,
+               rtol: float = 1e-12, max_splits: int = 30) -> float:
+        """∫P dt over [t0, t1] (defaults to `support`) [J].
+
+        Pieces are integrated with 8-point Gauss–Legendre (exact up to degree 15); pieces
+        whose 8- and 16-point results disagree beyond ``rtol`` (non-polynomial expressions)
+        are bisected until they agree.
+        """
+        edges, _ = self.piecewise_energy(t0, t1)
+        a, b = edges[:-1], edges[1:]
+        total = 0.0
+        for _ in range(max_splits):
+            lo = _gauss_legendre_piece(self, a, b, 8)
+            hi = _gauss_legendre_piece(self, a, b, 16)
+            ok = np.abs(hi - lo) <= rtol * np.maximum(np.abs(hi), 1e-300) + 1e-300
+            total += float(np.sum(hi[ok]))
+            if ok.all():
+                return total
+            a, b = a[~ok], b[~ok]
+            m = 0.5 * (a + b)
+            a, b = np.concatenate([a, m]), np.concatenate([m, b])
+        return total + float(np.sum(_gauss_legendre_piece(self, a, b, 16)))
+
+    def time_grid(self, t0: Optional[float] = None, t1: Optional[float] = None,
+                  n_edge: int = 16, max_dt: Optional[float] = None) -> np.ndarray:
+        """Event-aware time grid: ``n_edge`` intervals across every smoothed step, and
+        intervals no longer than ``max_dt`` (default span/100) elsewhere. All breakpoints
+        are grid nodes, so trapezoid integrals converge without uniform oversampling.
+        """
+        s0, s1 = self.support if (t0 is None or t1 is None) else (t0, t1)
+        t0 = s0 if t0 is None else float(t0)
+        t1 = s1 if t1 is None else float(t1)
+        max_dt = (t1 - t0) / 100.0 if max_dt is None else float(max_dt)
+        edge_windows = [(e.t - e.half_width, e.t + e.half_width) for e in self.events]
+        edges = self._pieces(t0, t1)
+        out = [edges[:1]]
+        for a, b in zip(edges[:-1], edges[1:]):
+            mid = 0.5 * (a + b)
+            in_edge = any(lo <= mid <= hi for lo, hi in edge_windows)
+            n = max(1, int(math.ceil(n_edge / 2)) if in_edge else int(math.ceil((b - a) / max_dt)))
+            out.append(np.linspace(a, b, n + 1)[1:])
+        return np.concatenate(out)
+
+
+def step_energies(pulse: Callable, t: Sequence[float]) -> np.ndarray:
+    """Energy ``pulse`` delivers in each interval of the time grid ``t``.
+
+    Integrates by trapezoid on the union of ``t`` and an event-aware grid (``time_grid``
+    for a `CompiledPulse`, else 4 uniform sub-intervals per step), so implicit solvers can
+    apply the step-averaged power and still deposit the pulse energy exactly.
+    """
+    t = np.asarray(t, dtype=float)
+    n_sub = 4 * (t.size - 1)
+    if hasattr(pulse, "time_grid"):
+        fine = np.union1d(pulse.time_grid(t[0], t[-1], max_dt=(t[-1] - t[0]) / n_sub), t)
+    else:
+        fine = np.union1d(np.linspace(t[0], t[-1], n_sub + 1), t)
+    P = np.broadcast_to(np.asarray(pulse(fine), dtype=float), fine.shape)
+    cum = np.concatenate([[0.0], np.cumsum(0.5 * (P[1:] + P[:-1]) * np.diff(fine))])
+    return np.diff(np.interp(t, fine, cum))
+
+
+def _find_events(tree: ast.Expression, ns: Dict[str, object]) -> List[PulseEvent]:
+    """Locate smoothed steps whose argument is affine in t; others are ignored."""
+    events: List[PulseEvent] = []
+    probe = np.array([0.0, 1.0, 2.0])
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+                and node.func.id in _STEP_FUNCTIONS and len(node.args) == 2):
+            continue
+        arg = eval(compile(ast.Expression(node.args[0]), "<arg>", "eval"), {"__builtins__": {}}, {**ns, "t": probe})
+        scale = eval(compile(ast.Expression(node.args[1]), "<scale>", "eval"), {"__builtins__": {}}, ns)
+        arg = np.broadcast_to(np.asarray(arg, dtype=float), probe.shape)
+        slope = arg[1] - arg[0]
+        if slope == 0.0 or not math.isclose(arg[2] - arg[1], slope, rel_tol=1e-9):
+            continue
+        events.append(PulseEvent(t=float(-arg[0] / slope) + 0.0, half_width=float(abs(scale / slope)), kind=node.func.id))
+    events.sort(key=lambda e: e.t)
+    return events
+
+
+def _compile(expr: str, params: Optional[Mapping[str, Union[str, float]]], variable: str):
+    tree = _parse(expr)
+    resolved = resolve_parameters(params or {}, _names(tree), free=(variable,))
+    ns = _namespace()
+    ns.update(resolved)
+    code = compile(tree, f"<{variable} expression>", "eval")
+
+    def fn(x):
+        return eval(code, {"__builtins__": {}}, {**ns, variable: x})
+
+    return tree, ns, resolved, fn
+
+
+def compile_expression(expr: str, params: Optional[Mapping[str, Union[str, float]]] = None,
+                       variable: str = "t") -> Callable:
+    """Compile any COMSOL expression in one free ``variable`` (e.g. ``p_sat_expr`` in T)."""
+    return _compile(expr, params, variable)[3]
+
+
+def compile_pulse(expr: str, params: Optional[Mapping[str, Union[str, float]]] = None) -> CompiledPulse:
+    """Compile a COMSOL pulse expression in ``t`` with its parameter table."""
+    tree, ns, resolved, fn = _compile(expr, params, "t")
+    return CompiledPulse(expression=expr, params=resolved, events=_find_events(tree, ns), _fn=fn)
+
+
+def config_pulse_expression(laser) -> Optional[str]:
+    """``Ppp(t)`` expression for a `LaserConfig` ``temporal_profile`` of square/ramp_square.
+
+    Returns None when the profile does not override the legacy ``Ppp_analytic_expression.txt``.
+    The expression refers to the parameter ``E_PP_total``.
+    """
+    if laser is None or not laser.temporal_profile or not laser.tau_square:
+        return None
+    eps = "1e-12[s]"; t0 = "0[s]"
+    if laser.temporal_profile == "square":
+        return f"(E_PP_total/{laser.tau_square})*(flc2hs(t-{t0},{eps})-flc2hs(t-({t0}+{laser.tau_square}),{eps}))"
+    if laser.temporal_profile in ("ramp_square", "ramp+square"):
+        tau_r = laser.tau_ramp or 0.0; tau_s = laser.tau_square
+        return (
+            f"(E_PP_total/{tau_s})*min( (t-{t0})/({tau_r}+{eps}), 1)"
+            f"*(flc2hs(t-{t0},{eps})-flc2hs(t-({t0}+{tau_r}+{tau_s}),{eps}))"
+        )
+    return None
+
+
+def load_pulse(expr_path: Union[str, Path], params_path: Union[str, Path, Sequence[Union[str, Path]]]) -> CompiledPulse:
+    """Compile the legacy ``Ppp_analytic_expression.txt`` with its parameter file(s)."""
+    from .build import read_kv_file, read_pulse_expression
+
+    paths = [params_path] if isinstance(params_path, (str, Path)) else list(params_path)
+    params: Dict[str, str] = {}
+    for p in paths:
+        params.update(read_kv_file(Path(p)))
+    return compile_pulse(read_pulse_expression(Path(expr_path)), params)
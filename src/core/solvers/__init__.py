@@ -2,5 +2,16 @@
 
 Additive namespace for solver orchestration (e.g., time stepping, study/solution
 setup). Current implementation remains in src/core/build.py.
+
+- lumped0d: COMSOL-free 0D droplet energy/mass-loss surrogate, vectorized over parameter
+  sets, writing the same pp_*_vs_time.csv tables as the COMSOL exporters.
+- radial1d: 1D spherical/cylindrical finite-volume conduction with evaporative and
+  radiative surface losses (implicit, cached operator) for screening pulse-energy sweeps.
+- planar2d: `Planar2DSolver`, a COMSOL-free `models.base.Solver` backend for the planar
+  2D droplet (sparse LU reused across steps; needs SciPy).
+- outputs: shared writer for the COMSOL-layout result tables.
+- sweep: grid sweeps, sequential or in a process pool with one COMSOL session per worker.
+- designs: seeded Sobol / Latin hypercube / Halton designs over schema parameter ranges.
+- adaptive: budgeted adaptive sampling that bisects cells near a metric threshold/steep change.
 """
 
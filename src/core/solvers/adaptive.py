@@ -0,0 +1,226 @@
+"""
+Adaptive sampling sweeps that refine near regime boundaries.
+
+Instead of a dense Cartesian grid, `adaptive_sweep` starts from a coarse grid over a box of
+continuous parameters and repeatedly bisects the cells where a chosen metric of the run
+results matters most, until a run budget is spent:
+
+- with a ``threshold`` (e.g. peak T vs T_boil, a mass-loss limit), cells whose corner values
+  straddle it (or contain a failed run) are refined first, largest first;
+- otherwise, and once no crossing cell is left, cells are ranked by metric variation across
+  the cell times cell width (where the metric changes fastest).
+
+A cell is split in two along the axis with the largest mean metric difference, so each
+split costs at most 2^(d-1) new runs; corner runs are shared between neighbouring cells and
+never repeated. Cells narrower than ``min_width`` (fraction of each axis range) are not split.
+Runs go through `sweep.iter_points`, so process pools, COMSOL sessions, failure isolation
+and journaling (crash resume) work as for grid sweeps.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..errors import ConfigError
+from .sweep import SweepFailure, default_outputs, iter_points
+
+Key = Tuple[float, ...]
+
+
+@dataclass(frozen=True)
+class Axis:
+    """One swept parameter: range [lo, hi], optionally log-spaced."""
+    name: str
+    lo: float
+    hi: float
+    log: bool = False
+
+    def value(self, u: float) -> float:
+        if self.log:
+            return float(math.exp(math.log(self.lo) + u * (math.log(self.hi) - math.log(self.lo))))
+        return float(self.lo + u * (self.hi - self.lo))
+
+
+@dataclass
+class AdaptiveResult:
+    """All runs of an adaptive sweep, in completion order."""
+    axes: List[Axis]
+    params: List[Dict[str, Any]]
+    results: List[Any]
+    values: np.ndarray  # metric per run (NaN for failed runs)
+    cells: List[Tuple[Key, Key]] = field(default_factory=list)  # final cells in unit coordinates
+    threshold: Optional[float] = None
+
+    @property
+    def n_runs(self) -> int:
+        return len(self.params)
+
+    def boundary_cells(self) -> List[Dict[str, Tuple[float, float]]]:
+        """Final cells whose corners straddle the threshold, as parameter ranges."""
+        index = {_key([p[a.name] for a in self.axes]): v for p, v in zip(self.params, self.values)}
+        out = []
+        for lo, hi in self.cells:
+            v = np.array([index[_key([a.value(u) for a, u in zip(self.axes, c)])] for c in _corners(lo, hi)])
+            if _crosses(v, self.threshold):
+                out.append({a.name: (a.value(l), a.value(h)) for a, l, h in zip(self.axes, lo, hi)})
+        return out
+
+
+def _key(values: Sequence[float]) -> Key:
+    return tuple(float(f"{v:.12g}") for v in values)
+
+
+def _corners(lo: Key, hi: Key) -> List[Key]:
+    return [tuple(c) for c in itertools.product(*zip(lo, hi))]
+
+
+def _crosses(v: np.ndarray, threshold: Optional[float]) -> bool:
+    if threshold is None:
+        return False
+    if np.isnan(v).any():
+        return True
+    return bool(v.min() < threshold <= v.max())
+
+
+def _metric_value(metric: Union[str, Callable[[Any], float]], result: Any) -> float:
+    if isinstance(result, SweepFailure):
+        return math.nan
+    try:
+        x = float(metric(result) if callable(metric) else result[metric])
+    except (KeyError, IndexError, TypeError, ValueError):
+        return math.nan
+    return x if math.isfinite(x) else math.nan
+
+
+def adaptive_sweep(bounds: Mapping[str, Tuple[float, float]], worker: Callable[..., Any],
+                   metric: Union[str, Callable[[Any], float]], budget: int,
+                   threshold: Optional[float] = None, initial: int = 3, log_axes: Sequence[str] = (),
+                   fixed: Optional[Mapping[str, Any]] = None, min_width: float = 1.0 / 64.0,
+                   batch: Optional[int] = None, max_parallel: int = 1,
+                   journal: Optional[Union[str, Path]] = None,
+                   outputs: Callable[[Any], Mapping[str, Any]] = default_outputs,
+                   **pool_kwargs) -> AdaptiveResult:
+    """Refine a coarse ``initial``-per-axis grid over ``bounds`` until ``budget`` runs are used.
+
+    ``metric`` is a result key or a callable ``result -> float``; ``fixed`` parameters are
+    added to every run's params. ``batch`` new runs (default ``max_parallel``) are chosen
+    per refinement round, so pools stay busy. Further keyword arguments (``session``,
+    ``crash_retries``, ...) go to `sweep.iter_points`. Failed runs never raise: they are
+    kept as `SweepFailure` results with a NaN metric, and cells touching them count as
+    crossing the threshold.
+    """
+    unknown = set(log_axes) - set(bounds)
+    if unknown:
+        raise ConfigError(f"log_axes {sorted(unknown)} are not among the swept parameters")
+    axes = [Axis(name, float(lo), float(hi), name in set(log_axes)) for name, (lo, hi) in bounds.items()]
+    for a in axes:
+        if not a.hi > a.lo or (a.log and a.lo <= 0.0):
+            raise ConfigError(f"Invalid range for '{a.name}': [{a.lo}, {a.hi}]")
+    d = len(axes)
+    if initial < 2 or initial ** d > budget:
+        raise ConfigError(f"Budget {budget} cannot cover the initial {initial}^{d} design",
+                          suggested_fix="Raise budget or lower initial (>= 2)")
+    fixed = dict(fixed or {})
+    batch = max(1, int(batch or (max_parallel if max_parallel and max_parallel > 1 else 1)))
+
+    values: Dict[Key, float] = {}
+    params: List[Dict[str, Any]] = []
+    results: List[Any] = []
+    vals: List[float] = []
+
+    def run(unit_points: List[Key]) -> None:
+        cfgs = []
+        for u in unit_points:
+            cfg = dict(fixed)
+            cfg.update({a.name: a.value(x) for a, x in zip(axes, u)})
+            cfgs.append(cfg)
+        for cfg, res in iter_points(cfgs, worker, max_parallel=max_parallel, journal=journal, outputs=outputs,
+                                    isolate=True, **pool_kwargs):
+            v = _metric_value(metric, res)
+            values[_key([cfg[a.name] for a in axes])] = v
+            params.append(cfg)
+            results.append(res)
+            vals.append(v)
+
+    def unit_key(u: Key) -> Key:
+        return _key([a.value(x) for a, x in zip(axes, u)])
+
+    ticks = [i / (initial - 1) for i in range(initial)]
+    run([tuple(u) for u in itertools.product(*[ticks] * d)])
+
+    cells = [(tuple(lo), tuple(lo[k] + 1.0 / (initial - 1) for k in range(d)))
+             for lo in itertools.product(*[ticks[:-1]] * d)]
+    counter = itertools.count()
+
+    def score(cell: Tuple[Key, Key]) -> Tuple[float, float]:
+        """(priority class, magnitude); larger is refined first, -inf means never."""
+        lo, hi = cell
+        v = np.array([values[unit_key(c)] for c in _corners(lo, hi)])
+        widths = np.subtract(hi, lo)
+        if widths.max() <= min_width + 1e-12:
+            return (-math.inf, 0.0)
+        if _crosses(v, threshold):
+            return (1.0, float(widths.max()))
+        finite = v[np.isfinite(v)]
+        span = np.nanmax(vals) - np.nanmin(vals) if np.isfinite(vals).any() else 0.0
+        variation = float(finite.max() - finite.min()) / span if finite.size > 1 and span > 0 else 0.0
+        return (0.0, variation * float(widths.max()))
+
+    heap = []
+    for cell in cells:
+        s = score(cell)
+        heapq.heappush(heap, ((-s[0], -s[1]), next(counter), cell))
+
+    def split(cell: Tuple[Key, Key]) -> Tuple[Tuple[Key, Key], Tuple[Key, Key]]:
+        lo, hi = cell
+        corners = _corners(lo, hi)
+        v = np.array([values[unit_key(c)] for c in corners])
+        best, best_diff = None, -1.0
+        for k in range(d):
+            if hi[k] - lo[k] <= min_width + 1e-12:
+                continue
+            upper = np.array([c[k] == hi[k] for c in corners])
+            a, b = v[upper], v[~upper]
+            diff = abs(np.nanmean(a) - np.nanmean(b)) if np.isfinite(a).any() and np.isfinite(b).any() else math.inf
+            diff = diff * (hi[k] - lo[k])  # prefer the wider axis on ties (e.g. equal corners)
+            if diff > best_diff:
+                best, best_diff = k, diff
+        mid = 0.5 * (lo[best] + hi[best])
+        left = (lo, tuple(mid if k == best else hi[k] for k in range(d)))
+        right = (tuple(mid if k == best else lo[k] for k in range(d)), hi)
+        return left, right
+
+    while len(params) < budget and heap:
+        chosen, new_points = [], []
+        while heap and len(new_points) < batch:
+            (neg_class, _), _, cell = heap[0]
+            if neg_class == math.inf:  # best remaining cell cannot be split
+                break
+            halves = split(cell)
+            fresh = {c for half in halves for c in _corners(*half) if unit_key(c) not in values}
+            fresh -= set(new_points)
+            if len(params) + len(new_points) + len(fresh) > budget:
+                break
+            heapq.heappop(heap)
+            chosen.append(halves)
+            new_points.extend(sorted(fresh))
+        if not chosen:
+            break
+        if new_points:
+            run(new_points)
+        for half in (h for halves in chosen for h in halves):
+            s = score(half)
+            heapq.heappush(heap, ((-s[0], -s[1]), next(counter), half))
+
+    return AdaptiveResult(axes=axes, params=params, results=results, values=np.array(vals, dtype=float),
+                          cells=[entry[2] for entry in heap], threshold=threshold)
+
+
+__all__ = ["Axis", "AdaptiveResult", "adaptive_sweep"]
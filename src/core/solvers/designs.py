@@ -0,0 +1,116 @@
+"""
+Space-filling sampling designs for high-dimensional sweeps.
+
+Full Cartesian grids explode beyond 3-4 parameters; a few hundred scrambled Sobol, Latin
+hypercube or Halton points cover an 8-D box far more evenly. Points are drawn in the unit
+cube (scipy.stats.qmc, seeded, so a design is reproducible) and mapped onto parameter
+bounds, linearly or log-spaced per axis. Bounds default to the `core.params.PARAM_RANGES`
+checked by `validate_schema`; narrow them with explicit ``(lo, hi)`` pairs.
+
+The points are plain parameter dicts, so they feed `sweep.iter_points` (``design_sweep``
+does this) and, through `sweep.manifest_runs`, `io.sweep_manifest.write_sweep_manifest`.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..errors import ConfigError
+from ..params import PARAM_RANGES
+from .adaptive import Axis
+from .sweep import default_outputs, iter_points
+
+METHODS = ("sobol", "lhs", "halton")
+
+Bounds = Mapping[str, Optional[Tuple[float, float]]]
+
+
+def _require_qmc():
+    try:
+        from scipy.stats import qmc
+    except ImportError as e:  # pragma: no cover - exercised only without SciPy
+        raise ImportError("sampling designs need SciPy: pip install 'euv_simulation[solvers]'") from e
+    return qmc
+
+
+def schema_bounds(name: str) -> Tuple[float, float]:
+    """`PARAM_RANGES` entry for a dotted key (``"laser.A_PP"``) or an unambiguous leaf (``"A_PP"``)."""
+    if name in PARAM_RANGES:
+        return PARAM_RANGES[name]
+    hits = [k for k in PARAM_RANGES if k.split(".", 1)[1] == name]
+    if len(hits) != 1:
+        raise ConfigError(f"No schema range for '{name}'" + (f" (ambiguous: {hits})" if hits else ""),
+                          suggested_fix="Pass explicit (lo, hi) bounds for this parameter")
+    return PARAM_RANGES[hits[0]]
+
+
+def design_axes(bounds: Bounds, log_axes: Sequence[str] = ()) -> List[Axis]:
+    """Axes for ``bounds``; a ``None`` range takes the schema range of that parameter."""
+    unknown = set(log_axes) - set(bounds)
+    if unknown:
+        raise ConfigError(f"log_axes {sorted(unknown)} are not among the sampled parameters")
+    axes = []
+    for name, rng in bounds.items():
+        lo, hi = schema_bounds(name) if rng is None else rng
+        a = Axis(name, float(lo), float(hi), name in set(log_axes))
+        if not (np.isfinite(a.lo) and np.isfinite(a.hi) and a.hi > a.lo) or (a.log and a.lo <= 0.0):
+            raise ConfigError(f"Invalid range for '{name}': [{a.lo}, {a.hi}]",
+                              suggested_fix="Use finite bounds with lo < hi (lo > 0 on log axes)")
+        axes.append(a)
+    return axes
+
+
+def unit_design(method: str, n: int, d: int, seed: Optional[int] = 0, scramble: bool = True) -> np.ndarray:
+    """``(n, d)`` points in [0, 1)^d from ``method`` (sobol|lhs|halton).
+
+    The same ``(method, n, d, seed)`` always gives the same points (``seed=None``: fresh
+    entropy). Sobol balance is best for ``n`` a power of two; SciPy warns otherwise.
+    """
+    method = str(method).lower()
+    if method not in METHODS:
+        raise ConfigError(f"Unknown sampling method '{method}'", suggested_fix=f"Use one of {list(METHODS)}")
+    if n < 1 or d < 1:
+        raise ConfigError(f"Design needs n >= 1 points in d >= 1 dimensions (got n={n}, d={d})")
+    qmc = _require_qmc()
+    if method == "sobol":
+        engine = qmc.Sobol(d, scramble=scramble, seed=seed)
+    elif method == "halton":
+        engine = qmc.Halton(d, scramble=scramble, seed=seed)
+    else:
+        engine = qmc.LatinHypercube(d, seed=seed)
+    return np.asarray(engine.random(n), dtype=float)
+
+
+def design_points(bounds: Bounds, n: int, method: str = "sobol", seed: Optional[int] = 0,
+                  log_axes: Sequence[str] = (), fixed: Optional[Mapping[str, Any]] = None,
+                  scramble: bool = True) -> List[Dict[str, Any]]:
+    """``n`` parameter dicts filling ``bounds`` (``fixed`` entries are added to each)."""
+    axes = design_axes(bounds, log_axes)
+    unit = unit_design(method, n, len(axes), seed=seed, scramble=scramble)
+    points = []
+    for u in unit:
+        cfg = dict(fixed or {})
+        cfg.update({a.name: a.value(x) for a, x in zip(axes, u)})
+        points.append(cfg)
+    return points
+
+
+def design_sweep(bounds: Bounds, worker: Callable[..., Any], n: int, method: str = "sobol",
+                 seed: Optional[int] = 0, log_axes: Sequence[str] = (),
+                 fixed: Optional[Mapping[str, Any]] = None, max_parallel: int = 1,
+                 journal: Optional[Union[str, Path]] = None,
+                 outputs: Callable[[Any], Mapping[str, Any]] = default_outputs,
+                 **pool_kwargs) -> List[Tuple[Dict[str, Any], Any]]:
+    """Run a space-filling design like `sweep.sweep`; results come back in design order.
+
+    Further keyword arguments (``session``, ``crash_retries``, ...) go to `sweep.iter_points`.
+    """
+    points = design_points(bounds, n, method=method, seed=seed, log_axes=log_axes, fixed=fixed)
+    return list(iter_points(points, worker, max_parallel=max_parallel, ordered=True, journal=journal,
+                            outputs=outputs, **pool_kwargs))
+
+
+__all__ = ["METHODS", "schema_bounds", "design_axes", "unit_design", "design_points", "design_sweep"]
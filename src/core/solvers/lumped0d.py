@@ -0,0 +1,349 @@
+"""
+Lumped 0D droplet energy / mass-loss solver (COMSOL-free surrogate).
+
+The droplet is an isothermal sphere of mass m and temperature T:
+
+    m*cp*dT/dt = A_PP*f*P(t) - L_v*J(T)*S - epsilon*sigma_SB*S*(T^4 - T_amb^4)
+    dm/dt      = -J(T)*S,        S = 4*pi*R^2,  R = (3*m/(4*pi*rho))^(1/3)
+
+with the intercepted fraction f = 1 - exp(-2*R^2/w0^2) of a centred Gaussian beam and the
+Hertz–Knudsen flux J = HK_gamma*(Psat(T) - p_amb)*sqrt(M/(2*pi*R_gas*T)) (``J_evap`` of
+the Fresnel build). Every coefficient is an array over N parameter sets sharing one pulse
+shape P(t) (scaled per set by ``E_scale``); one adaptive Bogacki–Shampine (RK23) step
+advances the whole batch, so thousands of sets cost about as much as one.
+
+Public API:
+- `LumpedInputs` — struct-of-arrays parameter sets (`from_config`, `from_grid`).
+- `solve_lumped(inputs, pulse, t_end, psat)` → `LumpedResult` (T, mass, mdot, R, powers).
+- `solve_from_config(cfg, params_dir)` — pulse/Psat/inputs as `core.build` configures them.
+- `write_lumped_outputs(result, out_dir, index)` — ``pp_T_vs_time.csv``,
+  ``pp_massloss_vs_time.csv``, ``pp_radius_vs_time.csv`` and ``pp_energy_vs_time.csv`` in
+  the layout of the COMSOL table exporters.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Optional, Sequence, Union
+
+import numpy as np
+
+from ..errors import ConfigError, PhysicsError
+from ..thermo import R_GAS, get_material
+
+SIGMA_SB = 5.670374419e-8  # W/(m^2 K^4)
+
+# Bogacki–Shampine 3(2) tableau (FSAL)
+_C2, _C3 = 0.5, 0.75
+_B = (2.0 / 9.0, 1.0 / 3.0, 4.0 / 9.0)
+_E = (-5.0 / 72.0, 1.0 / 12.0, 1.0 / 9.0, -1.0 / 8.0)  # b - b_hat
+
+_FIELDS = ("R", "w0", "A_PP", "E_scale", "rho", "cp", "L_v", "M", "HK_gamma",
+           "p_amb", "T_amb", "emissivity", "T0")
+
+
+@dataclass
+class LumpedInputs:
+    """Parameter sets of the 0D model; scalars broadcast to 1D arrays of equal length.
+
+    ``E_scale`` multiplies the shared pulse P(t) per set (e.g. E_PP_total / E_pulse).
+    """
+    R: np.ndarray
+    w0: np.ndarray
+    A_PP: np.ndarray
+    E_scale: np.ndarray = 1.0
+    rho: np.ndarray = 6970.0
+    cp: np.ndarray = 255.0
+    L_v: np.ndarray = 2.96e6
+    M: np.ndarray = 0.11871
+    HK_gamma: np.ndarray = 1.0
+    p_amb: np.ndarray = 0.0
+    T_amb: np.ndarray = 300.0
+    emissivity: np.ndarray = 0.0
+    T0: np.ndarray = 300.0
+
+    def __post_init__(self):
+        arrays = np.broadcast_arrays(*(np.atleast_1d(np.asarray(getattr(self, k), dtype=float)) for k in _FIELDS))
+        for k, v in zip(_FIELDS, arrays):
+            setattr(self, k, np.ascontiguousarray(v.ravel()))
+
+    def __len__(self) -> int:
+        return self.R.size
+
+    @classmethod
+    def from_config(cls, cfg, **overrides) -> "LumpedInputs":
+        """Inputs from a `UnifiedConfig`; ``overrides`` replace (or broadcast over) any field."""
+        env, mat, rad, evap = cfg.environment, cfg.materials, cfg.radiation, cfg.evaporation
+        T_amb = env.T_amb if env.T_amb is not None else 300.0
+        values = dict(R=cfg.geometry.R, w0=cfg.laser.w0, A_PP=cfg.laser.A_PP, rho=mat.rho_Sn,
+                      cp=mat.cp_Sn, L_v=mat.L_v, M=mat.M_Sn,
+                      HK_gamma=evap.HK_gamma if evap.HK_gamma is not None else 1.0,
+                      p_amb=env.p_amb or 0.0, T_amb=T_amb, emissivity=rad.emissivity or 0.0, T0=T_amb)
+        unknown = set(overrides) - set(_FIELDS)
+        if unknown:
+            raise ConfigError(f"Unknown lumped input(s): {sorted(unknown)}")
+        values.update(overrides)
+        return cls(**values)
+
+    @classmethod
+    def from_grid(cls, base: Optional["LumpedInputs"] = None, **axes) -> "LumpedInputs":
+        """Cartesian product of the given axes; other fields are taken from ``base`` (set 0)."""
+        unknown = set(axes) - set(_FIELDS)
+        if unknown:
+            raise ConfigError(f"Unknown lumped input(s): {sorted(unknown)}")
+        names = list(axes)
+        grids = np.meshgrid(*(np.atleast_1d(np.asarray(axes[k], dtype=float)) for k in names), indexing="ij")
+        values = {k: float(getattr(base, k)[0]) for k in _FIELDS} if base is not None else {}
+        values.update({k: g.ravel() for k, g in zip(names, grids)})
+        return cls(**values)
+
+    def select(self, i: int) -> "LumpedInputs":
+        return LumpedInputs(**{k: getattr(self, k)[i] for k in _FIELDS})
+
+
+@dataclass
+class LumpedResult:
+    """Batch trajectories on the output grid ``t``; per-set arrays have shape (N, len(t))."""
+    t: np.ndarray
+    T: np.ndarray
+    mass: np.ndarray
+    mdot: np.ndarray          # mass loss rate S*J [kg/s] (positive for evaporation)
+    R: np.ndarray
+    P_abs: np.ndarray
+    P_lat: np.ndarray
+    P_rad: np.ndarray
+    E_abs: np.ndarray         # cumulative energies [J], shape (N, len(t))
+    E_lat: np.ndarray
+    E_rad: np.ndarray
+    depleted: np.ndarray      # sets whose mass fell below the depletion threshold (frozen after)
+    n_steps: int = 0
+    n_rejected: int = 0
+    meta: Dict[str, object] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return self.T.shape[0]
+
+    @property
+    def T_max(self) -> np.ndarray:
+        return self.T.max(axis=1)
+
+    @property
+    def mass_lost(self) -> np.ndarray:
+        return self.mass[:, 0] - self.mass[:, -1]
+
+
+def _psat_callable(psat) -> Callable:
+    if psat is None:
+        return lambda T: np.zeros_like(T)
+    if callable(psat) and not isinstance(psat, str):
+        return psat
+    return get_material(psat).psat
+
+
+class _Rhs:
+    """Vectorized right-hand side; state columns are (T, m, E_abs, E_lat, E_rad)."""
+
+    def __init__(self, inp: LumpedInputs, pulse: Callable, psat: Callable, clamp_nonneg: bool, m_min: np.ndarray,
+                 cp: Optional[Callable] = None):
+        self.inp, self.pulse, self.psat, self.clamp, self.m_min = inp, pulse, psat, clamp_nonneg, m_min
+        self.cp = cp
+        self.frozen = np.zeros(len(inp), dtype=bool)
+
+    def terms(self, t: float, T: np.ndarray, m: np.ndarray):
+        inp = self.inp
+        T = np.maximum(T, 1.0)
+        R = np.cbrt(np.maximum(m, self.m_min) * (3.0 / (4.0 * math.pi)) / inp.rho)
+        S = 4.0 * math.pi * R * R
+        P_abs = inp.A_PP * (1.0 - np.exp(-2.0 * R * R / (inp.w0 * inp.w0))) * inp.E_scale * float(self.pulse(t))
+        J = inp.HK_gamma * (self.psat(T) - inp.p_amb) * np.sqrt(inp.M / (2.0 * math.pi * R_GAS * T))
+        if self.clamp:
+            J = np.maximum(J, 0.0)
+        mdot = J * S
+        P_lat = inp.L_v * mdot
+        P_rad = inp.emissivity * SIGMA_SB * S * (T ** 4 - inp.T_amb ** 4)
+        return R, mdot, P_abs, P_lat, P_rad
+
+    def __call__(self, t: float, y: np.ndarray) -> np.ndarray:
+        _, mdot, P_abs, P_lat, P_rad = self.terms(t, y[:, 0], y[:, 1])
+        m = np.maximum(y[:, 1], self.m_min)
+        dy = np.empty_like(y)
+        cp = self.inp.cp if self.cp is None else self.cp(np.maximum(y[:, 0], 1.0))
+        dy[:, 0] = (P_abs - P_lat - P_rad) / (m * cp)
+        dy[:, 1] = -mdot
+        dy[:, 2], dy[:, 3], dy[:, 4] = P_abs, P_lat, P_rad
+        dy[self.frozen] = 0.0
+        return dy
+
+
+def solve_lumped(inputs: LumpedInputs, pulse: Callable, t_end: float,
+                 psat: Union[None, str, Callable] = "kumar_sn", t_eval: Optional[Sequence[float]] = None,
+                 rtol: float = 1e-6, atol_T: float = 1e-3, clamp_nonneg: bool = False,
+                 depletion_fraction: float = 1e-3, max_steps: int = 1_000_000,
+                 cp: Optional[Callable] = None) -> LumpedResult:
+    """Integrate the 0D model for every set in ``inputs`` from t=0 to ``t_end``.
+
+    ``pulse`` is P(t) [W] (a `CompiledPulse` or any scalar callable); ``psat`` is a
+    `core.thermo` material option, a vectorized callable Psat(T) [Pa], or None (no
+    evaporation). Output times default to ``pulse.time_grid`` (event-aware) or 201 uniform
+    points; the adaptive step always lands on them. A set whose mass drops below
+    ``depletion_fraction`` of its initial mass is marked ``depleted`` and frozen. ``cp`` is
+    an optional vectorized cp(T) [J/(kg*K)] (e.g. `core.properties.TinProperties.cp`) used
+    instead of ``inputs.cp``.
+    """
+    if t_end <= 0.0:
+        raise ConfigError("t_end must be positive")
+    n = len(inputs)
+    if t_eval is None:
+        if hasattr(pulse, "time_grid"):
+            t_eval = pulse.time_grid(0.0, t_end, max_dt=t_end / 200.0)
+        else:
+            t_eval = np.linspace(0.0, t_end, 201)
+    t_eval = np.unique(np.concatenate([[0.0], np.asarray(t_eval, dtype=float), [t_end]]))
+    t_eval = t_eval[(t_eval >= 0.0) & (t_eval <= t_end)]
+
+    m0 = inputs.rho * (4.0 / 3.0) * math.pi * inputs.R ** 3
+    m_min = depletion_fraction * m0
+    rhs = _Rhs(inputs, pulse, _psat_callable(psat), clamp_nonneg, m_min, cp=cp)
+    atol = np.column_stack([np.full(n, atol_T), 1e-3 * rtol * m0])
+
+    y = np.zeros((n, 5))
+    y[:, 0], y[:, 1] = inputs.T0, m0
+    out = np.empty((t_eval.size, n, 5))
+    out[0] = y
+    t = 0.0
+    k1 = rhs(t, y)
+    h = min(t_eval[1] - t_eval[0], t_end / 1e3) if t_eval.size > 1 else t_end
+    n_steps = n_rej = 0
+    for j, t_next in enumerate(t_eval[1:], start=1):
+        while t < t_next:
+            if n_steps + n_rej >= max_steps:
+                raise PhysicsError(f"Lumped solver exceeded {max_steps} steps at t={t:.3e} s",
+                                   suggested_fix="Loosen rtol/atol_T or check for runaway heating")
+            h_try = min(h, t_next - t)
+            last = h_try >= t_next - t
+            k2 = rhs(t + _C2 * h_try, y + _C2 * h_try * k1)
+            k3 = rhs(t + _C3 * h_try, y + _C3 * h_try * k2)
+            y_new = y + h_try * (_B[0] * k1 + _B[1] * k2 + _B[2] * k3)
+            t_new = t_next if last else t + h_try
+            k4 = rhs(t_new, y_new)
+            err = h_try * (_E[0] * k1 + _E[1] * k2 + _E[2] * k3 + _E[3] * k4)[:, :2]
+            scale = atol + rtol * np.maximum(np.abs(y[:, :2]), np.abs(y_new[:, :2]))
+            active = ~rhs.frozen
+            err_norm = float(np.max(np.abs(err[active]) / scale[active])) if active.any() else 0.0
+            if not np.isfinite(err_norm):
+                err_norm = 1e10
+            if err_norm <= 1.0:
+                t, y, k1 = t_new, y_new, k4
+                n_steps += 1
+                newly = active & (y[:, 1] <= m_min)
+                if newly.any():
+                    rhs.frozen |= newly
+                    y[newly, 1] = np.maximum(y[newly, 1], 0.0)
+                    k1 = rhs(t, y)
+                factor = 5.0 if err_norm == 0.0 else min(5.0, 0.9 * err_norm ** (-1.0 / 3.0))
+                if not (last and h_try < h):  # a step clipped to land on t_next keeps h
+                    h = h_try * factor
+            else:
+                n_rej += 1
+                h = h_try * max(0.2, 0.9 * err_norm ** (-1.0 / 3.0))
+            if h <= 1e-14 * max(t_end, abs(t)):
+                raise PhysicsError(f"Lumped solver step size underflow at t={t:.3e} s",
+                                   suggested_fix="Check inputs for non-physical values")
+        out[j] = y
+
+    out = out.transpose(1, 0, 2)
+    T, m = out[:, :, 0], np.maximum(out[:, :, 1], 0.0)
+    R, mdot, P_abs, P_lat, P_rad = (np.empty_like(T) for _ in range(5))
+    for j, tj in enumerate(t_eval):
+        R[:, j], mdot[:, j], P_abs[:, j], P_lat[:, j], P_rad[:, j] = rhs.terms(tj, T[:, j], m[:, j])
+    gone = m <= m_min[:, None]
+    for a in (mdot, P_abs, P_lat, P_rad):
+        a[gone] = 0.0
+    return LumpedResult(t=t_eval, T=T, mass=m, mdot=mdot, R=R, P_abs=P_abs, P_lat=P_lat, P_rad=P_rad,
+                        E_abs=out[:, :, 2], E_lat=out[:, :, 3], E_rad=out[:, :, 4], depleted=rhs.frozen.copy(),
+                        n_steps=n_steps, n_rejected=n_rej)
+
+
+def pulse_from_config(cfg, params_dir: Optional[Path] = None):
+    """``Ppp(t)`` as `core.build` would install it: the config profile, else the legacy files."""
+    from ..pulse import compile_pulse, config_pulse_expression, load_pulse
+
+    expr = config_pulse_expression(cfg.laser)
+    if expr is not None:
+        if cfg.laser.E_PP_total is None:
+            raise ConfigError("laser.E_PP_total is required for the configured temporal_profile")
+        return compile_pulse(expr, {"E_PP_total": cfg.laser.E_PP_total})
+    params_dir = Path(params_dir or "data")
+    expr_path = params_dir / "Ppp_analytic_expression.txt"
+    if not expr_path.is_file():
+        raise ConfigError(f"No pulse: temporal_profile={cfg.laser.temporal_profile!r} and {expr_path} missing",
+                          suggested_fix="Set laser.temporal_profile to square/ramp_square with tau_square")
+    return load_pulse(expr_path, [params_dir / "global_parameters_pp_v2.txt",
+                                  params_dir / "laser_parameters_pp_v2.txt"])
+
+
+def psat_from_config(cfg, params_dir: Optional[Path] = None) -> Optional[Callable]:
+    """Psat(T) from ``evaporation.p_sat_expr``, ``p_sat_option`` or the legacy ``p_sat_expr``.
+
+    Returns None (no evaporation) when none is set, matching the ``p_amb`` fallback of the
+    COMSOL build.
+    """
+    from ..build import read_kv_file
+    from ..pulse import compile_expression
+    from ..thermo import MATERIALS
+
+    evap = cfg.evaporation
+    if evap.p_sat_expr:
+        return compile_expression(evap.p_sat_expr, variable="T")
+    if evap.p_sat_option and evap.p_sat_option.lower() in MATERIALS:
+        return MATERIALS[evap.p_sat_option.lower()].psat
+    legacy = Path(params_dir or "data") / "laser_parameters_pp_v2.txt"
+    if legacy.is_file():
+        expr = read_kv_file(legacy).get("p_sat_expr")
+        if expr:
+            return compile_expression(expr, variable="T")
+    return None
+
+
+def inputs_from_config(cfg, pulse: Callable, **overrides) -> LumpedInputs:
+    """`LumpedInputs.from_config` that also accepts an ``E_PP_total`` override (scalar or
+    array), applied as ``E_scale`` relative to the energy of ``pulse``."""
+    if "E_PP_total" in overrides:
+        E = np.asarray(overrides.pop("E_PP_total"), dtype=float)
+        E_ref = pulse.energy() if hasattr(pulse, "energy") else cfg.laser.E_PP_total
+        if not E_ref:
+            raise ConfigError("Cannot scale a pulse with zero energy")
+        overrides["E_scale"] = E / E_ref
+    return LumpedInputs.from_config(cfg, **overrides)
+
+
+def solve_from_config(cfg, params_dir: Optional[Path] = None, pulse: Optional[Callable] = None,
+                      **overrides) -> LumpedResult:
+    """Run the 0D model for a `UnifiedConfig`; ``overrides`` are `LumpedInputs` fields
+    (plus ``E_PP_total``, see `inputs_from_config`). A nonzero ``materials.dcp_dT`` makes cp
+    follow `core.properties` unless ``cp`` is overridden."""
+    from ..properties import TinProperties
+
+    pulse = pulse if pulse is not None else pulse_from_config(cfg, params_dir)
+    cp_law = None
+    if getattr(cfg.materials, "dcp_dT", None) and "cp" not in overrides:
+        cp_law = TinProperties.from_config(cfg).cp
+    inputs = inputs_from_config(cfg, pulse, **overrides)
+    evap = cfg.evaporation
+    result = solve_lumped(inputs, pulse, cfg.simulation.time_end, psat=psat_from_config(cfg, params_dir),
+                          clamp_nonneg=bool(evap.clamp_nonneg), cp=cp_law)
+    result.meta["emissivity"] = cfg.radiation.emissivity
+    return result
+
+
+def write_lumped_outputs(result: LumpedResult, out_dir: Union[str, Path], index: int = 0,
+                         model: str = "lumped0d") -> Dict[str, Path]:
+    """Write set ``index`` as the four COMSOL-layout CSVs of `core.build`; returns their paths."""
+    from .outputs import write_pp_tables
+
+    i = index
+    return write_pp_tables(out_dir, result.t, result.T[i], result.mdot[i], result.R[i], result.P_abs[i],
+                           result.P_lat[i], result.P_rad[i] if result.meta.get("emissivity", 1.0) else None,
+                           model=model)
@@ -0,0 +1,48 @@
+"""
+COMSOL-layout result tables shared by the Python solvers.
+
+`write_pp_tables` writes ``pp_T_vs_time.csv``, ``pp_massloss_vs_time.csv``,
+``pp_radius_vs_time.csv`` and ``pp_energy_vs_time.csv`` with the file names, table names
+and column headers of the exporters created by `core.build`, so the outputs of `lumped0d`,
+`radial1d` and COMSOL can be diffed with `io.results.compare_results`.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+from ...io.results import write_comsol_table
+
+T_COLUMN = "intop_drop(T)/intop_drop(1) (K)"
+MASS_COLUMN = "intop_surf(J_evap) (kg/s)"
+RADIUS_COLUMN = "maxop_surf(rad) (m)"
+
+
+def write_pp_tables(out_dir: Union[str, Path], t: np.ndarray, T: np.ndarray, mdot: np.ndarray,
+                    R: np.ndarray, P_abs: np.ndarray, P_lat: np.ndarray, P_rad: Optional[np.ndarray] = None,
+                    T_surf: Optional[np.ndarray] = None, model: str = "pp_model") -> Dict[str, Path]:
+    """Write one run's time series; ``P_rad`` is omitted (like COMSOL) when None.
+
+    ``T_surf`` adds a surface-temperature column to the T table; `compare_results` only
+    compares columns present in both files, so the extra column is harmless.
+    """
+    out_dir = Path(out_dir)
+    T_cols = {"Time (s)": t, T_COLUMN: T}
+    if T_surf is not None:
+        T_cols["T_surf (K)"] = T_surf
+    energy = {"Time (s)": t, "P_abs (W)": P_abs, "P_lat (W)": P_lat,
+              "P_Qb_droplet (W)": np.asarray(P_abs) - np.asarray(P_lat)}
+    if P_rad is not None:
+        energy["P_rad (W)"] = P_rad
+    return {
+        "T": write_comsol_table(out_dir / "pp_T_vs_time.csv", T_cols, "T_vs_time - T_avg_drop", model=model),
+        "mass": write_comsol_table(out_dir / "pp_massloss_vs_time.csv", {"Time (s)": t, MASS_COLUMN: mdot},
+                                   "mass_vs_time - mass loss rate", model=model),
+        "radius": write_comsol_table(out_dir / "pp_radius_vs_time.csv", {"Time (s)": t, RADIUS_COLUMN: R},
+                                     "radius_vs_time - apparent radius", model=model),
+        "energy": write_comsol_table(out_dir / "pp_energy_vs_time.csv", energy,
+                                     "energy_vs_time - energy terms", model=model),
+    }
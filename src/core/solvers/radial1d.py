@@ -0,0 +1,254 @@
+"""
+1D radial finite-volume conduction + evaporation solver (fast screening backend).
+
+Solves rho*cp*dT/dt = (1/r^d) d/dr(r^d k dT/dr) in a sphere (d=2) or an infinite cylinder
+(d=1, per metre of length — the geometry of the planar 2D COMSOL model) with the surface
+flux
+
+    q_s = q_abs(t) - L_v*J(T_s) - epsilon*sigma_SB*(T_s^4 - T_amb^4)
+
+where q_abs spreads the intercepted Gaussian-beam power A_PP*f*Ppp(t) uniformly over the
+surface and J is the Hertz–Knudsen flux of `lumped0d`. Time stepping is backward Euler on
+a cell-centred grid refined geometrically toward the surface. The tridiagonal operator
+depends only on (grid, k, rho*cp, dt), so its inverse is computed once and cached; the
+nonlinear surface terms are linearized about the previous step and enter as a rank-one
+update of the last diagonal entry (Sherman–Morrison), so each step is one matrix product
+shared by every set of the batch. The grid is fixed: boil-off is reported as mass loss and
+an apparent radius, not as a moving boundary.
+
+Public API:
+- `radial_grid(R, n_cells, stretch, geometry)` → `RadialGrid`.
+- `solve_radial(inputs, k, pulse, t_end, ...)` → `RadialResult`; ``inputs`` is a
+  `lumped0d.LumpedInputs` batch whose sets share R, rho and cp.
+- `solve_from_config(cfg, params_dir, geometry, **overrides)`.
+- `write_radial_outputs(result, out_dir, index)` — the `core.build` CSV tables (plus a
+  ``T_surf`` column), comparable with `io.results.compare_results`.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..errors import ConfigError
+from ..pulse import step_energies
+from ..thermo import R_GAS
+from .lumped0d import SIGMA_SB, LumpedInputs, _psat_callable, inputs_from_config, psat_from_config, pulse_from_config
+
+GEOMETRIES = ("sphere", "cylinder")
+
+
+def _area(r, geometry: str):
+    return 4.0 * math.pi * r * r if geometry == "sphere" else 2.0 * math.pi * r
+
+
+def _volume(r, geometry: str):
+    return 4.0 / 3.0 * math.pi * r ** 3 if geometry == "sphere" else math.pi * r * r
+
+
+@dataclass(frozen=True, eq=False)
+class RadialGrid:
+    """Cell-centred radial grid; cell thicknesses grow by ``stretch`` from the surface inward."""
+    geometry: str
+    R: float
+    faces: np.ndarray
+    centres: np.ndarray
+    volumes: np.ndarray
+    areas: np.ndarray      # face areas (per metre for the cylinder), faces[0] = 0
+
+    @property
+    def n_cells(self) -> int:
+        return self.centres.size
+
+    @property
+    def surface_area(self) -> float:
+        return float(self.areas[-1])
+
+    @property
+    def surface_dr(self) -> float:
+        return float(self.faces[-1] - self.faces[-2])
+
+
+@lru_cache(maxsize=32)
+def radial_grid(R: float, n_cells: int = 100, stretch: float = 1.08, geometry: str = "sphere") -> RadialGrid:
+    if geometry not in GEOMETRIES:
+        raise ConfigError(f"geometry must be one of {GEOMETRIES}, got '{geometry}'")
+    if n_cells < 2 or stretch < 1.0 or R <= 0.0:
+        raise ConfigError("Require R > 0, n_cells >= 2 and stretch >= 1")
+    dr = stretch ** np.arange(n_cells, dtype=float)[::-1]  # thinnest cell at the surface
+    faces = np.concatenate([[0.0], np.cumsum(dr)]) * (R / dr.sum())
+    faces[-1] = R
+    centres = 0.5 * (faces[1:] + faces[:-1])
+    vol = _volume(faces, geometry)
+    arrays = (faces, centres, np.diff(vol), _area(faces, geometry))
+    for a in arrays:
+        a.flags.writeable = False
+    return RadialGrid(geometry, float(R), *arrays)
+
+
+@lru_cache(maxsize=32)
+def _inverse_operator(grid: RadialGrid, k: float, rho_cp: float, dt: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Cached (C, A^-1) of the backward-Euler conduction operator A = diag(C) + K."""
+    n = grid.n_cells
+    C = rho_cp * grid.volumes / dt
+    G = k * grid.areas[1:-1] / np.diff(grid.centres)
+    A = np.diag(C)
+    i = np.arange(n - 1)
+    A[i, i] += G
+    A[i + 1, i + 1] += G
+    A[i, i + 1] = A[i + 1, i] = -G
+    Ainv = np.linalg.inv(A)
+    C.flags.writeable = False
+    Ainv.flags.writeable = False
+    return C, Ainv
+
+
+def _intercepted(R: float, w0: np.ndarray, geometry: str) -> np.ndarray:
+    """Absorbed fraction of Ppp for a centred beam (per metre for the cylinder).
+
+    The cylinder uses the planar build's ``I_xy`` (Gaussian in the distance from the beam
+    point, constant on a centred circle) times ``cos_inc``: (2/(pi*w0^2))*exp(-2R^2/w0^2)*2R.
+    """
+    if geometry == "sphere":
+        return 1.0 - np.exp(-2.0 * R * R / (w0 * w0))
+    return 4.0 * R / (math.pi * w0 * w0) * np.exp(-2.0 * R * R / (w0 * w0))
+
+
+@dataclass
+class RadialResult:
+    """Time series on ``t`` with shape (N, len(t)); ``T`` is the volume-averaged temperature."""
+    t: np.ndarray
+    T: np.ndarray
+    T_surf: np.ndarray
+    mdot: np.ndarray
+    R: np.ndarray             # apparent radius from the evaporated mass
+    P_abs: np.ndarray
+    P_lat: np.ndarray
+    P_rad: np.ndarray
+    E_abs: np.ndarray         # totals over the run [J] (per metre for the cylinder), shape (N,)
+    E_lat: np.ndarray
+    E_rad: np.ndarray
+    mass_lost: np.ndarray
+    T_profile: np.ndarray     # final cell temperatures, shape (N, n_cells)
+    grid: RadialGrid
+    meta: Dict[str, object] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return self.T.shape[0]
+
+    @property
+    def T_surf_max(self) -> np.ndarray:
+        return self.T_surf.max(axis=1)
+
+    @property
+    def depleted(self) -> np.ndarray:
+        """Sets whose evaporated mass exceeds the droplet mass (fixed-grid model invalid)."""
+        return self.mass_lost >= self.meta.get("m0", np.inf)
+
+
+def solve_radial(inputs: LumpedInputs, k: float, pulse: Callable, t_end: float,
+                 psat: Union[None, str, Callable] = "kumar_sn", geometry: str = "sphere",
+                 n_cells: int = 100, stretch: float = 1.08, n_steps: int = 1000,
+                 t_out: Optional[Sequence[float]] = None, clamp_nonneg: bool = False) -> RadialResult:
+    """Integrate the radial model for every set of ``inputs`` over [0, t_end].
+
+    All sets must share ``R``, ``rho`` and ``cp`` (they define the cached operator); the
+    pulse scale, absorption, beam, evaporation and radiation inputs may vary per set.
+    Results are recorded every step, or linearly interpolated onto ``t_out``.
+    """
+    for name in ("R", "rho", "cp"):
+        v = getattr(inputs, name)
+        if not np.all(v == v[0]):
+            raise ConfigError(f"solve_radial needs a single {name} per batch")
+    if t_end <= 0.0 or n_steps < 1:
+        raise ConfigError("Require t_end > 0 and n_steps >= 1")
+    R, rho, cp = float(inputs.R[0]), float(inputs.rho[0]), float(inputs.cp[0])
+    grid = radial_grid(R, int(n_cells), float(stretch), geometry)
+    dt = t_end / n_steps
+    C, Ainv = _inverse_operator(grid, float(k), rho * cp, dt)
+    z = Ainv[:, -1]
+    S = grid.surface_area
+    psat_fn = _psat_callable(psat)
+
+    t = np.linspace(0.0, t_end, n_steps + 1)
+    gain = inputs.A_PP * _intercepted(R, inputs.w0, geometry) * inputs.E_scale
+    P_abs_steps = np.outer(gain, step_energies(pulse, t) / dt)  # step-averaged, energy exact
+    kin = inputs.HK_gamma * np.sqrt(inputs.M / (2.0 * math.pi * R_GAS))
+    eps_sigma = inputs.emissivity * SIGMA_SB
+
+    def flux(Ts):
+        J = kin * (psat_fn(Ts) - inputs.p_amb) / np.sqrt(Ts)
+        return np.maximum(J, 0.0) if clamp_nonneg else J
+
+    n = len(inputs)
+    T = np.tile(inputs.T0, (grid.n_cells, 1))
+    rec = np.empty((6, n, n_steps + 1))  # T_avg, T_surf, mdot, P_abs, P_lat, P_rad
+    w = grid.volumes / grid.volumes.sum()
+    Ts = T[-1]
+    J0 = flux(Ts)
+    rec[:, :, 0] = (w @ T, Ts, S * J0, gain * float(pulse(0.0)), inputs.L_v * S * J0,
+                    eps_sigma * S * (Ts ** 4 - inputs.T_amb ** 4))
+    for s in range(n_steps):
+        Ts = np.maximum(T[-1], 1.0)
+        h = 1e-6 * Ts
+        J = flux(Ts)
+        dJ = (flux(Ts + h) - J) / h
+        rad = eps_sigma * (Ts ** 4 - inputs.T_amb ** 4)
+        drad = 4.0 * eps_sigma * Ts ** 3
+        q_abs = P_abs_steps[:, s] / S
+        q = q_abs - inputs.L_v * J - rad
+        dq = -inputs.L_v * dJ - drad
+        b = C[:, None] * T
+        b[-1] += S * (q - dq * Ts)
+        y = Ainv @ b
+        delta = -S * dq
+        T = y - np.outer(z, delta * y[-1] / (1.0 + delta * z[-1]))
+        dT = T[-1] - Ts
+        mdot = S * (J + dJ * dT)
+        rec[:, :, s + 1] = (w @ T, T[-1], mdot, q_abs * S, inputs.L_v * mdot, S * (rad + drad * dT))
+
+    T_avg, T_s, mdot, P_abs, P_lat, P_rad = rec
+    # step values apply over (t_s, t_s+1]; totals use the rectangle rule of the scheme
+    E_abs, E_lat, E_rad = (a[:, 1:].sum(axis=1) * dt for a in (P_abs, P_lat, P_rad))
+    cum_mass = np.concatenate([np.zeros((n, 1)), np.cumsum(mdot[:, 1:] * dt, axis=1)], axis=1)
+    m0 = rho * _volume(R, geometry)
+    left = np.clip(1.0 - cum_mass / m0, 0.0, None)
+    R_app = R * (np.cbrt(left) if geometry == "sphere" else np.sqrt(left))
+    series = [T_avg, T_s, mdot, R_app, P_abs, P_lat, P_rad]
+    t_rec = t
+    if t_out is not None:
+        t_rec = np.asarray(t_out, dtype=float)
+        series = [np.stack([np.interp(t_rec, t, row) for row in a]) for a in series]
+    T_avg, T_s, mdot, R_app, P_abs, P_lat, P_rad = series
+    return RadialResult(t=t_rec, T=T_avg, T_surf=T_s, mdot=mdot, R=R_app, P_abs=P_abs, P_lat=P_lat,
+                        P_rad=P_rad, E_abs=E_abs, E_lat=E_lat, E_rad=E_rad, mass_lost=cum_mass[:, -1],
+                        T_profile=T.T.copy(), grid=grid, meta={"m0": m0, "dt": dt, "geometry": geometry})
+
+
+def solve_from_config(cfg, params_dir: Optional[Path] = None, pulse: Optional[Callable] = None,
+                      geometry: str = "sphere", n_cells: int = 100, n_steps: int = 1000,
+                      t_out: Optional[Sequence[float]] = None, **overrides) -> RadialResult:
+    """Run the radial model for a `UnifiedConfig` (pulse/Psat as in `lumped0d.solve_from_config`)."""
+    pulse = pulse if pulse is not None else pulse_from_config(cfg, params_dir)
+    inputs = inputs_from_config(cfg, pulse, **overrides)
+    result = solve_radial(inputs, cfg.materials.k_Sn, pulse, cfg.simulation.time_end,
+                          psat=psat_from_config(cfg, params_dir), geometry=geometry, n_cells=n_cells,
+                          n_steps=n_steps, t_out=t_out, clamp_nonneg=bool(cfg.evaporation.clamp_nonneg))
+    result.meta["emissivity"] = cfg.radiation.emissivity
+    return result
+
+
+def write_radial_outputs(result: RadialResult, out_dir: Union[str, Path], index: int = 0,
+                         model: str = "radial1d") -> Dict[str, Path]:
+    """Write set ``index`` as the COMSOL-layout CSVs of `core.build`; returns their paths."""
+    from .outputs import write_pp_tables
+
+    i = index
+    return write_pp_tables(out_dir, result.t, result.T[i], result.mdot[i], result.R[i], result.P_abs[i],
+                           result.P_lat[i], result.P_rad[i] if result.meta.get("emissivity", 1.0) else None,
+                           T_surf=result.T_surf[i], model=model)
@@ -1,19 +1,373 @@
 from __future__ import annotations
 
+import atexit
+import math
+import multiprocessing
+import os
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
 from itertools import product
-from typing import Dict, Iterable, List, Tuple, Callable, Any
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Callable, Any, Union
 
 
-def sweep(grid: Dict[str, Iterable[Any]], worker: Callable[[Dict[str, Any]], Any]) -> List[Tuple[Dict[str, Any], Any]]:
-    """Sequential sweep over a small parameter grid (Phase 3 stub).
-
-    - No multiprocessing by default (keeps CI simple, COMSOL-free).
-    - Designed to be called with check-only workers or light functions.
-    """
+def iter_grid(grid: Dict[str, Iterable[Any]]) -> Iterator[Dict[str, Any]]:
+    """Lazily expand the Cartesian product of ``grid`` (row-major, last key fastest)."""
     keys = list(grid.keys())
-    combos = []
     for values in product(*[list(grid[k]) for k in keys]):
-        cfg = {k: v for k, v in zip(keys, values)}
-        combos.append((cfg, worker(cfg)))
-    return combos
+        yield dict(zip(keys, values))
+
+
+def grid_points(grid: Dict[str, Iterable[Any]]) -> List[Dict[str, Any]]:
+    """Cartesian product of ``grid`` in row-major order (last key varies fastest)."""
+    return list(iter_grid(grid))
+
+
+def grid_size(grid: Dict[str, Iterable[Any]]) -> int:
+    return math.prod(len(list(v)) for v in grid.values())
+
+
+def default_outputs(result: Any) -> Mapping[str, Any]:
+    """Output files of a worker result: its ``"outputs"`` mapping (as `Solver.run` info has)."""
+    if isinstance(result, Mapping) and isinstance(result.get("outputs"), Mapping):
+        return result["outputs"]
+    return {}
+
+
+def sweep(grid: Dict[str, Iterable[Any]], worker: Callable[[Dict[str, Any]], Any],
+          max_parallel: int = 1, journal: Optional[Union[str, Path]] = None,
+          outputs: Callable[[Any], Mapping[str, Any]] = default_outputs,
+          **parallel_kwargs) -> List[Tuple[Dict[str, Any], Any]]:
+    """Sweep over a parameter grid; results come back in grid order.
+
+    - ``max_parallel=1`` (default) runs sequentially in-process; worker exceptions propagate.
+    - ``max_parallel>1`` (or None for all cores) delegates to `parallel_sweep`.
+    - ``journal``: path of an `io.sweep_journal.SweepJournal`. Each finished point is appended
+      (fsynced) with the hashes of ``outputs(result)``; on restart, points whose record and
+      outputs verify are not re-run and return their journaled (JSON) result.
+
+    For large grids use `iter_sweep`, which does not hold every result in memory.
+    """
+    grid = {k: list(v) for k, v in grid.items()}  # one-shot iterables are read once
+    if max_parallel != 1:
+        return parallel_sweep(grid, worker, max_parallel=max_parallel, journal=journal, outputs=outputs,
+                              **parallel_kwargs)
+    return list(iter_sweep(grid, worker, journal=journal, outputs=outputs))
+
+
+def _open_journal(journal: Optional[Union[str, Path]]):
+    if journal is None:
+        return None
+    from ...io.sweep_journal import SweepJournal
+
+    return SweepJournal(journal)
+
+
+@dataclass
+class SweepFailure:
+    """Stands in for the result of a grid point whose worker raised or died."""
+    index: int
+    cfg: Dict[str, Any]
+    error: str
+    message: str
+    traceback: str = ""
+
+
+# Per-process state of a pool worker (set by _init_worker).
+_WORKER: Optional[Callable] = None
+_CLIENT: Any = None
+_SESSION_ERROR: Optional[BaseException] = None
+
+
+def _init_worker(worker: Callable, use_session: bool, session_retries: int) -> None:
+    """Pool initializer: keep the worker and, optionally, one COMSOL client per process."""
+    global _WORKER, _CLIENT, _SESSION_ERROR
+    _WORKER, _CLIENT, _SESSION_ERROR = worker, None, None
+    if not use_session:
+        return
+    from ..session import Session
+
+    ctx = Session(retries=session_retries)
+    try:
+        _CLIENT = ctx.__enter__()
+    except Exception as e:  # noqa: BLE001 - reported per point instead of breaking the pool
+        _SESSION_ERROR = e
+        return
+    atexit.register(ctx.__exit__, None, None, None)
+
+
+def _run_point(index: int, cfg: Dict[str, Any]) -> Any:
+    try:
+        if _SESSION_ERROR is not None:
+            raise _SESSION_ERROR
+        return _WORKER(cfg, _CLIENT) if _CLIENT is not None else _WORKER(cfg)
+    except Exception as e:  # noqa: BLE001
+        return SweepFailure(index, cfg, type(e).__name__, str(e), traceback.format_exc())
+
+
+def parallel_sweep(grid: Dict[str, Iterable[Any]], worker: Callable[..., Any], max_parallel: Optional[int] = None,
+                   session: bool = False, session_retries: int = 3, crash_retries: int = 1,
+                   mp_context: Optional[str] = None, journal: Optional[Union[str, Path]] = None,
+                   outputs: Callable[[Any], Mapping[str, Any]] = default_outputs
+                   ) -> List[Tuple[Dict[str, Any], Any]]:
+    """Run ``worker`` over the grid in a process pool; results come back in grid order.
+
+    - ``max_parallel`` worker processes (default: CPU count, capped at the number of points).
+    - ``session=True`` starts one COMSOL client per worker process (`core.session.Session`,
+      closed at process exit) and calls ``worker(cfg, client)``; otherwise ``worker(cfg)``.
+      The JVM therefore starts once per worker, not once per point.
+    - Failures are isolated: an exception becomes a `SweepFailure` in that point's slot. If
+      a worker process dies (JVM crash), each point lost with the pool is retried alone in
+      a fresh process up to ``crash_retries`` times before being recorded as a failure.
+    - ``journal`` / ``outputs`` as in `sweep`; records are appended as points complete (in
+      completion order), failures with status "failed" so a restart re-runs them.
+    - ``worker`` must be picklable (a module-level function). ``mp_context`` selects the
+      start method ("spawn" avoids forking a parent that already holds a JVM).
+    """
+    grid = {k: list(v) for k, v in grid.items()}  # one-shot iterables are read once
+    n_workers = max(1, min(max_parallel or os.cpu_count() or 1, grid_size(grid)))
+    return list(_iter_pool(iter_grid(grid), worker, n_workers, 2 * n_workers, True, session, session_retries,
+                           crash_retries, mp_context, _open_journal(journal), outputs))
+
+
+def iter_sweep(grid: Dict[str, Iterable[Any]], worker: Callable[..., Any], max_parallel: int = 1,
+               max_in_flight: Optional[int] = None, ordered: bool = False,
+               reducers: Sequence["RunningMetrics"] = (), session: bool = False, session_retries: int = 3,
+               crash_retries: int = 1, mp_context: Optional[str] = None,
+               journal: Optional[Union[str, Path]] = None,
+               outputs: Callable[[Any], Mapping[str, Any]] = default_outputs
+               ) -> Iterator[Tuple[Dict[str, Any], Any]]:
+    """Yield ``(params, result)`` pairs as runs complete, expanding the grid lazily.
+
+    - ``max_parallel=1`` runs in-process, in grid order; worker exceptions propagate.
+    - ``max_parallel>1`` (None: all cores) uses a process pool as `parallel_sweep` does
+      (sessions, failure isolation, crash retries). At most ``max_in_flight`` points
+      (default 2*max_parallel) are submitted or, with ``ordered=True``, waiting for an
+      earlier point, so memory stays bounded however large the grid is. Pairs come in
+      completion order unless ``ordered``.
+    - Every yielded pair is fed to each of ``reducers`` (e.g. `RunningMetrics`) first.
+    - ``journal`` / ``outputs`` as in `sweep`.
+    """
+    grid = {k: list(v) for k, v in grid.items()}  # one-shot iterables are read once
+    return iter_points(iter_grid(grid), worker, max_parallel=max_parallel, max_in_flight=max_in_flight,
+                       ordered=ordered, reducers=reducers, session=session, session_retries=session_retries,
+                       crash_retries=crash_retries, mp_context=mp_context, journal=journal, outputs=outputs,
+                       n_points=grid_size(grid))
+
+
+def iter_points(points: Iterable[Dict[str, Any]], worker: Callable[..., Any], max_parallel: int = 1,
+                max_in_flight: Optional[int] = None, ordered: bool = False,
+                reducers: Sequence["RunningMetrics"] = (), session: bool = False, session_retries: int = 3,
+                crash_retries: int = 1, mp_context: Optional[str] = None,
+                journal: Optional[Union[str, Path]] = None,
+                outputs: Callable[[Any], Mapping[str, Any]] = default_outputs,
+                n_points: Optional[int] = None, isolate: bool = False) -> Iterator[Tuple[Dict[str, Any], Any]]:
+    """`iter_sweep` over an explicit iterable of parameter dicts (e.g. adaptive designs).
+
+    ``n_points`` (default ``len(points)`` when available) caps the worker count;
+    ``isolate=True`` turns in-process worker exceptions into `SweepFailure` results too.
+    """
+    jr = _open_journal(journal)
+    if max_parallel == 1:
+        pairs = _iter_inline(points, worker, jr, outputs, isolate)
+    else:
+        if n_points is None and hasattr(points, "__len__"):
+            n_points = len(points)
+        n_workers = max(1, min(max_parallel or os.cpu_count() or 1, n_points or os.cpu_count() or 1))
+        pairs = _iter_pool(iter(points), worker, n_workers, max_in_flight or 2 * n_workers, ordered,
+                           session, session_retries, crash_retries, mp_context, jr, outputs)
+    for cfg, res in pairs:
+        for r in reducers:
+            r.update(cfg, res)
+        yield cfg, res
+
+
+def reduce_sweep(grid: Dict[str, Iterable[Any]], worker: Callable[..., Any], reducers: Sequence["RunningMetrics"],
+                 **kwargs) -> Sequence["RunningMetrics"]:
+    """Run `iter_sweep` for its ``reducers`` only; no result is kept."""
+    for _ in iter_sweep(grid, worker, reducers=reducers, **kwargs):
+        pass
+    return reducers
+
+
+def _iter_inline(points: Iterable[Dict[str, Any]], worker: Callable, jr, outputs: Callable,
+                 isolate: bool = False):
+    for i, cfg in enumerate(points):
+        rec = jr.verified(cfg) if jr is not None else None
+        if rec is not None:
+            yield cfg, rec["result"]
+            continue
+        if isolate:
+            try:
+                res = worker(cfg)
+            except Exception as e:  # noqa: BLE001
+                res = SweepFailure(i, cfg, type(e).__name__, str(e), traceback.format_exc())
+        else:
+            res = worker(cfg)
+        _journal(jr, cfg, res, outputs)
+        yield cfg, res
+
+
+def _journal(jr, cfg: Dict[str, Any], res: Any, outputs: Callable) -> None:
+    if jr is None:
+        return
+    if isinstance(res, SweepFailure):
+        jr.append(cfg, {"error": res.error, "message": res.message}, status="failed")
+    else:
+        jr.append(cfg, res, outputs(res))
+
+
+def _iter_pool(points: Iterable[Dict[str, Any]], worker: Callable, n_workers: int, max_in_flight: int,
+               ordered: bool, session: bool, session_retries: int, crash_retries: int,
+               mp_context: Optional[str], jr, outputs: Callable) -> Iterator[Tuple[Dict[str, Any], Any]]:
+    pool_kwargs = dict(mp_context=multiprocessing.get_context(mp_context) if mp_context else None,
+                       initializer=_init_worker, initargs=(worker, session, session_retries))
+    source = enumerate(points)
+    pending: Dict[Any, Tuple[int, Dict[str, Any]]] = {}
+    held: Dict[int, Tuple[Dict[str, Any], Any]] = {}  # finished, waiting for an earlier index
+    next_index = 0
+    exhausted = False
+    pool = ProcessPoolExecutor(max_workers=n_workers, **pool_kwargs)
+    try:
+        while True:
+            ready: List[Tuple[int, Dict[str, Any], Any]] = []
+            while not exhausted and len(pending) + len(held) < max_in_flight:
+                try:
+                    i, cfg = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                rec = jr.verified(cfg) if jr is not None else None
+                if rec is not None:
+                    ready.append((i, cfg, rec["result"]))
+                else:
+                    pending[pool.submit(_run_point, i, cfg)] = (i, cfg)
+            if not pending and not ready:
+                break
+            lost: List[Tuple[int, Dict[str, Any]]] = []
+            if pending:
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                for fut in done:
+                    i, cfg = pending.pop(fut)
+                    try:
+                        res = fut.result()
+                    except BrokenProcessPool:
+                        lost.append((i, cfg))
+                        continue
+                    except Exception as e:  # noqa: BLE001 - e.g. unpicklable result
+                        res = SweepFailure(i, cfg, type(e).__name__, str(e))
+                    _journal(jr, cfg, res, outputs)
+                    ready.append((i, cfg, res))
+            if lost:  # the pool is dead: everything still pending went with it
+                lost += list(pending.values())
+                pending.clear()
+                pool.shutdown(wait=True)
+                for i, cfg in sorted(lost, key=lambda p: p[0]):
+                    res = _retry_alone(i, cfg, crash_retries, pool_kwargs)
+                    _journal(jr, cfg, res, outputs)
+                    ready.append((i, cfg, res))
+                pool = ProcessPoolExecutor(max_workers=n_workers, **pool_kwargs)
+            if not ordered:
+                for _, cfg, res in ready:
+                    yield cfg, res
+                continue
+            for i, cfg, res in ready:
+                held[i] = (cfg, res)
+            while next_index in held:
+                yield held.pop(next_index)
+                next_index += 1
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _retry_alone(i: int, cfg: Dict[str, Any], crash_retries: int, pool_kwargs: Dict[str, Any]) -> Any:
+    """Re-run a point lost with a dead worker in its own process, so a crash is attributed
+    to the point that caused it rather than to its neighbours in the pool."""
+    for _ in range(int(crash_retries)):
+        with ProcessPoolExecutor(max_workers=1, **pool_kwargs) as pool:
+            fut = pool.submit(_run_point, i, cfg)
+            try:
+                return fut.result()
+            except BrokenProcessPool:
+                continue
+            except Exception as e:  # noqa: BLE001
+                return SweepFailure(i, cfg, type(e).__name__, str(e))
+    return SweepFailure(i, cfg, "BrokenProcessPool", f"worker process died on this point ({int(crash_retries)} retries)")
+
+
+@dataclass
+class _Moments:
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+    argmin: Optional[Dict[str, Any]] = None
+    argmax: Optional[Dict[str, Any]] = None
+
+    def add(self, x: float, cfg: Dict[str, Any]) -> None:
+        self.count += 1
+        d = x - self.mean
+        self.mean += d / self.count
+        self.m2 += d * (x - self.mean)
+        if x < self.min:
+            self.min, self.argmin = x, dict(cfg)
+        if x > self.max:
+            self.max, self.argmax = x, dict(cfg)
+
+
+@dataclass
+class RunningMetrics:
+    """Streaming count/mean/std/min/max (with the params of the extremes) of scalar metrics.
+
+    ``metrics`` maps a name to a result key or to a callable ``result -> float``. Failed
+    points (`SweepFailure`) and results without a finite value are counted, not averaged.
+    """
+    metrics: Mapping[str, Union[str, Callable[[Any], float]]]
+    n_points: int = 0
+    n_failed: int = 0
+    moments: Dict[str, _Moments] = field(default_factory=dict)
+
+    def update(self, cfg: Dict[str, Any], result: Any) -> None:
+        self.n_points += 1
+        if isinstance(result, SweepFailure):
+            self.n_failed += 1
+            return
+        for name, get in self.metrics.items():
+            try:
+                x = float(get(result) if callable(get) else result[get])
+            except (KeyError, IndexError, TypeError, ValueError):
+                continue
+            if math.isfinite(x):
+                self.moments.setdefault(name, _Moments()).add(x, cfg)
+
+    def summary(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"n_points": self.n_points, "n_failed": self.n_failed}
+        for name, m in self.moments.items():
+            std = math.sqrt(m.m2 / (m.count - 1)) if m.count > 1 else 0.0
+            out[name] = {"count": m.count, "mean": m.mean, "std": std, "min": m.min, "max": m.max,
+                         "argmin": m.argmin, "argmax": m.argmax}
+        return out
+
+
+def failures(results: List[Tuple[Dict[str, Any], Any]]) -> List[SweepFailure]:
+    """The `SweepFailure` entries of a sweep result list."""
+    return [r for _, r in results if isinstance(r, SweepFailure)]
+
 
+def manifest_runs(results: List[Tuple[Dict[str, Any], Any]], prefix: str = "run",
+                  outputs: Callable[[Any], Mapping[str, Any]] = default_outputs) -> List[Dict[str, Any]]:
+    """`write_sweep_manifest` run entries for a sweep result list (failures carry their error)."""
+    runs = []
+    for i, (cfg, res) in enumerate(results):
+        run: Dict[str, Any] = {"run_id": f"{prefix}-{i:04d}", "params": dict(cfg)}
+        if isinstance(res, SweepFailure):
+            run.update(status="failed", error={"type": res.error, "message": res.message})
+        else:
+            run.update(status="ok", outputs={k: str(v) for k, v in outputs(res).items()},
+                       metrics={k: v for k, v in res.items() if k != "outputs"} if isinstance(res, dict)
+                       else {"result": res})
+        runs.append(run)
+    return runs
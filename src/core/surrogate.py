@@ -0,0 +1,275 @@
+"""
+Gaussian-process surrogates trained on sweep manifests.
+
+A sweep manifest (`io.sweep_manifest`) records ``params`` and ``metrics`` per run; a
+`GaussianProcessSurrogate` learns one metric (e.g. peak T, mass loss) as a function of a
+few inputs (A_PP, w0, E_PP_total, R, ...):
+
+- inputs are optionally log-transformed (``log_inputs``) and standardized, the output
+  optionally log-transformed (``log_output``, for positive metrics spanning decades);
+- ARD squared-exponential kernel plus noise, hyperparameters by maximizing the log marginal
+  likelihood (analytic gradient, Adam steps in log space; NumPy only);
+- `predict(X)` is vectorized over rows (chunked) and returns mean, std and a 95 % band;
+  `confident(X, rtol)` marks points whose band is narrow enough to skip a COMSOL run;
+- `save` / `load` use a plain ``.npz`` (no pickle).
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .errors import ConfigError
+
+Z95 = 1.959963984540054
+
+
+def _lookup(record: Mapping[str, Any], name: str) -> Any:
+    """``name`` from a flat, dotted (``laser.A_PP``) or nested record; None if absent."""
+    if name in record:
+        return record[name]
+    node: Any = record
+    for part in name.split("."):
+        if not isinstance(node, Mapping) or part not in node:
+            node = None
+            break
+        node = node[part]
+    if node is not None:
+        return node
+    leaf = name.split(".")[-1]
+    for key, value in record.items():
+        if str(key).split(".")[-1] == leaf:
+            return value
+        if isinstance(value, Mapping):
+            found = _lookup(value, leaf)
+            if found is not None:
+                return found
+    return None
+
+
+def dataset_from_runs(runs: Iterable[Mapping[str, Any]], inputs: Sequence[str], output: str
+                      ) -> Tuple[np.ndarray, np.ndarray]:
+    """(X, y) from manifest run entries; inputs come from ``params``, the output from ``metrics``.
+
+    Runs missing a value, or with a non-finite one (failed runs), are skipped.
+    """
+    X, y = [], []
+    for run in runs:
+        params, metrics = run.get("params") or {}, run.get("metrics") or {}
+        try:
+            row = [float(_lookup(params, name)) for name in inputs]
+            value = float(_lookup(metrics, output))
+        except (TypeError, ValueError):
+            continue
+        if np.all(np.isfinite(row)) and np.isfinite(value):
+            X.append(row)
+            y.append(value)
+    return np.asarray(X, dtype=float).reshape(-1, len(inputs)), np.asarray(y, dtype=float)
+
+
+def dataset_from_manifests(paths: Union[str, Path, Iterable[Union[str, Path]]], inputs: Sequence[str],
+                           output: str) -> Tuple[np.ndarray, np.ndarray]:
+    """`dataset_from_runs` over one or several manifest files."""
+    from ..io.sweep_manifest import read_sweep_manifest
+
+    paths = [paths] if isinstance(paths, (str, Path)) else list(paths)
+    runs: List[Mapping[str, Any]] = []
+    for p in paths:
+        runs.extend(read_sweep_manifest(Path(p)))
+    return dataset_from_runs(runs, inputs, output)
+
+
+@dataclass
+class Prediction:
+    """Predictive mean/std (in the transformed output space) and 95 % band in output units."""
+    mean: np.ndarray
+    std: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+
+
+class GaussianProcessSurrogate:
+    """GP regression of one metric over named inputs (see module docstring)."""
+
+    def __init__(self, inputs: Sequence[str], output: str, log_inputs: Sequence[str] = (),
+                 log_output: bool = False):
+        unknown = set(log_inputs) - set(inputs)
+        if unknown:
+            raise ConfigError(f"log_inputs {sorted(unknown)} are not among the inputs {list(inputs)}")
+        self.inputs = list(inputs)
+        self.output = output
+        self.log_inputs = [name in set(log_inputs) for name in self.inputs]
+        self.log_output = bool(log_output)
+        self.theta: Optional[np.ndarray] = None  # log length-scales..., log sigma_f, log sigma_n
+
+    # -- transforms ------------------------------------------------------------------------
+    def _x(self, X) -> np.ndarray:
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        if X.shape[1] != len(self.inputs):
+            raise ValueError(f"Expected {len(self.inputs)} input columns {self.inputs}, got {X.shape[1]}")
+        X = X.copy()
+        logs = np.asarray(self.log_inputs)
+        if logs.any():
+            if np.any(X[:, logs] <= 0.0):
+                raise ValueError("Log-transformed inputs must be positive")
+            X[:, logs] = np.log(X[:, logs])
+        return X
+
+    def _y(self, y) -> np.ndarray:
+        y = np.asarray(y, dtype=float)
+        if self.log_output:
+            if np.any(y <= 0.0):
+                raise ValueError(f"log_output needs positive '{self.output}' values")
+            return np.log(y)
+        return y
+
+    def _y_inv(self, z: np.ndarray) -> np.ndarray:
+        return np.exp(z) if self.log_output else z
+
+    # -- training --------------------------------------------------------------------------
+    def _kernel(self, A: np.ndarray, B: np.ndarray, theta: np.ndarray) -> np.ndarray:
+        ell, sf2 = np.exp(theta[:-2]), math.exp(2.0 * theta[-2])
+        a, b = A / ell, B / ell
+        d2 = np.maximum((a * a).sum(1)[:, None] + (b * b).sum(1)[None, :] - 2.0 * a @ b.T, 0.0)
+        return sf2 * np.exp(-0.5 * d2)
+
+    def _lml(self, theta: np.ndarray, grad: bool = True):
+        Z, z = self._Z, self._z
+        n = z.size
+        Kf = self._kernel(Z, Z, theta)
+        K = Kf + (math.exp(2.0 * theta[-1]) + 1e-10) * np.eye(n)
+        try:
+            L = np.linalg.cholesky(K)
+        except np.linalg.LinAlgError:
+            return -np.inf, np.zeros_like(theta)
+        alpha = np.linalg.solve(L.T, np.linalg.solve(L, z))
+        lml = -0.5 * z @ alpha - np.log(np.diag(L)).sum() - 0.5 * n * math.log(2.0 * math.pi)
+        if not grad:
+            return lml, None
+        Linv = np.linalg.solve(L, np.eye(n))
+        W = np.outer(alpha, alpha) - Linv.T @ Linv
+        WK = W * Kf
+        g = np.empty_like(theta)
+        for k in range(Z.shape[1]):
+            diff = Z[:, k][:, None] - Z[:, k][None, :]
+            g[k] = 0.5 * np.sum(WK * diff * diff) / math.exp(2.0 * theta[k])
+        g[-2] = np.sum(WK)
+        g[-1] = math.exp(2.0 * theta[-1]) * np.trace(W)
+        return lml, g
+
+    def fit(self, X, y, max_iter: int = 200, lr: float = 0.05,
+            noise_bounds: Tuple[float, float] = (1e-6, 1.0)) -> "GaussianProcessSurrogate":
+        """Train on rows ``X`` (columns as ``inputs``) and values ``y``."""
+        Xt, yt = self._x(X), self._y(y)
+        if Xt.shape[0] < 2 or Xt.shape[0] != yt.size:
+            raise ValueError("Need at least two training rows with matching X and y")
+        self._x_mean, self._x_std = Xt.mean(0), Xt.std(0)
+        self._x_std[self._x_std == 0.0] = 1.0
+        self._y_mean, self._y_std = float(yt.mean()), float(yt.std()) or 1.0
+        self._Z = (Xt - self._x_mean) / self._x_std
+        self._z = (yt - self._y_mean) / self._y_std
+
+        d = self._Z.shape[1]
+        lo = np.r_[np.full(d, math.log(1e-2)), math.log(1e-2), math.log(noise_bounds[0])]
+        hi = np.r_[np.full(d, math.log(1e2)), math.log(1e2), math.log(noise_bounds[1])]
+        theta = np.r_[np.zeros(d), 0.0, math.log(0.1)]
+        best, best_lml = theta.copy(), -np.inf
+        m, v = np.zeros_like(theta), np.zeros_like(theta)
+        for it in range(1, int(max_iter) + 1):  # Adam ascent on the log marginal likelihood
+            lml, g = self._lml(theta)
+            if lml > best_lml:
+                best, best_lml = theta.copy(), lml
+            if not np.isfinite(lml):
+                theta = 0.5 * (theta + best)
+                continue
+            m = 0.9 * m + 0.1 * g
+            v = 0.999 * v + 0.001 * g * g
+            step = lr * (m / (1 - 0.9 ** it)) / (np.sqrt(v / (1 - 0.999 ** it)) + 1e-8)
+            theta = np.clip(theta + step, lo, hi)
+            if np.max(np.abs(step)) < 1e-5:
+                break
+        self._set_theta(best)
+        self.log_marginal_likelihood = float(best_lml)
+        return self
+
+    def _set_theta(self, theta: np.ndarray) -> None:
+        self.theta = np.asarray(theta, dtype=float)
+        K = self._kernel(self._Z, self._Z, self.theta) + (math.exp(2.0 * self.theta[-1]) + 1e-10) * np.eye(self._z.size)
+        self._L = np.linalg.cholesky(K)
+        self._alpha = np.linalg.solve(self._L.T, np.linalg.solve(self._L, self._z))
+        self._Linv = np.linalg.solve(self._L, np.eye(self._z.size))  # variance by one matmul per chunk
+
+    @classmethod
+    def from_manifests(cls, paths, inputs: Sequence[str], output: str, log_inputs: Sequence[str] = (),
+                       log_output: bool = False, **fit_kwargs) -> "GaussianProcessSurrogate":
+        """Train on the runs of one or several sweep manifests."""
+        X, y = dataset_from_manifests(paths, inputs, output)
+        if y.size < 2:
+            raise ConfigError(f"Manifests hold {y.size} usable runs with {list(inputs)} and '{output}'",
+                              suggested_fix="Check the params/metrics key names in the manifest")
+        return cls(inputs, output, log_inputs, log_output).fit(X, y, **fit_kwargs)
+
+    # -- inference -------------------------------------------------------------------------
+    def _check_fitted(self) -> None:
+        if self.theta is None:
+            raise RuntimeError("Surrogate is not trained; call fit() or load()")
+
+    def predict(self, X, chunk: int = 4096) -> Prediction:
+        """Vectorized prediction for the rows of ``X`` (or a mapping name -> array)."""
+        self._check_fitted()
+        if isinstance(X, Mapping):
+            X = np.column_stack(np.broadcast_arrays(*[np.asarray(X[n], dtype=float).ravel() for n in self.inputs]))
+        Z = (self._x(X) - self._x_mean) / self._x_std
+        sf2 = math.exp(2.0 * self.theta[-2])
+        mean, var = np.empty(Z.shape[0]), np.empty(Z.shape[0])
+        for s in range(0, Z.shape[0], chunk):
+            Ks = self._kernel(Z[s:s + chunk], self._Z, self.theta)
+            mean[s:s + chunk] = Ks @ self._alpha
+            w = self._Linv @ Ks.T
+            var[s:s + chunk] = np.maximum(sf2 - (w * w).sum(0), 0.0)
+        mu = self._y_mean + self._y_std * mean
+        sd = self._y_std * np.sqrt(var)
+        return Prediction(mean=mu, std=sd, lower=self._y_inv(mu - Z95 * sd), upper=self._y_inv(mu + Z95 * sd))
+
+    def confident(self, X, rtol: float = 0.05) -> np.ndarray:
+        """True where the 95 % band lies within ``rtol`` of the predicted value."""
+        p = self.predict(X)
+        center = self._y_inv(p.mean)
+        return 0.5 * (p.upper - p.lower) <= rtol * np.abs(center)
+
+    # -- persistence -----------------------------------------------------------------------
+    def save(self, path: Union[str, Path]) -> Path:
+        self._check_fitted()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        meta = {"inputs": self.inputs, "output": self.output, "log_inputs": self.log_inputs,
+                "log_output": self.log_output, "y_mean": self._y_mean, "y_std": self._y_std}
+        with path.open("wb") as f:
+            np.savez(f, meta=np.array(json.dumps(meta)), theta=self.theta, Z=self._Z, z=self._z,
+                     x_mean=self._x_mean, x_std=self._x_std)
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "GaussianProcessSurrogate":
+        with np.load(Path(path), allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            log_inputs = [n for n, flag in zip(meta["inputs"], meta["log_inputs"]) if flag]
+            gp = cls(meta["inputs"], meta["output"], log_inputs, meta["log_output"])
+            gp._Z, gp._z = data["Z"], data["z"]
+            gp._x_mean, gp._x_std = data["x_mean"], data["x_std"]
+            gp._y_mean, gp._y_std = meta["y_mean"], meta["y_std"]
+            gp._set_theta(data["theta"])
+        return gp
+
+
+__all__ = [
+    "Prediction",
+    "GaussianProcessSurrogate",
+    "dataset_from_runs",
+    "dataset_from_manifests",
+]
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from typing import Callable
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Union
+
+import numpy as np
+
+R_GAS = 8.314  # J/(mol K), same value as the COMSOL models' R_gas
+_LN10 = float(np.log(10.0))
 
 
 def p_sat_kumar(T: float, P_ref: float, Lv_mol: float, T_boil: float, R_const: float = 8.314) -> float:
@@ -11,31 +17,117 @@ def p_sat_kumar(T: float, P_ref: float, Lv_mol: float, T_boil: float, R_const: f
     - Lv_mol: molar latent heat [J/mol]
     - T_boil: boiling temperature [K]
     - R_const: universal gas constant [J/mol/K]
+
+    Accepts scalars or NumPy arrays for T.
     """
-    from math import exp
+    return P_ref * np.exp((Lv_mol / R_const) * (1.0 / T_boil - 1.0 / np.asarray(T, dtype=float)))
 
-    return P_ref * exp((Lv_mol / R_const) * (1.0 / T_boil - 1.0 / T))
 
+@dataclass(frozen=True)
+class VaporPressureLaw:
+    """Saturation-pressure law of a material option, evaluated over NumPy arrays of T [K].
 
-def get_p_sat_callable(option: str | None) -> Callable[[float], float]:
-    """Provide a p_sat(T) function based on a named option.
+    kind="clausius_clapeyron": Psat = P_ref*exp((Lv*M/R)*(1/T_boil - 1/T))   (Kumar `Psat`)
+    kind="log10":              Psat = scale*10^(A + B/T)                    (Antoine-like fits)
+    """
+    name: str
+    M: float                      # molar mass [kg/mol]
+    kind: str = "clausius_clapeyron"
+    Lv: Optional[float] = None    # latent heat of vaporisation [J/kg]
+    T_boil: Optional[float] = None
+    P_ref: float = 101325.0
+    A: Optional[float] = None
+    B: Optional[float] = None
+    scale: float = 1.0            # Pa per unit of the fitted pressure (e.g. Torr → Pa)
+    T_range: Optional[tuple] = None  # validity range of the fit [K], informational
+    R: float = R_GAS              # gas constant [J/(mol K)] (match the model's R_gas)
+
+    def psat(self, T) -> np.ndarray:
+        T = np.asarray(T, dtype=float)
+        if self.kind == "clausius_clapeyron":
+            return self.P_ref * np.exp((self.Lv * self.M / self.R) * (1.0 / self.T_boil - 1.0 / T))
+        return self.scale * np.exp((self.A + self.B / T) * _LN10)
+
+    def dpsat_dT(self, T) -> np.ndarray:
+        T = np.asarray(T, dtype=float)
+        if self.kind == "clausius_clapeyron":
+            return self.psat(T) * (self.Lv * self.M / self.R) / (T * T)
+        return self.psat(T) * (-self.B * _LN10) / (T * T)
+
+
+MATERIALS: Dict[str, VaporPressureLaw] = {
+    # Kumar 2D COMSOL constants (KUMAR-2D/global_parameters_v8.txt)
+    "kumar_sn": VaporPressureLaw("kumar_sn", M=118.71e-3, Lv=2.96e6, T_boil=2875.0, P_ref=101325.0),
+    # Alcock, Itkin, Horrigan (1984) liquid tin fit, log10(p/Torr) = 8.14281 - 1.5332e4/T
+    # (the `p_sat_expr` in laser_parameters_pp_v2.txt)
+    "alcock_sn": VaporPressureLaw("alcock_sn", M=118.71e-3, kind="log10", A=8.14281, B=-1.5332e4,
+                                  scale=1.3332e2, T_range=(505.0, 1850.0)),
+}
+
+
+def register_material(law: VaporPressureLaw) -> None:
+    """Add (or replace) a named vapour-pressure option in `MATERIALS`."""
+    if law.kind not in ("clausius_clapeyron", "log10"):
+        raise ValueError(f"Unknown vapor pressure law kind '{law.kind}'")
+    MATERIALS[law.name.lower()] = law
+
+
+def get_material(option: Union[str, VaporPressureLaw]) -> VaporPressureLaw:
+    """Registered law by (case-insensitive) name; a `VaporPressureLaw` passes through."""
+    if isinstance(option, VaporPressureLaw):
+        return option
+    try:
+        return MATERIALS[option.lower()]
+    except (KeyError, AttributeError):
+        raise KeyError(f"Unknown p_sat option '{option}'. Known: {sorted(MATERIALS)}") from None
 
-    Currently supports 'kumar_sn' (tin, Kumar form with typical constants).
-    Defaults to ambient pressure (no evaporation) if option is None or unknown.
+
+def psat(T, material: Union[str, VaporPressureLaw] = "kumar_sn") -> np.ndarray:
+    """Saturation pressure Psat(T) [Pa] for a registered material option."""
+    return get_material(material).psat(T)
+
+
+def dpsat_dT(T, material: Union[str, VaporPressureLaw] = "kumar_sn") -> np.ndarray:
+    """Analytic dPsat/dT [Pa/K]."""
+    return get_material(material).dpsat_dT(T)
+
+
+def j_evap(T, material: Union[str, VaporPressureLaw] = "kumar_sn", beta_r: float = 0.0, form: str = "kumar",
+           HK_gamma: float = 1.0, p_amb: float = 0.0) -> np.ndarray:
+    """Evaporative mass flux J_evap(T) [kg/(m^2 s)].
+
+    form="kumar": (1 - beta_r)*Psat*sqrt(M/(2*pi*R*T))       (ModelBuilder `J_evap`)
+    form="hk":    HK_gamma*(Psat - p_amb)/sqrt(2*pi*R*T/M)    (Fresnel build `J_evap`)
     """
-    if option and option.lower() == "kumar_sn":
-        # Typical tin values: Lv_sn ~ 2.96e6 J/kg; M_sn ~ 118.71e-3 kg/mol → Lv_mol
-        Lv_mol = 2.96e6 * 118.71e-3
-        T_boil = 2875.0
-        P_ref = 101325.0
+    law = get_material(material)
+    T = np.asarray(T, dtype=float)
+    p = law.psat(T)
+    kin = np.sqrt(law.M / (2.0 * np.pi * law.R * T))
+    if form == "kumar":
+        return (1.0 - beta_r) * p * kin
+    if form == "hk":
+        return HK_gamma * (p - p_amb) * kin
+    raise ValueError("form must be 'kumar' or 'hk'")
 
-        def f(T: float) -> float:
-            return p_sat_kumar(T, P_ref=P_ref, Lv_mol=Lv_mol, T_boil=T_boil)
 
-        return f
+def recoil_pressure(T, material: Union[str, VaporPressureLaw] = "kumar_sn", beta_r: float = 0.0,
+                    coeff: Optional[float] = None) -> np.ndarray:
+    """Recoil pressure [Pa]: (1 + beta_r/2)*Psat (Kumar boundary stress) or coeff*Psat."""
+    p = psat(T, material)
+    return (coeff if coeff is not None else 1.0 + 0.5 * beta_r) * p
 
-    def ambient(T: float) -> float:  # fallback
-        return 0.0
 
-    return ambient
+def get_p_sat_callable(option: str | None) -> Callable:
+    """Provide a p_sat(T) function based on a named option.
+
+    Supports the options in `MATERIALS` ('kumar_sn', 'alcock_sn', ...); the callable is
+    vectorized over NumPy arrays of T. Defaults to ambient pressure (no evaporation) if
+    option is None or unknown.
+    """
+    if option and option.lower() in MATERIALS:
+        return MATERIALS[option.lower()].psat
+
+    def ambient(T):  # fallback
+        return np.zeros_like(np.asarray(T, dtype=float))
 
+    return ambient
@@ -2,5 +2,13 @@
 
 Place optional CSV/JSON/Parquet readers/writers here in future work. Current
 code keeps legacy file IO in its existing modules.
+
+- absorptivity: process-wide, interpolating index of the Sizyuk A(λ)/R(λ) tables.
+- results: manifests, result comparison and `write_comsol_table` (COMSOL Table CSV layout).
+- sweep_manifest: JSON index of sweep runs (`write_sweep_manifest` / `read_sweep_manifest`).
+- sweep_journal: append-only, fsynced run journal for crash-resumable sweeps.
+- result_cache: content-addressed cache of run outputs (config hash + variant + code version),
+  materialized by reflink/hardlink, with LRU eviction under a size budget.
+- energy_audit: bulk energy-budget closure (E_abs vs sensible + latent + radiated) over run tables.
 """
 
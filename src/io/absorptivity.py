@@ -0,0 +1,131 @@
+"""Process-wide index of precomputed absorptivity/reflectivity tables.
+
+`load_table` parses a Sizyuk CSV (``lambda_um`` plus a value column) once per process,
+sorts it by wavelength and keeps it in a small LRU keyed by (path, mtime, size), so
+every consumer (`core.build`, `pp_model.load_fresnel_tables`, sweeps) shares one parsed
+copy and picks up regenerated tables automatically. `TableIndex` answers A(λ) queries by
+linear interpolation (vectorized for arrays, pure-Python binary search for scalars) or,
+with ``method="nearest"``, by the legacy nearest-row rule.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+SIZYUK_TABLE_DIR = Path("data") / "derived" / "sizyuk"
+ABSORPTIVITY_CSV = "absorptivity_vs_lambda.csv"
+REFLECTIVITY_CSV = "reflectivity_vs_lambda.csv"
+MAX_CACHED_TABLES = 16
+
+_CACHE: "OrderedDict[Tuple, TableIndex]" = OrderedDict()
+_LOCK = threading.Lock()
+
+
+class TableIndex:
+    """Sorted 1D table y(λ) with clamped interpolation outside the tabulated range."""
+
+    def __init__(self, lambda_um, values, column: str = "A", path: Optional[Path] = None):
+        lam = np.asarray(lambda_um, dtype=float).ravel()
+        val = np.asarray(values, dtype=float).ravel()
+        mask = np.isfinite(lam) & np.isfinite(val)
+        lam, val = lam[mask], val[mask]
+        if lam.size == 0:
+            raise ValueError(f"Empty {column} table{f' in {path}' if path else ''}")
+        lam, first = np.unique(lam, return_index=True)  # sorted; duplicate λ keep the first row
+        self.lambda_um = lam
+        self.values = val[first]
+        self.column = column
+        self.path = path
+        self._lam_list = lam.tolist()
+        self._val_list = self.values.tolist()
+        self.lambda_um.flags.writeable = False
+        self.values.flags.writeable = False
+
+    def __len__(self) -> int:
+        return self.lambda_um.size
+
+    def __call__(self, lambda_um, method: str = "linear"):
+        """Value at ``lambda_um`` (µm); scalars return float, arrays keep their shape."""
+        if method not in ("linear", "nearest"):
+            raise ValueError("method must be 'linear' or 'nearest'")
+        if isinstance(lambda_um, (float, int)) or np.ndim(lambda_um) == 0:
+            return self._scalar(float(lambda_um), method)
+        lam = np.asarray(lambda_um, dtype=float)
+        if method == "linear":
+            return np.interp(lam, self.lambda_um, self.values)
+        i = np.clip(np.searchsorted(self.lambda_um, lam), 1, max(len(self) - 1, 1))
+        lo = np.maximum(i - 1, 0)
+        pick = np.where(np.abs(lam - self.lambda_um[lo]) <= np.abs(self.lambda_um[i] - lam), lo, i)
+        return self.values[pick]
+
+    def _scalar(self, lam: float, method: str) -> float:
+        xs, ys = self._lam_list, self._val_list
+        i = bisect.bisect_left(xs, lam)
+        if i == 0:
+            return ys[0]
+        if i == len(xs):
+            return ys[-1]
+        x0, x1 = xs[i - 1], xs[i]
+        if method == "nearest":
+            return ys[i - 1] if lam - x0 <= x1 - lam else ys[i]
+        return ys[i - 1] + (ys[i] - ys[i - 1]) * (lam - x0) / (x1 - x0)
+
+    def to_frame(self):
+        """pandas DataFrame with columns ``lambda_um`` and the value column."""
+        import pandas as pd
+
+        return pd.DataFrame({"lambda_um": self.lambda_um, self.column: self.values})
+
+
+def _read_csv(path: Path, column: Optional[str]) -> TableIndex:
+    with path.open("r", encoding="utf-8") as f:
+        header = [h.strip() for h in f.readline().split(",")]
+    if column is None:
+        column = next((h for h in header if h != "lambda_um"), None)
+    if "lambda_um" not in header or column not in header:
+        raise ValueError(f"{path} must have columns 'lambda_um' and '{column}'")
+    data = np.loadtxt(path, delimiter=",", skiprows=1, ndmin=2,
+                      usecols=(header.index("lambda_um"), header.index(column)))
+    return TableIndex(data[:, 0], data[:, 1], column=column, path=path)
+
+
+def load_table(path: Union[str, Path], column: Optional[str] = None) -> TableIndex:
+    """Return the shared `TableIndex` for a CSV, parsing it only when new or modified.
+
+    ``column`` defaults to the first non-``lambda_um`` column. At most
+    `MAX_CACHED_TABLES` tables are kept (least recently used evicted first).
+    """
+    path = Path(path).resolve()
+    st = path.stat()
+    key = (str(path), st.st_mtime_ns, st.st_size, column)
+    with _LOCK:
+        hit = _CACHE.get(key)
+        if hit is not None:
+            _CACHE.move_to_end(key)
+            return hit
+    table = _read_csv(path, column)
+    with _LOCK:
+        # drop superseded versions of the same file before inserting
+        for stale in [k for k in _CACHE if k[0] == key[0] and k[3] == column]:
+            del _CACHE[stale]
+        _CACHE[key] = table
+        while len(_CACHE) > MAX_CACHED_TABLES:
+            _CACHE.popitem(last=False)
+    return table
+
+
+def clear_cache() -> None:
+    with _LOCK:
+        _CACHE.clear()
+
+
+def load_sizyuk_absorptivity(repo_root: Path) -> Optional[TableIndex]:
+    """A(λ) index for ``<repo_root>/data/derived/sizyuk/absorptivity_vs_lambda.csv`` or None."""
+    f = Path(repo_root) / SIZYUK_TABLE_DIR / ABSORPTIVITY_CSV
+    return load_table(f, "A") if f.is_file() else None
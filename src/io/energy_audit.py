@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+"""Energy-budget audit of exported run tables.
+
+Checks, for each run directory holding ``pp_energy_vs_time.csv``, ``pp_T_vs_time.csv`` and
+``pp_massloss_vs_time.csv`` (COMSOL Table exports or the `core.solvers` equivalents), that
+
+    E_abs(t) = E_sens(t) + E_lat(t) + E_rad(t)
+
+with E_x = integral of P_x dt and E_sens = integral of m(t)*cp(T)*dT, m(t) = m0 - integral of
+mdot dt. m0 is rho*pi*R0^2 (planar 2D build, per metre) or rho*4/3*pi*R0^3 (sphere) from the
+first row of ``pp_radius_vs_time.csv`` unless given. Runs are padded to a common length
+(repeating the last sample adds nothing to the integrals) and audited as 2D arrays in one
+pass; runs whose max |residual|/E_abs(t_end) exceeds ``threshold`` are flagged.
+"""
+
+import argparse
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .results import read_result_table
+
+ENERGY_FILE = "pp_energy_vs_time.csv"
+T_FILE = "pp_T_vs_time.csv"
+MASS_FILE = "pp_massloss_vs_time.csv"
+RADIUS_FILE = "pp_radius_vs_time.csv"
+GEOMETRIES = ("planar", "sphere")
+
+
+@dataclass
+class _RunSeries:
+    t: np.ndarray
+    T: np.ndarray
+    mdot: np.ndarray
+    P_abs: np.ndarray
+    P_lat: np.ndarray
+    P_rad: np.ndarray
+    R0: Optional[float]
+
+
+@dataclass
+class EnergyAudit:
+    """Closure of the energy budget for N runs; 2D arrays are (N, n_t), padded per run."""
+    runs: List[Path]
+    t: np.ndarray
+    E_abs: np.ndarray
+    E_sens: np.ndarray
+    E_lat: np.ndarray
+    E_rad: np.ndarray
+    threshold: float
+    errors: Dict[str, str] = field(default_factory=dict)  # unreadable run -> reason
+
+    @property
+    def residual(self) -> np.ndarray:
+        return self.E_abs - self.E_sens - self.E_lat - self.E_rad
+
+    @property
+    def rel_error(self) -> np.ndarray:
+        """residual(t) relative to the final absorbed energy of each run."""
+        scale = np.abs(self.E_abs[:, -1:]) if self.E_abs.size else np.ones((0, 1))
+        return self.residual / np.where(scale > 0.0, scale, 1.0)
+
+    @property
+    def max_rel_error(self) -> np.ndarray:
+        return np.abs(self.rel_error).max(axis=1) if self.rel_error.size else np.zeros(len(self.runs))
+
+    @property
+    def flagged(self) -> List[str]:
+        """Runs above ``threshold`` plus unreadable ones."""
+        bad = [str(r) for r, e in zip(self.runs, self.max_rel_error) if not e <= self.threshold]
+        return bad + sorted(self.errors)
+
+    def summary(self) -> pd.DataFrame:
+        rows = [{"run": str(r), "E_abs": float(self.E_abs[i, -1]), "E_sens": float(self.E_sens[i, -1]),
+                 "E_lat": float(self.E_lat[i, -1]), "E_rad": float(self.E_rad[i, -1]),
+                 "final_rel_error": float(self.rel_error[i, -1]), "max_rel_error": float(self.max_rel_error[i]),
+                 "flagged": bool(not self.max_rel_error[i] <= self.threshold), "error": None}
+                for i, r in enumerate(self.runs)]
+        rows += [{"run": r, "flagged": True, "error": msg} for r, msg in sorted(self.errors.items())]
+        return pd.DataFrame(rows)
+
+
+def find_runs(root: Union[str, Path]) -> List[Path]:
+    """``root`` itself if it holds an energy table, else every sub-directory that does."""
+    root = Path(root)
+    if (root / ENERGY_FILE).is_file():
+        return [root]
+    return sorted(p.parent for p in root.rglob(ENERGY_FILE))
+
+
+def _column(df: pd.DataFrame, *keys: str) -> Optional[np.ndarray]:
+    for key in keys:
+        for name in df.columns:
+            if str(name).startswith(key) or key in str(name):
+                return df[name].to_numpy(dtype=float)
+    return None
+
+
+def _values(path: Path) -> tuple:
+    """(time, first data column) of a two-column result table."""
+    df = read_result_table(path)
+    return df.iloc[:, 0].to_numpy(dtype=float), df.iloc[:, 1].to_numpy(dtype=float)
+
+
+def _load_run(run: Path) -> _RunSeries:
+    energy = read_result_table(run / ENERGY_FILE)
+    t = energy.iloc[:, 0].to_numpy(dtype=float)
+    P_abs = _column(energy, "P_abs", "q_abs")
+    P_lat = _column(energy, "P_lat", "J_evap")
+    if P_abs is None or P_lat is None:
+        raise ValueError(f"{ENERGY_FILE} lacks P_abs/P_lat columns")
+    P_rad = _column(energy, "P_rad", "q_rad")
+    t_T, T = _values(run / T_FILE)
+    t_m, mdot = _values(run / MASS_FILE)
+    R0 = None
+    if (run / RADIUS_FILE).is_file():
+        R0 = float(_values(run / RADIUS_FILE)[1][0])
+    return _RunSeries(t=t, T=np.interp(t, t_T, T), mdot=np.interp(t, t_m, mdot), P_abs=P_abs, P_lat=P_lat,
+                      P_rad=np.zeros_like(t) if P_rad is None else P_rad, R0=R0)
+
+
+def _stack(series: Sequence[_RunSeries], name: str) -> np.ndarray:
+    n = max(getattr(s, name).size for s in series)
+    return np.stack([np.pad(getattr(s, name), (0, n - getattr(s, name).size), mode="edge") for s in series])
+
+
+def _cumtrapz(y: np.ndarray, t: np.ndarray) -> np.ndarray:
+    out = np.zeros_like(y)
+    out[:, 1:] = np.cumsum(0.5 * (y[:, 1:] + y[:, :-1]) * np.diff(t, axis=1), axis=1)
+    return out
+
+
+def audit_runs(runs: Union[str, Path, Iterable[Union[str, Path]]], threshold: float = 0.05,
+               geometry: str = "planar", props=None, m0: Optional[Union[float, Sequence[float]]] = None
+               ) -> EnergyAudit:
+    """Audit one run directory, a sweep root (see `find_runs`) or an explicit list of runs.
+
+    ``props`` is a `core.properties.TinProperties` (default: its constants, i.e. the config
+    defaults) supplying rho and cp(T). ``m0`` overrides the initial mass per run.
+    """
+    from ..core.properties import TinProperties
+
+    if geometry not in GEOMETRIES:
+        raise ValueError(f"geometry must be one of {GEOMETRIES}")
+    paths = find_runs(runs) if isinstance(runs, (str, Path)) else [Path(r) for r in runs]
+    props = props or TinProperties.from_values()
+
+    loaded, errors = [], {}
+    for p in paths:
+        try:
+            loaded.append((p, _load_run(p)))
+        except Exception as e:  # an unreadable run is itself a finding
+            errors[str(p)] = f"{type(e).__name__}: {e}"
+    ok = [p for p, _ in loaded]
+    series = [s for _, s in loaded]
+    if not series:
+        empty = np.zeros((0, 1))
+        return EnergyAudit(ok, empty, empty, empty, empty, empty, threshold, errors)
+
+    t = _stack(series, "t")
+    T, mdot = _stack(series, "T"), _stack(series, "mdot")
+    E_abs = _cumtrapz(_stack(series, "P_abs"), t)
+    E_lat = _cumtrapz(_stack(series, "P_lat"), t)
+    E_rad = _cumtrapz(_stack(series, "P_rad"), t)
+
+    if m0 is None:
+        R0 = np.array([np.nan if s.R0 is None else s.R0 for s in series])
+        rho = props.rho(T[:, 0])
+        m0 = rho * np.pi * R0 ** 2 if geometry == "planar" else rho * 4.0 / 3.0 * np.pi * R0 ** 3
+    m = np.broadcast_to(np.asarray(m0, dtype=float), (len(series),))[:, None] - _cumtrapz(mdot, t)
+    cp = props.cp(T)
+    E_sens = np.zeros_like(T)
+    E_sens[:, 1:] = np.cumsum(0.25 * (m[:, 1:] + m[:, :-1]) * (cp[:, 1:] + cp[:, :-1]) * np.diff(T, axis=1), axis=1)
+    for i in np.flatnonzero(~np.isfinite(E_sens[:, -1])):
+        errors[str(ok[i])] = f"no initial mass (missing {RADIUS_FILE}; pass m0)"
+    keep = np.isfinite(E_sens[:, -1])
+    return EnergyAudit([p for p, k in zip(ok, keep) if k], t[keep], E_abs[keep], E_sens[keep], E_lat[keep],
+                       E_rad[keep], threshold, errors)
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Check E_abs = E_sens + E_lat + E_rad for exported run tables.")
+    ap.add_argument("path", type=Path, help="Run directory or sweep root")
+    ap.add_argument("--threshold", type=float, default=0.05, help="Max |residual|/E_abs (default: 0.05)")
+    ap.add_argument("--geometry", choices=GEOMETRIES, default="planar", help="Initial-mass geometry")
+    ap.add_argument("--csv", type=Path, default=None, help="Optional path to write the per-run summary")
+    args = ap.parse_args(argv)
+
+    audit = audit_runs(args.path, threshold=args.threshold, geometry=args.geometry)
+    if args.csv:
+        args.csv.parent.mkdir(parents=True, exist_ok=True)
+        audit.summary().to_csv(args.csv, index=False)
+    print(json.dumps({"runs": len(audit.runs) + len(audit.errors), "flagged": audit.flagged}, indent=2))
+    return 1 if audit.flagged else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
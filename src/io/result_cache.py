@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+"""Content-addressed cache of run outputs (skip re-solving identical configurations).
+
+Entries are keyed by sha256 of (resolved config hash, variant, code version: git commit plus
+a hash of uncommitted source changes); the config
+hash is `core.config.loader._content_hash`, i.e. the sorted-key YAML dump of the config plus
+the COMSOL/Java environment variables. Layout under the cache root:
+
+    objects/<key[:2]>/<key>/entry.json   key, result, meta (variant, code version), output
+                                         names, file sizes/hashes, created/last_used times
+    objects/<key[:2]>/<key>/files/...    stored outputs (read-only)
+
+A hit materializes the stored files into the new run directory by reflink (copy-on-write,
+Linux FICLONE), else hardlink, else copy. Cached files are read-only, so a hardlinked output
+cannot be modified in place by accident. Entries are written to a temporary directory and
+renamed into place, so concurrent sweep workers never see partial entries. ``max_bytes``
+bounds the cache size: least recently used entries are evicted after each store.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import stat
+import sys
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Union
+
+from .sweep_journal import file_sha256
+
+LINK_MODES = ("auto", "reflink", "hardlink", "copy")
+_FICLONE = 0x40049409  # linux/fs.h: _IOW(0x94, 9, int)
+
+
+def _git(root: Path, *args: str) -> Optional[bytes]:
+    import subprocess
+
+    try:
+        return subprocess.check_output(["git", "-C", str(root), *args], stderr=subprocess.DEVNULL)
+    except Exception:
+        return None
+
+
+def code_version() -> str:
+    """Git commit of the source tree, else the installed package version, else "unknown".
+
+    Uncommitted changes under ``src/`` (the diff against HEAD and the contents of untracked
+    files) add a ``+dirty.<hash>`` suffix, so editing solver or build code changes every key.
+    """
+    root = Path(__file__).resolve().parents[2]
+    commit = _git(root, "rev-parse", "HEAD")
+    if commit:
+        version = commit.decode("utf-8").strip()
+        h = hashlib.sha256(_git(root, "diff", "HEAD", "--binary", "--", "src") or b"")
+        untracked = (_git(root, "ls-files", "--others", "--exclude-standard", "-z", "--", "src") or b"").split(b"\0")
+        for rel in sorted(u for u in untracked if u):
+            p = root / rel.decode("utf-8")
+            h.update(rel + b"\0" + (file_sha256(p).encode("ascii") if p.is_file() else b""))
+        if h.digest() != hashlib.sha256().digest():
+            version += f"+dirty.{h.hexdigest()[:12]}"
+        return version
+    try:
+        import importlib.metadata as _im
+        return _im.version("euv_simulation")
+    except Exception:
+        return "unknown"
+
+
+def config_hash(config: Mapping[str, Any]) -> str:
+    """`_content_hash` of a resolved config (made YAML-safe) and the COMSOL environment."""
+    from ..core.config.loader import _content_hash, _env_sensitive_blob
+
+    plain = json.loads(json.dumps(dict(config), sort_keys=True, default=str))
+    return _content_hash(plain, _env_sensitive_blob())
+
+
+def cache_key(config: Mapping[str, Any], variant: str, version: Optional[str] = None) -> str:
+    """Cache key of a run: hash of config hash, variant and code version."""
+    text = f"{config_hash(config)}|{variant}|{version if version is not None else code_version()}"
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def run_inputs_config(paths: Iterable[Union[str, Path]]) -> Dict[str, Any]:
+    """Resolved view of a run's input files for `cache_key`.
+
+    YAML files are deep-merged in order (formatting and comments do not change the key);
+    other files (legacy TXT parameters, tables) enter by content hash under their name.
+    """
+    from ..core.config.loader import _deep_merge, _load_any
+
+    merged: Dict[str, Any] = {}
+    files: Dict[str, str] = {}
+    for p in map(Path, paths):
+        if not p.is_file():
+            continue
+        if p.suffix.lower() in (".yaml", ".yml"):
+            merged = _deep_merge(merged, _load_any(p))
+        else:
+            files[p.name] = file_sha256(p)
+    return {"config": merged, "files": files}
+
+
+def _reflink(src: Path, dst: Path) -> None:
+    if not sys.platform.startswith("linux"):
+        raise OSError("reflink is only attempted on Linux")
+    import fcntl
+
+    with src.open("rb") as s, dst.open("wb") as d:
+        try:
+            fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+        except OSError:
+            d.close()
+            dst.unlink()
+            raise
+
+
+def _place(src: Path, dst: Path, link: str) -> str:
+    """Put ``src`` at ``dst`` using ``link`` (see `LINK_MODES`); returns the mode used."""
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if dst.exists() or dst.is_symlink():
+        dst.unlink()
+    order = {"auto": ("reflink", "hardlink", "copy"), "store": ("reflink", "copy")}.get(link, (link,))
+    for mode in order:
+        try:
+            if mode == "reflink":
+                _reflink(src, dst)
+            elif mode == "hardlink":
+                os.link(src, dst)
+            else:
+                shutil.copyfile(src, dst)
+            return mode
+        except OSError:
+            if mode == order[-1]:
+                raise
+    raise AssertionError("unreachable")
+
+
+def _files_of(path: Path) -> List[Path]:
+    return [path] if path.is_file() else sorted(p for p in path.rglob("*") if p.is_file())
+
+
+@dataclass
+class CacheEntry:
+    key: str
+    path: Path  # entry directory
+    meta: Dict[str, Any]
+
+    @property
+    def size_bytes(self) -> int:
+        return int(sum(f["size"] for f in self.meta.get("files", {}).values()))
+
+
+class ResultCache:
+    """Content-addressed store of run outputs under ``root`` with an LRU size budget."""
+
+    def __init__(self, root: Union[str, Path], max_bytes: Optional[int] = None, link: str = "auto"):
+        if link not in LINK_MODES:
+            raise ValueError(f"link must be one of {LINK_MODES}")
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.link = link
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.root / "objects" / key[:2] / key
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """The entry for ``key`` if present and intact (file sizes match), else None."""
+        d = self._entry_dir(key)
+        try:
+            meta = json.loads((d / "entry.json").read_text(encoding="utf-8"))
+            for rel, info in meta.get("files", {}).items():
+                if (d / "files" / rel).stat().st_size != info["size"]:
+                    return None
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(key, d, meta)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def put(self, key: str, outputs: Union[Mapping[str, Union[str, Path]], Iterable[Union[str, Path]]],
+            result: Any = None, meta: Optional[Mapping[str, Any]] = None) -> Optional[CacheEntry]:
+        """Store ``outputs`` (name -> file/dir, or a list of paths); each is kept under its basename.
+
+        Returns the entry, or None if it alone exceeds ``max_bytes`` (nothing is stored).
+        An existing entry for ``key`` is kept as is.
+        """
+        if not isinstance(outputs, Mapping):
+            outputs = {Path(p).name: p for p in outputs}
+        existing = self.get(key)
+        if existing is not None:
+            return existing
+        sources = {name: Path(p) for name, p in outputs.items() if Path(p).exists()}
+        size = sum(f.stat().st_size for p in sources.values() for f in _files_of(p))
+        if self.max_bytes is not None and size > self.max_bytes:
+            return None
+        tmp = self.root / "tmp" / uuid.uuid4().hex
+        files: Dict[str, Dict[str, Any]] = {}
+        try:
+            for src in sources.values():
+                for f in _files_of(src):
+                    rel = src.name if f == src else f"{src.name}/{f.relative_to(src).as_posix()}"
+                    dst = tmp / "files" / rel
+                    _place(f, dst, "store")  # never hardlink: the run may still rewrite its outputs
+                    os.chmod(dst, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+                    files[rel] = {"size": dst.stat().st_size, "sha256": file_sha256(dst)}
+            now = time.time()
+            entry = {"key": key, "outputs": {name: p.name for name, p in sources.items()}, "files": files,
+                     "result": json.loads(json.dumps(result, default=str)), "meta": dict(meta or {}),
+                     "created": now, "last_used": now}
+            (tmp / "entry.json").write_text(json.dumps(entry, indent=2), encoding="utf-8")
+            final = self._entry_dir(key)
+            final.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.rename(tmp, final)
+            except OSError:  # another worker stored the same key first
+                shutil.rmtree(tmp, ignore_errors=True)
+        finally:
+            if tmp.exists():
+                shutil.rmtree(tmp, ignore_errors=True)
+        self.evict()
+        return self.get(key)
+
+    def materialize(self, key: str, dest: Union[str, Path], link: Optional[str] = None) -> Optional[CacheEntry]:
+        """Place the outputs of ``key`` into ``dest`` (under their basenames) on a hit."""
+        entry = self.get(key)
+        if entry is None:
+            return None
+        dest = Path(dest)
+        try:
+            for rel in entry.meta.get("files", {}):
+                _place(entry.path / "files" / rel, dest / rel, link or self.link)
+        except FileNotFoundError:  # evicted concurrently
+            return None
+        self._touch(entry)
+        return entry
+
+    def _touch(self, entry: CacheEntry) -> None:
+        entry.meta["last_used"] = time.time()
+        tmp = entry.path / f".entry.{uuid.uuid4().hex}.json"
+        try:
+            tmp.write_text(json.dumps(entry.meta, indent=2), encoding="utf-8")
+            os.replace(tmp, entry.path / "entry.json")
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def entries(self) -> List[CacheEntry]:
+        out = []
+        for meta_path in (self.root / "objects").glob("*/*/entry.json"):
+            e = self.get(meta_path.parent.name)
+            if e is not None:
+                out.append(e)
+        return out
+
+    def size_bytes(self) -> int:
+        return sum(e.size_bytes for e in self.entries())
+
+    def evict(self, max_bytes: Optional[int] = None) -> List[str]:
+        """Drop least recently used entries until the cache fits ``max_bytes``; returns their keys."""
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        if budget is None:
+            return []
+        entries = sorted(self.entries(), key=lambda e: e.meta.get("last_used", 0.0))
+        total = sum(e.size_bytes for e in entries)
+        dropped = []
+        for e in entries:
+            if total <= budget:
+                break
+            shutil.rmtree(e.path, ignore_errors=True)
+            total -= e.size_bytes
+            dropped.append(e.key)
+        return dropped
+
+
+class CachedWorker:
+    """Sweep worker wrapper: identical points are served from a `ResultCache`.
+
+    The key is built from the point cfg without ``out_key`` (the run directory), the
+    ``variant`` and the code version. On a hit the stored outputs are materialized into
+    ``cfg[out_key]`` and the stored result is returned with its ``"outputs"`` paths pointing
+    there and ``"cache_hit": True``; the worker (COMSOL build and solve) is not called. On a
+    miss, the outputs of the result (``outputs(result)``) are stored. Picklable, so it works
+    with `sweep.parallel_sweep` / `iter_sweep` pools.
+    """
+
+    def __init__(self, worker: Callable[..., Any], root: Union[str, Path], variant: str,
+                 max_bytes: Optional[int] = None, out_key: str = "out_dir", version: Optional[str] = None,
+                 outputs: Optional[Callable[[Any], Mapping[str, Any]]] = None, link: str = "auto"):
+        self.worker = worker
+        self.root = Path(root)
+        self.variant = variant
+        self.max_bytes = max_bytes
+        self.out_key = out_key
+        self.version = version if version is not None else code_version()
+        self.outputs = outputs
+        self.link = link
+
+    def key(self, cfg: Mapping[str, Any]) -> str:
+        return cache_key({k: v for k, v in cfg.items() if k != self.out_key}, self.variant, self.version)
+
+    def __call__(self, cfg: Dict[str, Any], *client) -> Any:
+        cache = ResultCache(self.root, max_bytes=self.max_bytes, link=self.link)
+        key = self.key(cfg)
+        dest = Path(cfg[self.out_key])
+        entry = cache.materialize(key, dest)
+        if entry is not None:
+            result = entry.meta.get("result")
+            if isinstance(result, dict):
+                result = dict(result, cache_hit=True)
+                if isinstance(result.get("outputs"), dict):
+                    result["outputs"] = {name: str(dest / base) for name, base in entry.meta.get("outputs", {}).items()}
+            return result
+        result = self.worker(cfg, *client)
+        if self.outputs is not None:
+            outs = self.outputs(result)
+        else:
+            from ..core.solvers.sweep import default_outputs
+            outs = default_outputs(result)
+        cache.put(key, dict(outs), result=result, meta={"variant": self.variant, "code_version": self.version})
+        return result
+
+
+__all__ = ["LINK_MODES", "code_version", "config_hash", "cache_key", "run_inputs_config",
+           "CacheEntry", "ResultCache", "CachedWorker"]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, Any, Iterable, Tuple
+from typing import Dict, Any, Iterable, Mapping, Sequence, Tuple
 import json
 import csv
 import hashlib
@@ -26,11 +26,50 @@ def write_manifest(path: Path, inputs: Dict[str, str] | Iterable[str], outputs:
     return data
 
 
+def write_comsol_table(path: Path, columns: Mapping[str, Sequence[float]], table: str,
+                       model: str = "pp_model_created.mph", meta: Mapping[str, str] | None = None) -> Path:
+    """Write a CSV in the layout of a COMSOL Table export (``%``-prefixed header lines).
+
+    ``columns`` maps column headers (e.g. ``"Time (s)"``) to equal-length value arrays;
+    values are written with full double precision.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    headers = list(columns)
+    data = np.column_stack([np.asarray(columns[h], dtype=float).ravel() for h in headers])
+    lines = [f"% Model,{model}", f"% Table,{table}"]
+    lines += [f"% {k},{v}" for k, v in (meta or {}).items()]
+    lines.append("% " + ",".join(headers))
+    with path.open("w", encoding="utf-8", newline="") as f:
+        f.write("\n".join(lines) + "\n")
+        np.savetxt(f, data, delimiter=",", fmt="%.17g")
+    return path
+
+
+def read_result_table(path: Path) -> pd.DataFrame:
+    """Read a plain CSV or a COMSOL Table export (``%`` header lines) into a DataFrame.
+
+    For COMSOL-layout files the last ``%`` line holds the column headers.
+    """
+    path = Path(path)
+    header = []
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            if not line.startswith("%"):
+                break
+            header.append(line[1:].strip())
+    if not header:
+        return pd.read_csv(path)
+    names = next(csv.reader([header[-1]]))
+    return pd.read_csv(path, skiprows=len(header), header=None, names=names)
+
+
 def compare_results(baseline_dir: Path, candidate_dir: Path, rtol: float = 1e-5, atol: float = 1e-8) -> Tuple[bool, Dict[str, Any]]:
     """Compare common CSV files in two directories within tolerances.
 
     Returns (ok, report). Report contains per-file status and max errors.
-    Only compares columns that exist in both files and are numeric.
+    Only compares columns that exist in both files and are numeric. Plain CSVs and
+    COMSOL Table exports (see `read_result_table`) are both accepted.
     """
     baseline_dir = Path(baseline_dir)
     candidate_dir = Path(candidate_dir)
@@ -44,8 +83,8 @@ def compare_results(baseline_dir: Path, candidate_dir: Path, rtol: float = 1e-5,
         c = candidate_dir / b.name
         if not c.is_file():
             continue
-        dfb = pd.read_csv(b)
-        dfc = pd.read_csv(c)
+        dfb = read_result_table(b)
+        dfc = read_result_table(c)
         cols = [c for c in _numeric_cols(dfb) if c in dfc.columns and np.issubdtype(dfc[c].dtype, np.number)]
         if not cols:
             continue
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+"""Append-only sweep run journal (crash-resumable sweeps).
+
+One JSON line per finished grid point, flushed and fsynced before the sweep moves on:
+
+    {"key": <sha256 of the canonical point cfg>, "cfg": {...}, "status": "ok"|"failed",
+     "result": <JSON form of the worker result>, "outputs": {name: {"path": ..., "sha256": ...}},
+     "finished_at": "..."}
+
+Points are identified by their parameters, not their grid position, so a restarted sweep
+may reorder, extend or shrink the grid. A point is skipped on restart only if its latest
+record is "ok" and every recorded output still exists with the same hash; a truncated last
+line (crash mid-write) is ignored.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Union
+
+
+def point_key(cfg: Mapping[str, Any]) -> str:
+    """Stable identity of a grid point: sha256 of its canonical JSON."""
+    text = json.dumps(cfg, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def file_sha256(path: Union[str, Path]) -> str:
+    """sha256 of a file, or of the (relative path, hash) list of a directory's files."""
+    path = Path(path)
+    h = hashlib.sha256()
+    if path.is_dir():
+        for p in sorted(q for q in path.rglob("*") if q.is_file()):
+            h.update(f"{p.relative_to(path).as_posix()}:{file_sha256(p)}\n".encode("utf-8"))
+        return h.hexdigest()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _jsonable(value: Any) -> Any:
+    return json.loads(json.dumps(value, default=str))
+
+
+class SweepJournal:
+    """Append-only JSONL journal of finished sweep points."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.is_file():
+            return
+        with self.path.open("r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn write from a crash
+                if isinstance(rec, dict) and "key" in rec:
+                    self.records[rec["key"]] = rec  # latest record wins
+
+    def append(self, cfg: Mapping[str, Any], result: Any, outputs: Optional[Mapping[str, Any]] = None,
+               status: str = "ok") -> Dict[str, Any]:
+        """Record a finished point (hashing its ``outputs``) and fsync the journal."""
+        outs = {}
+        for name, p in (outputs or {}).items():
+            p = Path(p)
+            outs[str(name)] = {"path": str(p), "sha256": file_sha256(p) if p.exists() else None}
+        rec = {"key": point_key(cfg), "cfg": _jsonable(dict(cfg)), "status": status, "result": _jsonable(result),
+               "outputs": outs, "finished_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        line = (json.dumps(rec) + "\n").encode("utf-8")
+        with self.path.open("a+b") as f:
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":  # terminate a torn line so this record stays parseable
+                    line = b"\n" + line
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        self.records[rec["key"]] = rec
+        return rec
+
+    def verified(self, cfg: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+        """The point's latest record if it succeeded and its outputs are unchanged, else None."""
+        rec = self.records.get(point_key(cfg))
+        if rec is None or rec.get("status") != "ok":
+            return None
+        for out in rec.get("outputs", {}).values():
+            p = Path(out["path"])
+            if out.get("sha256") is None or not p.exists() or file_sha256(p) != out["sha256"]:
+                return None
+        return rec
+
+    def manifest_runs(self) -> List[Dict[str, Any]]:
+        """Successful records as `write_sweep_manifest` run entries."""
+        return [{"run_id": rec["key"][:12], "params": rec["cfg"],
+                 "outputs": {k: v["path"] for k, v in rec.get("outputs", {}).items()},
+                 "metrics": rec["result"] if isinstance(rec.get("result"), dict) else {"result": rec.get("result")}}
+                for rec in self.records.values() if rec.get("status") == "ok"]
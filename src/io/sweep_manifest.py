@@ -7,7 +7,7 @@ and compared easily. It is additive and not used by default.
 """
 
 from pathlib import Path
-from typing import Iterable, Mapping, Any
+from typing import Any, Dict, Iterable, List, Mapping
 import json, time
 
 
@@ -37,3 +37,12 @@ def write_sweep_manifest(path: Path, runs: Iterable[Mapping[str, Any]], schema_v
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps(data, indent=2), encoding="utf-8")
     return path
+
+
+def read_sweep_manifest(path: Path) -> List[Dict[str, Any]]:
+    """Return the ``runs`` list of a manifest written by `write_sweep_manifest`."""
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    runs = data.get("runs") if isinstance(data, dict) else None
+    if not isinstance(runs, list):
+        raise ValueError(f"{path} is not a sweep manifest (no 'runs' list)")
+    return runs
@@ -114,10 +114,11 @@ class FresnelModelBuilder(ModelBuilder):
             
         tds = self.physics_manager.physics_interfaces['tds']
         
-        # Tin diffusivity in gas
-        D_tin = self.params['Tin_Diffusivity_Gas']
+        # Tin diffusivity in gas (constant unless PhysicsManager installed a D(T) law)
         tds_gas = tds.feature('tds_gas')
-        tds_gas.property('D_c', f"{D_tin}[m^2/s]")
+        if not self.params.get('Diffusivity_Law'):
+            D_tin = self.params['Tin_Diffusivity_Gas']
+            tds_gas.property('D_c', f"{D_tin}[m^2/s]")
         
         # Background concentration (very low)
         tds_gas.property('c_init', '1e-6[mol/m^3]')
@@ -147,11 +148,39 @@ class FresnelModelBuilder(ModelBuilder):
         # Evaporation flux (Hertz-Knudsen)
         J_evap_expr = f"{evap_coeff}*{P_sat_expr}/sqrt(2*pi*{R_gas}*T/{M_tin})"
         
+        if self.params.get('Evaporation_Tabulated'):
+            try:
+                J_evap_expr = self._install_evaporation_table(
+                    float(evap_coeff), float(P_sat_coeff), float(E_act), R_gas, M_tin)
+            except Exception as e:
+                logger.warning(f"Evaporation table not installed, using analytic J_evap: {e}")
+        
         evaporation.property('N0', J_evap_expr)
         evaporation.property('name', 'Hertz-Knudsen Evaporation')
         
         logger.info("Configured Hertz-Knudsen evaporation kinetics")
     
+    def _install_evaporation_table(self, evap_coeff: float, P_sat_coeff: float, E_act: float,
+                                   R_gas: float, M_tin: float) -> str:
+        """Tabulate the Hertz-Knudsen flux as Interpolation function J_evap_tab(T).
+        
+        Log-spaced T grid (Evaporation_Table_Tmin/Tmax/Rtol, default 500-6000 K, rtol 1e-4
+        relative to max(|J|, 1e-6*J(T_max))); returns the N0 expression using it.
+        """
+        import numpy as np
+        from ..mph_core.interpolation import install_interpolation, table_settings, tabulate_log_t
+        
+        def flux(T):
+            return evap_coeff*P_sat_coeff*np.exp(-E_act/(R_gas*T))/np.sqrt(2*np.pi*R_gas*T/M_tin)
+        
+        T_min, T_max, rtol = table_settings(self.params)
+        tab = tabulate_log_t(flux, 'J_evap_tab', T_min, T_max, rtol=rtol,
+                             floor=1e-6*float(flux(T_max)), fununit='kg/(m^2*s)')
+        functions = self.model/'functions'
+        install_interpolation(functions, tab)
+        self.evaporation_tables = {'J_evap_tab': tab}
+        return 'J_evap_tab(T)'
+    
     def get_fresnel_info(self) -> Dict[str, Any]:
         """Get Fresnel-specific model information"""
         info = self.get_model_info()
@@ -147,22 +147,30 @@ class KumarModelBuilder(ModelBuilder):
             
         logger.info("Configured fluid flow with temperature-dependent properties")
     
+    def _sigma_tabulated(self) -> bool:
+        """True when the tin material installed sigma_tab(T) (Material_Tabulated)."""
+        handler = self.materials_handler
+        return handler is not None and 'sigma_tab' in getattr(handler, 'property_tables', {})
+    
     def _add_marangoni_effect(self, spf) -> None:
         """Add Marangoni stress boundary condition"""
         logger.info("Adding Marangoni effect")
         
-        # Surface tension gradient
-        gamma_0 = self.params.get('Tin_Surface_Tension', 0.544)  # N/m
-        dgamma_dT = self.params['Surface_Tension_Temperature_Coeff']  # N/(m·K)
-        
         # Marangoni stress
         marangoni = spf.create('SurfaceForce', tag='marangoni')
         marangoni.property('selection', self.selection_manager.selections['s_surf'])
         
         # Tangential stress due to temperature gradient
         # τ = ∇_s(γ) where ∇_s is surface gradient operator
-        stress_expr = f"({gamma_0} + {dgamma_dT}*T)"
-        marangoni.property('surface_tension', stress_expr)
+        if self._sigma_tabulated():
+            # sigma_tab(T) is the core.properties law the Python solvers use
+            marangoni.property('surface_tension', 'sigma_tab(T)')
+            marangoni.property('dsigma_dT', 'd(sigma_tab(T),T)')
+        else:
+            gamma_0 = self.params.get('Tin_Surface_Tension', 0.544)  # N/m
+            dgamma_dT = self.params['Surface_Tension_Temperature_Coeff']  # N/(m·K)
+            stress_expr = f"({gamma_0} + {dgamma_dT}*T)"
+            marangoni.property('surface_tension', stress_expr)
         
         logger.info("Added Marangoni stress boundary condition")
     
@@ -180,8 +188,11 @@ class KumarModelBuilder(ModelBuilder):
         free_surf = ale.feature('free_surf')
         
         # Surface tension force
-        gamma = self.params.get('Tin_Surface_Tension', 0.544)
-        free_surf.property('surface_tension', f"{gamma}[N/m]")
+        if self._sigma_tabulated():
+            free_surf.property('surface_tension', 'sigma_tab(T)')
+        else:
+            gamma = self.params.get('Tin_Surface_Tension', 0.544)
+            free_surf.property('surface_tension', f"{gamma}[N/m]")
         
         # Mesh smoothing
         ale_domain = ale.feature('ale_droplet')
@@ -0,0 +1,94 @@
+"""
+Interpolation Function Helpers
+
+Tabulate expensive temperature-dependent expressions (Psat, J_evap) in Python on a
+log-spaced T grid and install them as COMSOL Interpolation functions, so assembly
+does a table lookup instead of evaluating exp/sqrt at every quadrature point.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, List, Tuple
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Interior points per grid interval at which the interpolation error is measured
+_CHECK_POINTS = np.linspace(0.0, 1.0, 9)[1:-1]
+
+
+@dataclass
+class TabulatedFunction:
+    """Piecewise-linear table of f(T) with its measured error bound.
+
+    ``max_rel_error`` bounds |f_lin(T) - f(T)| / max(|f(T)|, floor) over [T_min, T_max],
+    measured at 7 interior points of every interval (linear interpolation, as COMSOL
+    evaluates ``interp='linear'``).
+    """
+    funcname: str
+    T: np.ndarray
+    values: np.ndarray
+    max_rel_error: float
+    floor: float
+    fununit: str = "1"
+    argunit: str = "K"
+
+    def __call__(self, T):
+        return np.interp(T, self.T, self.values)
+
+    def table(self) -> List[List[str]]:
+        return [[f"{t:.12g}", f"{v:.12g}"] for t, v in zip(self.T, self.values)]
+
+
+def _interp_error(fn: Callable, T: np.ndarray, f: np.ndarray, floor: float) -> float:
+    a, b = T[:-1, None], T[1:, None]
+    Tc = a + (b - a) * _CHECK_POINTS[None, :]
+    exact = fn(Tc)
+    lin = f[:-1, None] + (f[1:, None] - f[:-1, None]) * _CHECK_POINTS[None, :]
+    return float(np.max(np.abs(lin - exact) / np.maximum(np.abs(exact), floor)))
+
+
+def tabulate_log_t(fn: Callable, funcname: str, T_min: float, T_max: float,
+                   rtol: float = 1e-4, floor: float = 0.0, n_min: int = 64,
+                   n_max: int = 65536, fununit: str = "1") -> TabulatedFunction:
+    """Tabulate vectorized ``fn(T)`` on a geometric T grid fine enough for ``rtol``.
+
+    The grid size doubles from ``n_min`` until the measured relative error (relative to
+    max(|f|, floor), so values far below ``floor`` only need absolute accuracy
+    rtol*floor) is at most ``rtol``. Raises ValueError if ``n_max`` points do not suffice.
+    """
+    if not (0.0 < T_min < T_max):
+        raise ValueError("Require 0 < T_min < T_max")
+    n = int(n_min)
+    while True:
+        T = np.geomspace(T_min, T_max, n)
+        f = np.asarray(fn(T), dtype=float)
+        err = _interp_error(fn, T, f, floor if floor > 0 else np.finfo(float).tiny)
+        if err <= rtol:
+            return TabulatedFunction(funcname, T, f, err, floor, fununit=fununit)
+        if n >= n_max:
+            raise ValueError(f"{funcname}: {n} points give rel. error {err:.2e} > rtol={rtol:.1e}")
+        n = min(2 * n - 1, int(n_max))  # odd counts keep the previous nodes
+
+
+def install_interpolation(functions: Any, tab: TabulatedFunction, extrap: str = "linear") -> Any:
+    """Create a COMSOL Interpolation function ``tab.funcname(T)`` under ``functions``."""
+    feat = functions.create("Interpolation", name=tab.funcname)
+    feat.property("funcname", tab.funcname)
+    feat.property("table", tab.table())
+    feat.property("interp", "linear")
+    feat.property("extrap", extrap)
+    feat.property("argunit", [tab.argunit])
+    feat.property("fununit", [tab.fununit])
+    logger.info(f"Installed interpolation {tab.funcname}(T): {tab.T.size} points on "
+                f"[{tab.T[0]:g}, {tab.T[-1]:g}] K, max rel. error {tab.max_rel_error:.2e}")
+    return feat
+
+
+def table_settings(params: dict, T_min: float = 500.0, T_max: float = 6000.0,
+                   rtol: float = 1e-4) -> Tuple[float, float, float]:
+    """(T_min, T_max, rtol) from the optional Evaporation_Table_* parameters."""
+    return (float(params.get('Evaporation_Table_Tmin', T_min)),
+            float(params.get('Evaporation_Table_Tmax', T_max)),
+            float(params.get('Evaporation_Table_Rtol', rtol)))
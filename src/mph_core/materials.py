@@ -25,6 +25,7 @@ class MaterialsHandler:
         self.model = model
         self.params = params
         self.materials = {}
+        self.property_tables = {}
         
     def create_all_materials(self) -> Dict[str, Any]:
         """
@@ -65,7 +66,15 @@ class MaterialsHandler:
             # For testing with mocks, fall back to method call
             basic = tin.Basic()
         
-        # Density (use constant values for now, can be made temperature dependent later)
+        # Constant parameter values unless Material_Tabulated installs T-dependent tables
+        tabulated = {}
+        if self.params.get('Material_Tabulated'):
+            try:
+                tabulated = self._install_property_tables()
+            except Exception as e:
+                logger.warning(f"Tin property tables not installed, using constant properties: {e}")
+
+        # Density
         rho_liquid = self.params.get('rho_sn', '6980[kg/m^3]')
         if isinstance(rho_liquid, str):
             basic.property('density', rho_liquid)
@@ -73,21 +82,21 @@ class MaterialsHandler:
             basic.property('density', f'{rho_liquid}[kg/m^3]')
         
         # Thermal conductivity
-        k_liquid = self.params.get('k_sn', '31[W/(m*K)]')
+        k_liquid = tabulated.get('k', self.params.get('k_sn', '31[W/(m*K)]'))
         if isinstance(k_liquid, str):
             basic.property('thermalconductivity', k_liquid)
         else:
             basic.property('thermalconductivity', f'{k_liquid}[W/(m*K)]')
         
         # Heat capacity
-        cp_liquid = self.params.get('Cp_sn', '237[J/(kg*K)]')
+        cp_liquid = tabulated.get('cp', self.params.get('Cp_sn', '237[J/(kg*K)]'))
         if isinstance(cp_liquid, str):
             basic.property('heatcapacity', cp_liquid)
         else:
             basic.property('heatcapacity', f'{cp_liquid}[J/(kg*K)]')
         
         # Dynamic viscosity (for flow physics)
-        mu_liquid = self.params.get('mu_sn', '1.8e-3[Pa*s]')
+        mu_liquid = tabulated.get('mu', self.params.get('mu_sn', '1.8e-3[Pa*s]'))
         if isinstance(mu_liquid, str):
             basic.property('dynamicviscosity', mu_liquid)
         else:
@@ -96,6 +105,40 @@ class MaterialsHandler:
         logger.info("Created tin material with basic properties")
         return tin
         
+    def _install_property_tables(self) -> Dict[str, str]:
+        """Install mu_tab/sigma_tab/k_tab/cp_tab(T) Interpolation functions for tin.
+
+        Values come from ``core.properties.TinProperties.from_params`` (Andrade viscosity,
+        linear sigma/k/cp about T_ref), the same laws the Python solvers evaluate. Grid range
+        and tolerance follow Material_Table_Tmin/Tmax/Rtol (default 500–6000 K, rtol 1e-4);
+        the tables are kept in ``self.property_tables``. Returns property -> expression.
+        """
+        from ..core.properties import TinProperties
+        from .interpolation import install_interpolation, tabulate_log_t
+
+        props = TinProperties.from_params(self.params)
+        T_min = float(self.params.get('Material_Table_Tmin', 500.0))
+        T_max = float(self.params.get('Material_Table_Tmax', 6000.0))
+        rtol = float(self.params.get('Material_Table_Rtol', 1e-4))
+        try:
+            functions = self.model/'functions'
+        except TypeError:
+            # For testing with mocks, fall back to method call
+            functions = self.model.functions()
+
+        self.property_tables = {}
+        expressions = {}
+        for name in ('mu', 'sigma', 'k', 'cp'):
+            law = getattr(props, name)
+            funcname = f'{name}_tab'
+            # sigma may cross zero at high T: measure its error against sigma(T_ref)
+            floor = abs(float(law(props.sigma.T_ref))) if name == 'sigma' else 0.0
+            tab = tabulate_log_t(law, funcname, T_min, T_max, rtol=rtol, floor=floor, fununit=law.unit)
+            install_interpolation(functions, tab)
+            self.property_tables[funcname] = tab
+            expressions[name] = f'{funcname}(T)'
+        return expressions
+
     def _create_gas_material(self) -> Any:
         """Create gas material (air) with basic properties"""
         logger.info("Creating gas material")
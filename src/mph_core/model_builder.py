@@ -236,15 +236,66 @@ class ModelBuilder:
             logger.debug("Skipping function creation in mocked environment")
 
         # Create Psat(T) and J_evap variables used in BCs
+        exprs = [
+            'Psat = P_ref*exp( (Lv_sn*M_sn/R_gas)*(1/Tboil_sn - 1/T) )',
+            'J_evap = (1 - beta_r) * Psat * sqrt(M_sn/(2*pi*R_gas*T))'
+        ]
+        if self.params.get('Evaporation_Tabulated'):
+            try:
+                exprs = self._install_kumar_evaporation_tables(functions)
+            except Exception as e:
+                logger.warning(f"Evaporation tables not installed, using analytic Psat/J_evap: {e}")
         try:
             v = variables.create(name='kumar_vars')
-            v.property('expr', [
-                'Psat = P_ref*exp( (Lv_sn*M_sn/R_gas)*(1/Tboil_sn - 1/T) )',
-                'J_evap = (1 - beta_r) * Psat * sqrt(M_sn/(2*pi*R_gas*T))'
-            ])
+            v.property('expr', exprs)
             v.property('unit', ['Pa', 'kg/(m^2*s)'])
         except Exception:
             logger.debug("Skipping variables creation in mocked environment")
+
+    def _kumar_evaporation_constants(self) -> Dict[str, float]:
+        """Numeric P_ref, Lv_sn, M_sn, Tboil_sn, R_gas, beta_r from params (COMSOL units allowed).
+
+        Missing entries fall back to the KUMAR-2D parameter file values (thermo 'kumar_sn').
+        """
+        from ..core.pulse import resolve_parameters
+        from ..core.thermo import MATERIALS, R_GAS
+
+        sn = MATERIALS['kumar_sn']
+        defaults = {'P_ref': sn.P_ref, 'Lv_sn': sn.Lv, 'M_sn': sn.M, 'Tboil_sn': sn.T_boil,
+                    'R_gas': R_GAS, 'beta_r': 0.15}
+        table = dict(defaults)
+        table.update({k: v for k, v in self.params.items() if isinstance(v, (int, float, str))})
+        missing = sorted(k for k in defaults if k not in self.params)
+        if missing:
+            logger.info(f"Evaporation tables use default constants for {missing}")
+        return resolve_parameters(table, list(defaults))
+
+    def _install_kumar_evaporation_tables(self, functions) -> List[str]:
+        """Install Psat_tab(T)/J_evap_tab(T) Interpolation functions; return variable exprs.
+
+        Same formulas as the analytic variables, tabulated on a log-spaced T grid
+        (Evaporation_Table_Tmin/Tmax/Rtol, default 500–6000 K and rtol 1e-4). The error is
+        relative to max(|f|, floor), floors 1e-6*P_ref and 1e-6*J_evap(Tboil_sn); the
+        achieved bound is logged and kept in ``self.evaporation_tables``.
+        """
+        from ..core.thermo import VaporPressureLaw, j_evap
+        from .interpolation import install_interpolation, table_settings, tabulate_log_t
+
+        c = self._kumar_evaporation_constants()
+        law = VaporPressureLaw('kumar_params', M=c['M_sn'], Lv=c['Lv_sn'], T_boil=c['Tboil_sn'],
+                               P_ref=c['P_ref'], R=c['R_gas'])
+        T_min, T_max, rtol = table_settings(self.params)
+        p_floor = 1e-6 * c['P_ref']
+        j_floor = float(j_evap(c['Tboil_sn'], law, beta_r=c['beta_r'])) * 1e-6
+        self.evaporation_tables = {
+            'Psat_tab': tabulate_log_t(law.psat, 'Psat_tab', T_min, T_max, rtol=rtol,
+                                       floor=p_floor, fununit='Pa'),
+            'J_evap_tab': tabulate_log_t(lambda T: j_evap(T, law, beta_r=c['beta_r']), 'J_evap_tab',
+                                         T_min, T_max, rtol=rtol, floor=j_floor, fununit='kg/(m^2*s)'),
+        }
+        for tab in self.evaporation_tables.values():
+            install_interpolation(functions, tab)
+        return ['Psat = Psat_tab(T)', 'J_evap = J_evap_tab(T)']
     
     def _build_geometry(self) -> None:
         """Build model geometry"""
@@ -311,7 +362,8 @@ class ModelBuilder:
         self.physics_manager = PhysicsManager(
             self.model,
             self.selection_manager.selections,
-            self.materials_handler.materials
+            self.materials_handler.materials,
+            self.params
         )
         
         # Setup physics for variant
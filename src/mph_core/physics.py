@@ -18,7 +18,7 @@ High-level phy        # Common physics for all variants
 Replaces low-level Java physics calls with pythonic physics.create() patterns.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -27,7 +27,8 @@ logger = logging.getLogger(__name__)
 class PhysicsManager:
     """High-level physics manager using MPh API"""
     
-    def __init__(self, model, selections: Dict[str, Any], materials: Dict[str, Any]):
+    def __init__(self, model, selections: Dict[str, Any], materials: Dict[str, Any],
+                 params: Optional[Dict[str, Any]] = None):
         """
         Initialize physics manager
         
@@ -35,11 +36,14 @@ class PhysicsManager:
             model: MPh model object
             selections: Dictionary of named selections
             materials: Dictionary of material definitions
+            params: Parameter dictionary from config (optional; enables Diffusivity_Law)
         """
         self.model = model
         self.selections = selections
         self.materials = materials
+        self.params = params or {}
         self.physics_interfaces = {}
+        self.diffusivity_table = None
         
     def setup_all_physics(self, variant: str = 'fresnel') -> Dict[str, Any]:
         """
@@ -227,9 +231,64 @@ class PhysicsManager:
         # Add convection-diffusion in gas domain
         cdm = tds.create('ConvectionDiffusionMigration', 2, name='cdm2')
         cdm.select(self.selections['s_gas'])
+        D_expr = self._gas_diffusivity_expression()
+        if D_expr:
+            cdm.property('D_c', D_expr)
         
         return tds
     
+    def _gas_diffusivity_expression(self) -> Optional[str]:
+        """Tin-vapour diffusivity for the TDS gas domain, or None without Diffusivity_Law.
+
+        The `core.diffusivity` law (Diffusivity_Law, Dm0) is tabulated at the operating
+        pressure (p_amb, else Gas_Pressure [Pa], else Gas_Pressure_Torr) as a D_tab(T)
+        Interpolation function on Diffusivity_Table_Tmin/Tmax/Rtol (default 200–6000 K,
+        1e-4), kept in ``self.diffusivity_table``. Falls back to the analytic expression if
+        the table cannot be installed; an unknown law or unresolvable Dm0 raises ConfigError.
+        """
+        name = self.params.get('Diffusivity_Law')
+        if not name:
+            return None
+        from ..core.diffusivity import TORR, get_law
+        from ..core.errors import ConfigError
+        from ..core.pulse import resolve_parameters
+        from .interpolation import install_interpolation, tabulate_log_t
+
+        D0 = None
+        if self.params.get('Dm0') is not None:
+            try:
+                D0 = resolve_parameters(self.params, ['Dm0'])['Dm0']
+            except Exception as e:
+                raise ConfigError(f"Dm0 = {self.params['Dm0']!r} cannot be resolved: {e}",
+                                  suggested_fix="Give Dm0 as a number or COMSOL value in m^2/s, "
+                                                "e.g. 1e-5[m^2/s]") from e
+        law = get_law(name, D0)  # ConfigError for an unknown law
+        if 'p_amb' in self.params:
+            p = resolve_parameters(self.params, ['p_amb'])['p_amb']
+        elif 'Gas_Pressure' in self.params:
+            p = float(self.params['Gas_Pressure'])
+        elif 'Gas_Pressure_Torr' in self.params:
+            p = float(self.params['Gas_Pressure_Torr']) * TORR
+        else:
+            logger.warning("No gas pressure parameter; using the analytic diffusivity with p_amb")
+            return law.comsol_expression('T', 'p_amb')
+        try:
+            functions = self.model/'functions'
+        except TypeError:
+            functions = self.model.functions()
+        try:
+            self.diffusivity_table = tabulate_log_t(
+                lambda T: law(T, p), 'D_tab',
+                float(self.params.get('Diffusivity_Table_Tmin', 200.0)),
+                float(self.params.get('Diffusivity_Table_Tmax', 6000.0)),
+                rtol=float(self.params.get('Diffusivity_Table_Rtol', 1e-4)), fununit='m^2/s')
+            install_interpolation(functions, self.diffusivity_table)
+        except Exception as e:
+            logger.warning(f"Diffusivity table not installed, using analytic {law.name} law: {e}")
+            return law.comsol_expression('T', f'{p:.10g}[Pa]')
+        logger.info(f"Tin vapour diffusivity {law.name} tabulated at p = {p:g} Pa")
+        return 'D_tab(T)'
+
     def _setup_non_isothermal_flow(self) -> Any:
         """Setup non-isothermal flow multiphysics coupling"""
         logger.info("Setting up Non-Isothermal Flow coupling")
@@ -329,8 +388,8 @@ class PhysicsManager:
         tds_gas = tds.create('TransportInPorousMedia', 2, name='tds_gas')
         tds_gas.property('selection', self.selections['s_gas'])
         
-        # Species properties
-        tds_gas.property('D_c', 'D_tin')  # Tin diffusivity in gas
+        # Species properties: tabulated D(T) when Diffusivity_Law is set, else D_tin
+        tds_gas.property('D_c', self._gas_diffusivity_expression() or 'D_tin')  # Tin diffusivity in gas
         
         # Boundary conditions
         evaporation = tds.create('ConcentrationFlux', 1, name='evaporation')
@@ -44,6 +44,11 @@ def main():
     ap.add_argument("--log-level", default=None, help="Optional log level: DEBUG|INFO|WARN|ERROR")
     ap.add_argument("--emit-milestones", action="store_true",
                     help="Optional: emit build milestones and write perf_summary.json (additive, default off).")
+    ap.add_argument("--result-cache", type=Path, default=None,
+                    help="Optional: content-addressed result cache directory; an identical earlier run\n"
+                         "(same inputs, variant and code version) is reused instead of rebuilt (needs --out-dir).")
+    ap.add_argument("--result-cache-max-gb", type=float, default=None,
+                    help="Size budget of --result-cache in GB; least recently used entries are evicted.")
     # Advanced/dev flags: hide from --help but keep functioning
     import argparse as _arg
     ap.add_argument("--summary-only", action="store_true",
@@ -264,6 +269,27 @@ def main():
                         w.writerow([str(pth), pth.exists(), h, size, mtime])
             return
 
+        # Optional result cache: a hit materializes the stored outputs and skips build + solve
+        result_cache = cache_key = None
+        cache_hit = False
+        if args.result_cache:
+            try:
+                from .io.result_cache import ResultCache, cache_key as _cache_key, run_inputs_config
+                from .core.build import run_input_files
+            except Exception:
+                from src.io.result_cache import ResultCache, cache_key as _cache_key, run_inputs_config
+                from src.core.build import run_input_files
+            if args.out_dir is None:
+                raise ConfigError("--result-cache needs --out-dir", suggested_fix="Pass --out-dir <run directory>")
+            # Key on the files the build itself reads (<params-dir>/config.yaml, legacy TXT, tables)
+            key_inputs = run_input_files(args.params_dir, args.absorption_model)
+            max_bytes = int(args.result_cache_max_gb * 1e9) if args.result_cache_max_gb else None
+            result_cache = ResultCache(args.result_cache, max_bytes=max_bytes)
+            cache_key = _cache_key(dict(run_inputs_config(key_inputs), no_solve=bool(args.no_solve)),
+                                   args.absorption_model)
+            cache_hit = result_cache.materialize(cache_key, args.out_dir.resolve()) is not None
+            log("INFO", event="result_cache_hit" if cache_hit else "result_cache_miss", key=cache_key)
+
         # Variant dispatch
         if args.absorption_model == "kumar":
             try:
@@ -276,7 +302,9 @@ def main():
             except Exception:
                 from models.fresnel_model import build as build_variant
         # Build (and possibly solve) with optional milestone runner
-        if args.emit_milestones:
+        if cache_hit:
+            pass
+        elif args.emit_milestones:
             try:
                 from .core.solvers.runner import run as runner_run
             except Exception:
@@ -359,6 +387,9 @@ def main():
             out_dir / "pp_radius_vs_time.csv",
             out_dir / "pp_energy_vs_time.csv",
         ]
+        if result_cache is not None and not cache_hit:
+            result_cache.put(cache_key, [p for p in outs if p.is_file()],
+                             meta={"variant": args.absorption_model, "no_solve": bool(args.no_solve)})
         man_o = Path(out_dir) / "outputs_manifest.csv"
         with man_o.open("w", newline="", encoding="utf-8") as f:
             w = csv.writer(f); w.writerow(["path", "exists", "sha256", "size_bytes", "mtime_iso"])
@@ -405,16 +436,21 @@ if __name__ == "__main__":
 def load_fresnel_tables(repo_root: Path) -> dict:
     """Load precomputed Sizyuk tables (CSV) from data/derived/sizyuk.
 
-    Returns a dict with pandas DataFrames for 'absorptivity', 'reflectivity' when present.
-    Does not import COMSOL/mph; safe for tests.
+    Returns a dict with pandas DataFrames for 'absorptivity', 'reflectivity' when present,
+    plus the shared interpolating indexes under 'absorptivity_index'/'reflectivity_index'.
+    Tables come from the process-wide cache in `io.absorptivity` (parsed once per file
+    version). Does not import COMSOL/mph; safe for tests.
     """
-    import pandas as pd
-    base = repo_root / "data" / "derived" / "sizyuk"
+    try:
+        from .io.absorptivity import load_table, SIZYUK_TABLE_DIR, ABSORPTIVITY_CSV, REFLECTIVITY_CSV
+    except Exception:
+        from src.io.absorptivity import load_table, SIZYUK_TABLE_DIR, ABSORPTIVITY_CSV, REFLECTIVITY_CSV
+    base = repo_root / SIZYUK_TABLE_DIR
     out = {}
-    fA = base / "absorptivity_vs_lambda.csv"
-    fR = base / "reflectivity_vs_lambda.csv"
-    if fA.is_file():
-        out["absorptivity"] = pd.read_csv(fA)
-    if fR.is_file():
-        out["reflectivity"] = pd.read_csv(fR)
+    for key, fn, col in (("absorptivity", ABSORPTIVITY_CSV, "A"), ("reflectivity", REFLECTIVITY_CSV, "R")):
+        f = base / fn
+        if f.is_file():
+            table = load_table(f, col)
+            out[key] = table.to_frame()
+            out[f"{key}_index"] = table
     return out
@@ -9,35 +9,55 @@ Purpose
 
 Inputs
 - n,k optical data vs wavelength λ (xlsx or csv). Columns order: [λ(µm), n, k].
+  Parsed arrays are cached by file sha256 under `data/derived/nk_cache/` (override with
+  `EUV_NK_CACHE_DIR`) and memory-mapped on later loads.
 
 Outputs (canonical paths relative to repo root)
 - Tables (for solver): `data/derived/sizyuk/`
   - `absorptivity_vs_lambda.csv` with columns: `lambda_um`, `A` (unitless)
   - `reflectivity_vs_lambda.csv` with columns: `lambda_um`, `R` (unitless)
-  - `sizyuk_manifest.json` with summary metadata
+  - `absorptivity_oblique.npz` with arrays `lambda_um`, `theta_rad`, `A` (shape 3×nλ×nθ; s, p, unpolarized)
+  - `sizyuk_manifest.json` with summary metadata, the n,k sha256, resolved config and
+    per-artifact keys; `run_sizyuk` only rebuilds artifacts whose key changed
 - Plots (inspection): `results/sizyuk/plots/`
-  - `absorptivity_vs_lambda.png`
+  - `absorptivity_vs_lambda.png` (drawn by `visualization.sizyuk_plots`, imported only when
+    plotting; optionally rendered in a background process)
 
 Module API
 - `run_sizyuk(nk_path, out_tables_dir, out_plots_dir, config)` to compute and save artifacts.
+- `fresnel_optics(lam_um, lam_tab, n_tab, k_tab, n_medium)` vectorized A, R and skin depth
+  over λ arrays (and several n_medium) returned as a structured array.
+- `fresnel_oblique(...)`, `precompute_oblique_table(...)`, `ObliqueAbsorptivity` for
+  angle- and polarization-resolved absorptivity.
+- `GaussianIntensityField(x, y, P_t, x0, y0, w0, t)` lazy I(x,y,t) kept as P(t) times a
+  separable spatial kernel; slices, chunks and reductions without the dense tensor.
+- `integrate_absorbed_energy(R, w0, A, P, t_span, ...)` adaptive Gauss–Legendre absorbed
+  energy with an error estimate, vectorized over (R, w0, A, offset) scenarios.
+- `ScenarioBatch` struct-of-arrays scenarios with `intercepted_fraction_gaussian_batch`,
+  `q_abs_hemisphere_batch`, `integrate_q_abs_sphere_batch`, `absorbed_energy_batch`.
 
 Assumptions & Units
 - Power P(t): W, intensity I: W/m^2, flux q_abs: W/m^2, energy: J.
 - Normal incidence absorptivity: A = 1 − R, with metal reflectance at normal incidence:
   R = ((n − n_m)^2 + k^2)/((n + n_m)^2 + k^2), default medium index n_m = 1.
-- This module currently computes normal-incidence properties only; oblique incidence
-  requires polarization-aware Fresnel equations and is left for a future extension within Sizyuk.
+- Oblique incidence uses the polarization-aware Fresnel equations for a complex index
+  N = n + ik. `precompute_oblique_table` writes A(λ, θ) for s, p and unpolarized light on a
+  uniform grid (`absorptivity_oblique.npz`); `ObliqueAbsorptivity` answers bilinear lookups
+  in O(1) so hot loops never evaluate the Fresnel equations.
 """
 
 from dataclasses import dataclass
 import numpy as np
 import math
+import os
+import time
+import hashlib
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, Dict
 
 import json
 import pandas as pd
-import matplotlib.pyplot as plt
 try:
     import yaml  # optional for CLI config parsing
 except Exception:
@@ -53,7 +73,81 @@ class Scenario:
     y_beam: float = 0.0     # beam center y (m)
     use_area_average: bool = False  # if True, treat all power as on πR^2; else use Gaussian footprint
 
-def load_nk_excel(path:str):
+# Parsed n,k tables are cached as (3, N) float64 .npy files named by the source file's
+# sha256, so repeat builds and sweep workers skip xlsx/csv parsing (and openpyxl).
+NK_CACHE_ENV = "EUV_NK_CACHE_DIR"
+_NK_CACHE_VERSION = 1
+_NK_MEMO: Dict[tuple, tuple] = {}
+
+
+def nk_cache_dir() -> Path:
+    """Directory for cached n,k arrays (``$EUV_NK_CACHE_DIR`` or ``data/derived/nk_cache``)."""
+    env = os.environ.get(NK_CACHE_ENV)
+    return Path(env) if env else Path.cwd() / "data" / "derived" / "nk_cache"
+
+
+_DIGEST_MEMO: Dict[tuple, str] = {}
+
+
+def _sha256_file(path: Path) -> str:
+    path = Path(path)
+    st = path.stat()
+    memo_key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+    hit = _DIGEST_MEMO.get(memo_key)
+    if hit is not None:
+        return hit
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    _DIGEST_MEMO[memo_key] = h.hexdigest()
+    return _DIGEST_MEMO[memo_key]
+
+
+def _load_nk_cached(path: Path, parser):
+    """Return (λ, n, k) for ``path``, parsing with ``parser`` only on a cache miss.
+
+    Lookup order: in-process memo keyed by (path, mtime, size) → memory-mapped
+    ``<sha256>.v<N>.npy`` under `nk_cache_dir()` → ``parser(path)``. Cache writes are
+    atomic (temp file + rename) so concurrent workers never read a partial file.
+    """
+    path = Path(path)
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    memo_key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+    hit = _NK_MEMO.get(memo_key)
+    if hit is not None:
+        return hit
+
+    digest = _sha256_file(path)
+    cache_file = nk_cache_dir() / f"{digest}.v{_NK_CACHE_VERSION}.npy"
+    arr = None
+    if cache_file.is_file():
+        try:
+            arr = np.load(cache_file, mmap_mode="r")
+        except Exception:
+            arr = None
+    if arr is None:
+        parsed = parser(path)
+        if parsed is None:
+            return None
+        arr = np.vstack([np.asarray(a, dtype=float) for a in parsed])
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with tmp.open("wb") as f:
+                np.save(f, arr)
+            os.replace(tmp, cache_file)
+        except OSError:
+            pass  # read-only location: still return the parsed arrays
+    out = (arr[0], arr[1], arr[2])
+    _NK_MEMO[memo_key] = out
+    return out
+
+
+def _parse_nk_excel(path):
     df = None
     try:
         df = __import__('pandas').read_excel(path)
@@ -65,18 +159,172 @@ def load_nk_excel(path:str):
     mask = np.isfinite(lam) & np.isfinite(n) & np.isfinite(k)
     return lam[mask], n[mask], k[mask]
 
+
+def load_nk_excel(path:str):
+    return _load_nk_cached(Path(path), _parse_nk_excel)
+
+# Structured record returned by the vectorized optics kernel (one entry per λ, n_medium)
+OPTICS_DTYPE = np.dtype([
+    ("lambda_um", "f8"),
+    ("n_medium", "f8"),
+    ("A", "f8"),
+    ("R", "f8"),
+    ("delta_m", "f8"),
+])
+
+
+def _sorted_nk(lam_um_array, n_array, k_array):
+    """Return (λ, n, k) as float arrays sorted by λ (np.interp needs increasing λ)."""
+    lam = np.asarray(lam_um_array, dtype=float)
+    n = np.asarray(n_array, dtype=float)
+    k = np.asarray(k_array, dtype=float)
+    if lam.size > 1 and not np.all(np.diff(lam) > 0):
+        order = np.argsort(lam, kind="stable")
+        lam, n, k = lam[order], n[order], k[order]
+    return lam, n, k
+
+
+def fresnel_optics(lam_um, lam_um_array, n_array, k_array, n_medium=1.0) -> np.ndarray:
+    """Normal-incidence optics over whole λ arrays (and several n_medium) in one pass.
+
+    n and k are interpolated once for all requested wavelengths, then
+    R = ((n − n_m)^2 + k^2)/((n + n_m)^2 + k^2), A = 1 − R and the skin depth
+    δ = λ/(4πk) are evaluated with array arithmetic (no Python loop).
+
+    Returns a structured array (OPTICS_DTYPE). Its shape is ``shape(lam_um)`` for a
+    scalar ``n_medium`` and ``shape(n_medium) + shape(lam_um)`` otherwise.
+    """
+    lam_tab, n_tab, k_tab = _sorted_nk(lam_um_array, n_array, k_array)
+    lam = np.asarray(lam_um, dtype=float)
+    n_m = np.asarray(n_medium, dtype=float)
+    n = np.interp(lam, lam_tab, n_tab)
+    k = np.interp(lam, lam_tab, k_tab)
+    # Broadcast media along a leading axis: (n_media, ...) x (λ...)
+    nm = n_m.reshape(n_m.shape + (1,) * lam.ndim)
+    k2 = k * k
+    R = ((n - nm) ** 2 + k2) / ((n + nm) ** 2 + k2)
+    with np.errstate(divide="ignore"):
+        delta = (lam * 1e-6) / (4.0 * math.pi * k)
+
+    out = np.empty(R.shape, dtype=OPTICS_DTYPE)
+    out["lambda_um"] = lam
+    out["n_medium"] = nm
+    out["R"] = R
+    out["A"] = 1.0 - R
+    out["delta_m"] = delta
+    return out
+
+
 def absorptivity_from_nk(lam_um:float, lam_um_array, n_array, k_array, n_medium:float=1.0) -> float:
-    n = float(np.interp(lam_um, lam_um_array, n_array))
-    k = float(np.interp(lam_um, lam_um_array, k_array))
-    R = ((n - n_medium)**2 + k**2) / ((n + n_medium)**2 + k**2)
-    return 1.0 - R
+    A = fresnel_optics(lam_um, lam_um_array, n_array, k_array, n_medium=n_medium)["A"]
+    return float(A) if A.ndim == 0 else A
 
 def skin_depth_m(lam_um:float, lam_um_array, k_array) -> float:
-    k = float(np.interp(lam_um, lam_um_array, k_array))
-    lam_m = lam_um * 1e-6
-    return lam_m/(4.0*math.pi*k)
+    # n does not enter δ; pass k as a placeholder for the n column
+    delta = fresnel_optics(lam_um, lam_um_array, k_array, k_array)["delta_m"]
+    return float(delta) if delta.ndim == 0 else delta
+
+POLARIZATIONS = ("s", "p", "unpolarized")
+OBLIQUE_TABLE_NAME = "absorptivity_oblique.npz"
+
+
+def fresnel_oblique(lam_um, theta_rad, lam_um_array, n_array, k_array, n_medium:float=1.0):
+    """Polarization-resolved absorptivity A(λ, θ) for a metal with index N = n + ik.
+
+    θ is the angle of incidence measured from the surface normal (radians).
+    Uses cosθ_t = sqrt(1 − (n_m sinθ/N)^2) and
+      r_s = (n_m cosθ − N cosθ_t)/(n_m cosθ + N cosθ_t)
+      r_p = (N cosθ − n_m cosθ_t)/(N cosθ + n_m cosθ_t)
+    Returns (A_s, A_p, A_u) each with shape (len(λ), len(θ)); A_u = (A_s + A_p)/2.
+    At θ = 0 all three reduce to the normal-incidence result of `fresnel_optics`.
+    """
+    lam_tab, n_tab, k_tab = _sorted_nk(lam_um_array, n_array, k_array)
+    lam = np.atleast_1d(np.asarray(lam_um, dtype=float))
+    th = np.atleast_1d(np.asarray(theta_rad, dtype=float))
+    N = (np.interp(lam, lam_tab, n_tab) + 1j * np.interp(lam, lam_tab, k_tab))[:, None]
+    ci = np.cos(th)[None, :]
+    si = np.sin(th)[None, :]
+    ct = np.sqrt(1.0 - (n_medium * si / N) ** 2)
+    rs = (n_medium * ci - N * ct) / (n_medium * ci + N * ct)
+    rp = (N * ci - n_medium * ct) / (N * ci + n_medium * ct)
+    A_s = 1.0 - np.abs(rs) ** 2
+    A_p = 1.0 - np.abs(rp) ** 2
+    return A_s, A_p, 0.5 * (A_s + A_p)
+
+
+def precompute_oblique_table(lam_um_array, n_array, k_array, out_path: Path,
+                             n_medium:float=1.0, n_lambda:int=512, n_theta:int=181) -> Path:
+    """Write A(λ, θ) for s, p and unpolarized light on a uniform (λ, θ) grid.
+
+    The grid spans the λ range of the n,k data and θ ∈ [0, π/2]. Uniform spacing is
+    what makes `ObliqueAbsorptivity` lookups O(1) (index arithmetic, no search).
+    """
+    lam_tab, n_tab, k_tab = _sorted_nk(lam_um_array, n_array, k_array)
+    lam_grid = np.linspace(lam_tab[0], lam_tab[-1], max(int(n_lambda), 2))
+    th_grid = np.linspace(0.0, 0.5 * math.pi, max(int(n_theta), 2))
+    A = np.stack(fresnel_oblique(lam_grid, th_grid, lam_tab, n_tab, k_tab, n_medium=n_medium))
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out_path.with_name(f"{out_path.name}.{os.getpid()}.tmp")
+    with tmp.open("wb") as f:
+        np.savez(f, lambda_um=lam_grid, theta_rad=th_grid, A=A,
+                 polarizations=np.array(POLARIZATIONS), n_medium=np.float64(n_medium))
+    os.replace(tmp, out_path)
+    return out_path
+
+
+class ObliqueAbsorptivity:
+    """O(1) bilinear lookup of precomputed A(λ, θ) tables.
+
+    Call with λ (µm) and incidence angle θ (rad, from the surface normal); both may be
+    arrays and are broadcast together. Queries outside the grid are clamped to its edges
+    (θ is folded with |θ| first).
+    """
+
+    def __init__(self, lambda_um, theta_rad, A):
+        self.lambda_um = np.asarray(lambda_um, dtype=float)
+        self.theta_rad = np.asarray(theta_rad, dtype=float)
+        self.A = np.asarray(A, dtype=float)
+        if self.A.shape != (len(POLARIZATIONS), self.lambda_um.size, self.theta_rad.size):
+            raise ValueError("A must have shape (3, len(lambda_um), len(theta_rad))")
+        self._l0 = self.lambda_um[0]
+        # A degenerate (single-λ) grid still needs a non-zero step for the index arithmetic
+        self._dl = (self.lambda_um[-1] - self.lambda_um[0]) / (self.lambda_um.size - 1) or 1.0
+        self._t0 = self.theta_rad[0]
+        self._dt = (self.theta_rad[-1] - self.theta_rad[0]) / (self.theta_rad.size - 1)
+
+    @classmethod
+    def load(cls, path: Path) -> "ObliqueAbsorptivity":
+        with np.load(Path(path)) as z:
+            return cls(z["lambda_um"], z["theta_rad"], z["A"])
+
+    @staticmethod
+    def _cell(x, x0, dx, n):
+        u = np.clip((x - x0) / dx, 0.0, n - 1.0)
+        i = np.minimum(u.astype(np.intp), n - 2)
+        return i, u - i
+
+    def __call__(self, lam_um, theta_rad, polarization:str="unpolarized"):
+        try:
+            grid = self.A[POLARIZATIONS.index(polarization)]
+        except ValueError:
+            raise ValueError(f"polarization must be one of {POLARIZATIONS}") from None
+        lam, th = np.broadcast_arrays(np.asarray(lam_um, dtype=float),
+                                      np.abs(np.asarray(theta_rad, dtype=float)))
+        i, fl = self._cell(lam, self._l0, self._dl, self.lambda_um.size)
+        j, ft = self._cell(th, self._t0, self._dt, self.theta_rad.size)
+        a00 = grid[i, j]; a01 = grid[i, j + 1]
+        a10 = grid[i + 1, j]; a11 = grid[i + 1, j + 1]
+        out = (1 - fl) * ((1 - ft) * a00 + ft * a01) + fl * ((1 - ft) * a10 + ft * a11)
+        return float(out) if out.ndim == 0 else out
+
 
 def pulse_profile(E_total:float, tau_square:float, E_ramp:float=0.0, tau_ramp:float=0.0, dt:float=None):
+    """Uniformly sampled ramp + square pulse (dt defaults to T/2000).
+
+    To use exactly the pulse COMSOL sees, compile ``Ppp_analytic_expression.txt`` with
+    `src.core.pulse.load_pulse` instead (exact energies, event-aware time grids).
+    """
     if dt is None:
         total_T = tau_square + max(tau_ramp, 0.0)
         dt = total_T/2000.0
@@ -96,29 +344,104 @@ def pulse_profile(E_total:float, tau_square:float, E_ramp:float=0.0, tau_ramp:fl
     P = np.concatenate([P_r, P_sq])
     return t, P
 
+def _trapezoid(y, x, axis:int=-1):
+    """Trapezoid rule along ``axis`` (numpy-version agnostic)."""
+    y = np.moveaxis(np.asarray(y, dtype=float), axis, -1)
+    x = np.asarray(x, dtype=float)
+    if x.size < 2:
+        return np.zeros(y.shape[:-1])
+    return np.sum(0.5 * (y[..., 1:] + y[..., :-1]) * np.diff(x), axis=-1)
+
+
+class GaussianIntensityField:
+    """Lazy, factorized Gaussian intensity I(x,y,t) = P(t) * (2/πw0^2) * g_x(x) * g_y(y).
+
+    With g_x = exp(-2(x-x0)^2/w0^2) and g_y = exp(-2(y-y0)^2/w0^2) the dense
+    (len(t), len(y), len(x)) tensor is never built unless asked for. Index it like an
+    array (``field[it]``, ``field[a:b, :, ix]``) or iterate ``chunks()`` to evaluate parts
+    on demand; reductions (`total_power`, `fluence`, `peak_intensity`) work on the factors.
+    """
+
+    def __init__(self, x, y, P_t, x0, y0, w0, t=None):
+        self.x = np.atleast_1d(np.asarray(x, dtype=float))
+        self.y = np.atleast_1d(np.asarray(y, dtype=float))
+        self.P_t = np.atleast_1d(np.asarray(P_t, dtype=float))
+        self.t = None if t is None else np.asarray(t, dtype=float)
+        if self.t is not None and self.t.shape != self.P_t.shape:
+            raise ValueError("t and P_t must have the same length")
+        self.pre = 2.0/(math.pi*w0*w0)
+        self.gx = np.exp(-2.0*(self.x - x0)**2/(w0*w0))
+        self.gy = np.exp(-2.0*(self.y - y0)**2/(w0*w0))
+
+    @property
+    def shape(self):
+        return (self.P_t.size, self.y.size, self.x.size)
+
+    @property
+    def nbytes(self) -> int:
+        """Size the materialized float64 tensor would have."""
+        return 8 * self.P_t.size * self.y.size * self.x.size
+
+    def spatial(self) -> np.ndarray:
+        """Spatial kernel (2/πw0^2) g_y ⊗ g_x with shape (len(y), len(x)) [1/m^2]."""
+        return self.pre * np.multiply.outer(self.gy, self.gx)
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key,)
+        if len(key) > 3:
+            raise IndexError("GaussianIntensityField is 3-dimensional (t, y, x)")
+        kt, ky, kx = key + (slice(None),) * (3 - len(key))
+        P, gy, gx = self.P_t[kt], self.gy[ky], self.gx[kx]
+        # Outer product of whatever survives each index, integer indices drop their axis
+        return self.pre * np.multiply.outer(np.multiply.outer(P, gy), gx)
+
+    def chunks(self, n_t:int=64):
+        """Yield (time slice, I[slice]) blocks of at most ``n_t`` time steps."""
+        for i0 in range(0, self.P_t.size, max(int(n_t), 1)):
+            sl = slice(i0, min(i0 + int(n_t), self.P_t.size))
+            yield sl, self[sl]
+
+    def materialize(self) -> np.ndarray:
+        return self[:, :, :]
+
+    def total_power(self) -> np.ndarray:
+        """Power crossing the (x, y) grid per time step, ∫∫ I dx dy [W], trapezoid rule."""
+        return self.P_t * self.pre * _trapezoid(self.gx, self.x) * _trapezoid(self.gy, self.y)
+
+    def fluence(self) -> np.ndarray:
+        """Per-pixel fluence ∫ I dt with shape (len(y), len(x)) [J/m^2]; needs ``t``."""
+        if self.t is None:
+            raise ValueError("fluence() needs the time array t")
+        return self.spatial() * float(_trapezoid(self.P_t, self.t))
+
+    def peak_intensity(self) -> float:
+        """Maximum of I over the (t, y, x) grid [W/m^2]."""
+        return float(self.pre * np.max(self.P_t) * np.max(self.gy) * np.max(self.gx))
+
+
 def gaussian_intensity(x, y, P_t, x0, y0, w0):
     """
     I(x,y,t) = (2/πw0^2) P(t) * exp(-2*r^2/w0^2), r^2=(x-x0)^2+(y-y0)^2
     Returns a 3D array with shape (len(t), len(y), len(x)) if x,y are arrays.
+    Prefer `GaussianIntensityField` for large grids; this materializes the full tensor.
     """
-    tlen = P_t.shape[0]
-    X, Y = np.meshgrid(x, y, indexing='xy')
-    r2 = (X - x0)**2 + (Y - y0)**2
-    pre = 2.0/(math.pi*w0*w0)
-    I_spatial = np.exp(-2.0*r2/(w0*w0))
-    # time broadcast
-    I = (pre * I_spatial[None, :, :] ) * P_t[:, None, None]
-    return I  # W/m^2
+    return GaussianIntensityField(x, y, P_t, x0, y0, w0).materialize()  # W/m^2
 
 def intercepted_fraction_gaussian(R:float, w0:float) -> float:
     return 1.0 - math.exp(-2.0*R*R/(w0*w0))
 
 
-def q_abs_hemisphere(scn:Scenario, t:np.ndarray, P_t:np.ndarray, A:float):
+def q_abs_hemisphere(scn:Scenario, t:np.ndarray, P_t:np.ndarray, A,
+                     lambda_um:Optional[float]=None, polarization:str="unpolarized"):
     """
     Returns θ array (radians), time array t (passed in), and q_abs(θ,t) [W/m^2].
     θ measured from +x axis; hemisphere is |θ| <= π/2.
     q_abs(θ,t) = A * I_surf(θ,t) * max(0, cosθ).
+
+    A is either a constant (normal-incidence) absorptivity or an `ObliqueAbsorptivity`
+    table; with a table, A(λ, |θ|) is looked up per surface point (the beam travels
+    along +x, so the local incidence angle equals |θ|) and `lambda_um` is required.
     """
     th = np.linspace(-math.pi/2, math.pi/2, 361)
     x_s = scn.x0 + scn.R*np.cos(th)
@@ -127,6 +450,10 @@ def q_abs_hemisphere(scn:Scenario, t:np.ndarray, P_t:np.ndarray, A:float):
     I_spatial = np.exp(-2.0*r2/(scn.w0*scn.w0))
     pre = 2.0/(math.pi*scn.w0*scn.w0)
     cos_inc = np.cos(th)
+    if isinstance(A, ObliqueAbsorptivity):
+        if lambda_um is None:
+            raise ValueError("lambda_um is required with an ObliqueAbsorptivity table")
+        A = A(lambda_um, th, polarization)[None, :]
     q = A * pre * (P_t[:, None]) * (I_spatial[None, :]) * np.maximum(0.0, cos_inc[None, :])
     return th, t, q
 
@@ -146,6 +473,237 @@ def integrate_q_abs_sphere(R:float, th:np.ndarray, t:np.ndarray, q:np.ndarray) -
     return float(E)
 
 
+@dataclass
+class QuadratureResult:
+    value: np.ndarray       # integral per scenario
+    error: np.ndarray       # estimated absolute error per scenario
+    n_evals: int            # kernel evaluations used (all scenarios)
+    converged: np.ndarray   # tolerance met per scenario
+
+
+def _adaptive_gauss_legendre(f, edges, rtol:float=1e-6, atol:float=0.0, order:int=8, max_depth:int=40):
+    """Vectorized adaptive Gauss–Legendre quadrature for many independent integrals.
+
+    ``edges`` has shape (n, m+1): scenario i is integrated over [edges[i,0], edges[i,-1]]
+    starting from the m panels between consecutive edges (put known features on edges).
+    ``f(x, idx)`` evaluates the integrand at nodes x (shape (p, order)) for the scenario
+    of each panel (idx, shape (p,)). Each panel's order-n estimate is compared with the
+    sum over its two halves; panels whose difference exceeds their share of
+    max(atol, rtol*|I|) are bisected, all scenarios advancing together in one array.
+    """
+    edges = np.asarray(edges, dtype=float)
+    n = edges.shape[0]
+    xg, wg = np.polynomial.legendre.leggauss(int(order))
+    n_evals = 0
+
+    def gl(idx, lo, hi):
+        nonlocal n_evals
+        half = 0.5 * (hi - lo)
+        x = (0.5 * (hi + lo))[:, None] + half[:, None] * xg[None, :]
+        n_evals += x.size
+        return half * (f(x, idx) @ wg)
+
+    idx = np.repeat(np.arange(n), edges.shape[1] - 1)
+    lo = edges[:, :-1].ravel(); hi = edges[:, 1:].ravel()
+    span = np.abs(edges[:, -1] - edges[:, 0])
+    span = np.where(span > 0, span, 1.0)
+    coarse = gl(idx, lo, hi)
+    value = np.zeros(n); error = np.zeros(n); converged = np.ones(n, dtype=bool)
+    for depth in range(max_depth + 1):
+        if idx.size == 0:
+            break
+        mid = 0.5 * (lo + hi)
+        left = gl(idx, lo, mid); right = gl(idx, mid, hi)
+        fine = left + right
+        err = np.abs(fine - coarse)
+        # Running estimate of each integral sets the (relative) tolerance budget
+        est = value + np.bincount(idx, weights=fine, minlength=n)
+        tol = np.maximum(atol, rtol * np.abs(est))[idx] * np.abs(hi - lo) / span[idx]
+        done = (err <= tol) | (depth == max_depth)
+        if depth == max_depth:
+            converged[np.unique(idx[err > tol])] = False
+        value += np.bincount(idx[done], weights=fine[done], minlength=n)
+        error += np.bincount(idx[done], weights=err[done], minlength=n)
+        keep = ~done
+        idx = np.concatenate([idx[keep], idx[keep]])
+        lo, hi = np.concatenate([lo[keep], mid[keep]]), np.concatenate([mid[keep], hi[keep]])
+        coarse = np.concatenate([left[keep], right[keep]])
+    return QuadratureResult(value=value, error=error, n_evals=n_evals, converged=converged)
+
+
+def integrate_absorbed_energy(R, w0, A, P, t_span=None, dy=0.0, rtol:float=1e-6, atol:float=0.0,
+                              order:int=8, t_breaks=None) -> QuadratureResult:
+    """Absorbed energy E = ∫dt ∫_0^{π/2} q_abs(θ,t) 2πR^2 sinθ dθ with adaptive quadrature.
+
+    Same kernel as `q_abs_hemisphere` + `integrate_q_abs_sphere`:
+      q_abs = A (2/πw0^2) P(t) exp(-2(R sinθ − dy)^2/w0^2) cosθ,  dy = y_beam − y0.
+    R, w0, A and dy broadcast to n scenarios integrated in one vectorized call. P is a
+    vectorized callable P(t) [W] integrated over ``t_span`` (optional ``t_breaks`` mark
+    pulse edges; a `core.pulse.CompiledPulse` supplies both), or a number taken as the
+    pulse energy ∫P dt [J]. Because q_abs
+    factorizes into P(t) times a θ kernel, E = (∫P dt)·(∫kernel dθ); the two adaptive
+    integrals share the tolerance and their errors are combined to first order.
+    Initial θ panels are split at the beam centre and ±4 w0/R around it, so narrow
+    beams (w0 ≪ R) are resolved rather than missed by the first nodes.
+    """
+    R, w0, A, dy = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float)) for v in (R, w0, A, dy)))
+    R, w0, A, dy = (v.ravel() for v in (R, w0, A, dy))
+    half_pi = 0.5 * math.pi
+
+    th_c = np.arcsin(np.clip(dy / R, 0.0, 1.0))
+    w_th = 4.0 * w0 / R
+    edges = np.stack([np.zeros_like(R), np.clip(th_c - w_th, 0.0, half_pi), th_c,
+                      np.clip(th_c + w_th, 0.0, half_pi), np.full_like(R, half_pi)], axis=1)
+    edges = np.sort(edges, axis=1)
+    pre = A * (2.0/(math.pi*w0*w0)) * 2.0 * math.pi * R * R
+
+    def kernel(th, i):
+        s = np.sin(th)
+        return pre[i, None] * np.exp(-2.0*(R[i, None]*s - dy[i, None])**2/(w0[i, None]**2)) * np.cos(th) * s
+
+    S = _adaptive_gauss_legendre(kernel, edges, rtol=0.5*rtol, atol=0.0, order=order)
+
+    if callable(P) and hasattr(P, "breakpoints"):
+        # `core.pulse.CompiledPulse`: its smoothed-step edges are the natural panel breaks
+        t_span = P.support if t_span is None else t_span
+        t_breaks = P.breakpoints if t_breaks is None else t_breaks
+    if callable(P):
+        if t_span is None:
+            raise ValueError("t_span is required when P is a callable")
+        t0, t1 = float(t_span[0]), float(t_span[1])
+        tb = np.unique(np.clip(np.concatenate([[t0, t1], np.ravel(t_breaks if t_breaks is not None else [])]), t0, t1))
+        T = _adaptive_gauss_legendre(lambda t, _i: np.asarray(P(t), dtype=float), tb[None, :],
+                                     rtol=0.5*rtol, atol=0.0, order=order)
+        E_p, E_p_err, n_t, ok_t = float(T.value[0]), float(T.error[0]), T.n_evals, bool(T.converged[0])
+    else:
+        E_p, E_p_err, n_t, ok_t = float(P), 0.0, 0, True
+
+    value = E_p * S.value
+    error = np.abs(E_p) * S.error + np.abs(S.value) * E_p_err
+    converged = S.converged & ok_t & (error <= np.maximum(atol, rtol * np.abs(value)) + 1e-300)
+    return QuadratureResult(value=value, error=error, n_evals=S.n_evals + n_t, converged=converged)
+
+
+@dataclass
+class ScenarioBatch:
+    """Struct-of-arrays counterpart of `Scenario` for design-space scans.
+
+    Every field is a 1D float array of the same length (scalars broadcast on init);
+    ``A`` carries a per-scenario absorptivity so alignment/absorptivity screens run as
+    single NumPy calls through the ``*_batch`` helpers.
+    """
+    R: np.ndarray
+    w0: np.ndarray
+    x0: np.ndarray = 0.0
+    y0: np.ndarray = 0.0
+    x_beam: np.ndarray = 0.0
+    y_beam: np.ndarray = 0.0
+    A: np.ndarray = 1.0
+
+    def __post_init__(self):
+        names = ("R", "w0", "x0", "y0", "x_beam", "y_beam", "A")
+        arrays = np.broadcast_arrays(*(np.atleast_1d(np.asarray(getattr(self, k), dtype=float)) for k in names))
+        for k, v in zip(names, arrays):
+            setattr(self, k, np.ascontiguousarray(v.ravel()))
+
+    def __len__(self) -> int:
+        return self.R.size
+
+    @classmethod
+    def from_scenarios(cls, scenarios, A=1.0) -> "ScenarioBatch":
+        scenarios = list(scenarios)
+        col = lambda k: np.array([getattr(s, k) for s in scenarios], dtype=float)
+        return cls(R=col("R"), w0=col("w0"), x0=col("x0"), y0=col("y0"),
+                   x_beam=col("x_beam"), y_beam=col("y_beam"), A=A)
+
+    @classmethod
+    def from_grid(cls, R, w0, y_offset=0.0, A=1.0, x_offset=0.0) -> "ScenarioBatch":
+        """Cartesian product of the given axes (droplet at the origin, beam offset by x/y_offset)."""
+        axes = np.meshgrid(*(np.atleast_1d(np.asarray(v, dtype=float)) for v in (R, w0, y_offset, A, x_offset)),
+                           indexing="ij")
+        R_g, w0_g, dy_g, A_g, dx_g = (a.ravel() for a in axes)
+        return cls(R=R_g, w0=w0_g, x_beam=dx_g, y_beam=dy_g, A=A_g)
+
+    def scenario(self, i:int) -> Scenario:
+        return Scenario(R=float(self.R[i]), w0=float(self.w0[i]), x0=float(self.x0[i]), y0=float(self.y0[i]),
+                        x_beam=float(self.x_beam[i]), y_beam=float(self.y_beam[i]))
+
+    @property
+    def dy(self) -> np.ndarray:
+        return self.y_beam - self.y0
+
+    @property
+    def offset(self) -> np.ndarray:
+        return np.hypot(self.x_beam - self.x0, self.y_beam - self.y0)
+
+
+def _i0e(x:np.ndarray) -> np.ndarray:
+    """Exponentially scaled modified Bessel function exp(-x)·I0(x) for x ≥ 0 (NumPy only)."""
+    x = np.asarray(x, dtype=float)
+    small = x < 50.0
+    xs = np.where(small, x, 0.0)
+    xl = np.where(small, 1.0, x)
+    inv = 1.0 / (8.0*xl)
+    asym = (1.0 + inv*(1.0 + inv*(4.5 + inv*37.5))) / np.sqrt(2.0*math.pi*xl)
+    return np.where(small, np.i0(xs)*np.exp(-xs), asym)
+
+
+def intercepted_fraction_gaussian_batch(batch:ScenarioBatch, rtol:float=1e-10) -> np.ndarray:
+    """Fraction of Gaussian beam power falling on the droplet disk, per scenario.
+
+    Generalizes `intercepted_fraction_gaussian` to a beam offset d. In droplet-centred polar
+    coordinates the azimuthal integral is closed form (Rice distribution), leaving the smooth
+    radial integral ∫_0^R (4r/w0^2) exp(-2(r-d)^2/w0^2) I0e(4rd/w0^2) dr, evaluated for all
+    scenarios at once with the adaptive Gauss–Legendre rule. d = 0 gives 1 − exp(−2R^2/w0^2).
+    """
+    R, w0, d = batch.R, batch.w0, batch.offset
+    w2 = w0 * w0
+    # break at the ring r = d where the integrand peaks and ±4 w0 around it, so narrow
+    # beams are resolved by the initial panels
+    ring = np.clip(d, 0.0, R)
+    edges = np.stack([np.zeros_like(R), np.clip(d - 4.0*w0, 0.0, R), ring,
+                      np.clip(d + 4.0*w0, 0.0, R), R], axis=1)
+
+    def radial(r, i):
+        di, wi = d[i, None], w2[i, None]
+        return (4.0*r/wi) * np.exp(-2.0*(r - di)**2/wi) * _i0e(4.0*r*di/wi)
+
+    frac = _adaptive_gauss_legendre(radial, edges, rtol=rtol, atol=1e-14).value
+    return np.clip(frac, 0.0, 1.0)
+
+
+def q_abs_hemisphere_batch(batch:ScenarioBatch, t:np.ndarray, P_t:np.ndarray, th:Optional[np.ndarray]=None):
+    """Batched `q_abs_hemisphere`: returns θ, t and q_abs with shape (len(batch), len(t), len(θ)).
+
+    The dense result grows as n·nt·nθ; for large scans prefer `absorbed_energy_batch`.
+    """
+    th = np.linspace(-math.pi/2, math.pi/2, 361) if th is None else np.asarray(th, dtype=float)
+    y_s = batch.y0[:, None] + batch.R[:, None]*np.sin(th)[None, :]
+    w2 = (batch.w0*batch.w0)[:, None]
+    spatial = (batch.A[:, None] * 2.0/(math.pi*w2)) * np.exp(-2.0*(y_s - batch.y_beam[:, None])**2/w2)
+    spatial = spatial * np.maximum(0.0, np.cos(th))[None, :]
+    q = np.asarray(P_t, dtype=float)[None, :, None] * spatial[:, None, :]
+    return th, t, q
+
+
+def integrate_q_abs_sphere_batch(batch:ScenarioBatch, th:np.ndarray, t:np.ndarray, q:np.ndarray) -> np.ndarray:
+    """Batched `integrate_q_abs_sphere` (same rectangle rule) over q of shape (n, nt, nθ)."""
+    dθ = th[1] - th[0]
+    dt = (t[1] - t[0]) if t.size > 1 else 1.0
+    mask = th >= 0.0
+    band = 2.0 * math.pi * np.sin(th[mask]) * dθ
+    return (batch.R * batch.R) * np.einsum("itj,j->i", q[:, :, mask], band) * dt
+
+
+def absorbed_energy_batch(batch:ScenarioBatch, E_pulse, rtol:float=1e-6) -> QuadratureResult:
+    """Absorbed energy for every scenario in one vectorized adaptive quadrature call.
+
+    ``E_pulse`` is the pulse energy [J] or a callable P(t) (then use
+    `integrate_absorbed_energy` directly to pass t_span/t_breaks).
+    """
+    return integrate_absorbed_energy(batch.R, batch.w0, batch.A, E_pulse, dy=batch.dy, rtol=rtol)
+
+
 def _load_cfg(path: Optional[Path]) -> Optional[Dict]:
     """Load a small JSON or YAML config into a dict (or return None)."""
     if not path:
@@ -161,11 +719,7 @@ def _load_cfg(path: Optional[Path]) -> Optional[Dict]:
         return None
 
 
-def _load_nk_any(path: Path):
-    """Load n,k data from xlsx or csv; returns (lambda_um, n, k) as 1D numpy arrays."""
-    if path.suffix.lower() in (".xlsx", ".xls"):
-        lam, n, k = load_nk_excel(str(path))
-        return np.asarray(lam), np.asarray(n), np.asarray(k)
+def _parse_nk_csv(path: Path):
     # CSV: expect 3 columns (lambda_um, n, k) with or without headers
     df = pd.read_csv(path)
     if df.shape[1] < 3:
@@ -177,83 +731,207 @@ def _load_nk_any(path: Path):
     return lam[mask], n[mask], k[mask]
 
 
-def _plot_absorptivity(lambda_um: np.ndarray, A: np.ndarray, out_png: Path):
-    out_png.parent.mkdir(parents=True, exist_ok=True)
-    fig, ax = plt.subplots(figsize=(6, 4))
-    ax.plot(lambda_um, A, lw=2)
-    ax.set_xlabel("Wavelength λ (µm)")
-    ax.set_ylabel("Absorptivity A (normal incidence)")
-    ax.grid(True, alpha=0.3)
-    fig.tight_layout()
-    fig.savefig(out_png, dpi=150)
-    plt.close(fig)
+def _load_nk_any(path: Path):
+    """Load n,k data from xlsx or csv; returns (lambda_um, n, k) as 1D numpy arrays."""
+    if path.suffix.lower() in (".xlsx", ".xls"):
+        lam, n, k = load_nk_excel(str(path))
+    else:
+        lam, n, k = _load_nk_cached(path, _parse_nk_csv)
+    return np.asarray(lam), np.asarray(n), np.asarray(k)
+
+
+def _sizyuk_plots():
+    """Import the plotting module lazily so builds and sweep workers never load matplotlib."""
+    try:
+        from .visualization import sizyuk_plots
+    except ImportError:  # executed as a script (src/ on sys.path)
+        from visualization import sizyuk_plots
+    return sizyuk_plots
+
+
+# Manifest format/code version: bump when table contents change for identical inputs.
+SIZYUK_MANIFEST_VERSION = 2
+SIZYUK_MANIFEST_NAME = "sizyuk_manifest.json"
+_SIZYUK_DEFAULTS = {"n_medium": 1.0, "oblique_n_lambda": 512, "oblique_n_theta": 181,
+                    "plot": True, "plot_dpi": 150, "plot_mode": "inline"}
+# Config keys each artifact depends on (besides the n,k file digest and manifest version)
+_ARTIFACT_DEPS = {
+    "tables": ("n_medium",),
+    "absorptivity_oblique": ("n_medium", "oblique_n_lambda", "oblique_n_theta"),
+    "plots": ("n_medium", "plot", "plot_dpi"),
+}
+
+
+def _sizyuk_config(config: Optional[Dict]) -> Dict:
+    cfg = dict(_SIZYUK_DEFAULTS)
+    if config and isinstance(config, dict):
+        for key in cfg:
+            if config.get(key) is not None:
+                cfg[key] = config[key]
+    cfg["n_medium"] = float(cfg["n_medium"])
+    cfg["oblique_n_lambda"] = int(cfg["oblique_n_lambda"])
+    cfg["oblique_n_theta"] = int(cfg["oblique_n_theta"])
+    cfg["plot"] = bool(cfg["plot"])
+    cfg["plot_dpi"] = int(cfg["plot_dpi"])
+    if cfg["plot_mode"] not in ("inline", "background"):
+        raise ValueError(f"plot_mode must be 'inline' or 'background', got {cfg['plot_mode']!r}")
+    return cfg
+
+
+def _artifact_key(name: str, nk_sha256: str, cfg: Dict) -> str:
+    payload = {"artifact": name, "version": SIZYUK_MANIFEST_VERSION, "nk_sha256": nk_sha256,
+               "config": {k: cfg[k] for k in _ARTIFACT_DEPS[name]}}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _read_manifest(path: Path) -> Dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+
+
+@contextmanager
+def _file_lock(path: Path, timeout: float = 600.0, poll: float = 0.05):
+    """Exclusive inter-process lock on ``path`` (``fcntl.flock``; O_EXCL lock file fallback)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        import fcntl
+    except ImportError:  # pragma: no cover - non-POSIX platforms
+        fcntl = None
+    deadline = time.monotonic() + timeout
+    if fcntl is not None:
+        with path.open("a+") as fh:
+            while True:
+                try:
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except OSError:
+                    if time.monotonic() > deadline:
+                        raise TimeoutError(f"Timed out waiting for lock {path}")
+                    time.sleep(poll)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+        return
+    while True:  # pragma: no cover - non-POSIX platforms
+        try:
+            fd = os.open(str(path) + ".excl", os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Timed out waiting for lock {path}")
+            time.sleep(poll)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        os.unlink(str(path) + ".excl")
+
+
+def _atomic_to_csv(df, path: Path) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    df.to_csv(tmp, index=False)
+    os.replace(tmp, path)
 
 
 def run_sizyuk(nk_path: Path,
                out_tables_dir: Path,
                out_plots_dir: Path,
-               config: Optional[Dict] = None) -> Dict:
+               config: Optional[Dict] = None,
+               force: bool = False) -> Dict:
     """Compute Fresnel/absorption-related parameters based on Sizyuk.
 
     Inputs
     - nk_path: path to n,k data file (xlsx/csv)
     - out_tables_dir: destination for CSV/JSON tables (created if missing)
     - out_plots_dir: destination for figures/plots (created if missing)
-    - config: optional dict (e.g., {"n_medium": 1.0})
+    - config: optional dict (keys: n_medium, oblique_n_lambda, oblique_n_theta, plot, plot_dpi,
+      plot_mode). ``plot_mode="background"`` renders PNGs in a worker process after the
+      tables are written; join with `visualization.sizyuk_plots.wait_for_plots`.
+    - force: regenerate every artifact even if the manifest says it is fresh
 
     Returns
-    - dict manifest with file paths to generated tables/plots and summary stats
+    - dict manifest with file paths to generated tables/plots and summary stats;
+      ``regenerated`` lists the artifacts rebuilt by this call
 
     Notes
-    - Computes normal-incidence absorptivity only (consistent with utilities here).
+    - CSV tables hold normal-incidence A/R; the oblique s/p/unpolarized grid is written
+      alongside as a binary .npz (see `ObliqueAbsorptivity`).
+    - Incremental: the manifest records the n,k file sha256, the resolved config and a
+      per-artifact key over exactly the inputs that artifact depends on. Only artifacts whose
+      key changed (or whose file is missing) are rebuilt, so e.g. a new ``plot_dpi`` replots
+      without recomputing tables. Regeneration holds a lock file in ``out_tables_dir`` so
+      parallel sweep workers do not race to rewrite the same tables.
     - All paths are written as provided (no repo-root inference).
     """
     out_tables_dir.mkdir(parents=True, exist_ok=True)
     out_plots_dir.mkdir(parents=True, exist_ok=True)
-    lam_um, n_arr, k_arr = _load_nk_any(nk_path)
-    n_medium = 1.0
-    if config and isinstance(config, dict):
-        n_medium = float(config.get("n_medium", 1.0))
-
-    # Compute A and R at normal incidence across λ
-    A = []
-    for lam in lam_um:
-        # reuse scalar function with array context
-        A.append(absorptivity_from_nk(float(lam), lam_um, n_arr, k_arr, n_medium=n_medium))
-    A = np.asarray(A)
-    R = 1.0 - A
-
-    # Save tables
-    dfA = pd.DataFrame({"lambda_um": lam_um, "A": A})
-    dfR = pd.DataFrame({"lambda_um": lam_um, "R": R})
+    cfg = _sizyuk_config(config)
     fA = out_tables_dir / "absorptivity_vs_lambda.csv"
     fR = out_tables_dir / "reflectivity_vs_lambda.csv"
-    dfA.to_csv(fA, index=False)
-    dfR.to_csv(fR, index=False)
-
-    # Plot
+    fOb = out_tables_dir / OBLIQUE_TABLE_NAME
     fA_png = out_plots_dir / "absorptivity_vs_lambda.png"
-    _plot_absorptivity(lam_um, A, fA_png)
-
-    # Manifest
-    manifest = {
-        "nk_file": str(nk_path),
-        "tables": {
-            "absorptivity_vs_lambda": str(fA),
-            "reflectivity_vs_lambda": str(fR),
-        },
-        "plots": {
-            "absorptivity_vs_lambda": str(fA_png)
-        },
-        "summary": {
-            "n_medium": n_medium,
-            "lambda_min_um": float(np.min(lam_um)) if lam_um.size else None,
-            "lambda_max_um": float(np.max(lam_um)) if lam_um.size else None,
+    outputs = {"tables": (fA, fR), "absorptivity_oblique": (fOb,), "plots": (fA_png,) if cfg["plot"] else ()}
+    mf_path = out_tables_dir / SIZYUK_MANIFEST_NAME
+
+    with _file_lock(out_tables_dir / ".sizyuk.lock"):
+        nk_sha = _sha256_file(nk_path)
+        keys = {name: _artifact_key(name, nk_sha, cfg) for name in _ARTIFACT_DEPS}
+        previous = _read_manifest(mf_path)
+        prev_keys = previous.get("artifacts", {}) if previous.get("version") == SIZYUK_MANIFEST_VERSION else {}
+        stale = [name for name in _ARTIFACT_DEPS
+                 if force or prev_keys.get(name) != keys[name] or not all(p.is_file() for p in outputs[name])]
+        if not stale:
+            return dict(previous, regenerated=[])
+
+        lam_um, n_arr, k_arr = _load_nk_any(nk_path)
+        n_medium = cfg["n_medium"]
+        # Compute A and R at normal incidence across λ (single vectorized pass)
+        optics = fresnel_optics(lam_um, lam_um, n_arr, k_arr, n_medium=n_medium)
+        A = optics["A"]
+        R = optics["R"]
+
+        if "tables" in stale:
+            _atomic_to_csv(pd.DataFrame({"lambda_um": lam_um, "A": A}), fA)
+            _atomic_to_csv(pd.DataFrame({"lambda_um": lam_um, "R": R}), fR)
+        if "absorptivity_oblique" in stale:
+            precompute_oblique_table(lam_um, n_arr, k_arr, fOb, n_medium=n_medium,
+                                     n_lambda=cfg["oblique_n_lambda"], n_theta=cfg["oblique_n_theta"])
+        if "plots" in stale and cfg["plot"]:
+            plots = _sizyuk_plots()
+            if cfg["plot_mode"] == "background":
+                plots.submit_plot(plots.plot_absorptivity, np.asarray(lam_um), np.asarray(A), fA_png,
+                                  dpi=cfg["plot_dpi"])
+            else:
+                plots.plot_absorptivity(lam_um, A, fA_png, dpi=cfg["plot_dpi"])
+
+        manifest = {
+            "version": SIZYUK_MANIFEST_VERSION,
+            "nk_file": str(nk_path),
+            "nk_sha256": nk_sha,
+            "config": cfg,
+            "artifacts": keys,
+            "tables": {
+                "absorptivity_vs_lambda": str(fA),
+                "reflectivity_vs_lambda": str(fR),
+                "absorptivity_oblique": str(fOb),
+            },
+            "plots": {
+                "absorptivity_vs_lambda": str(fA_png)
+            } if cfg["plot"] else {},
+            "summary": {
+                "n_medium": n_medium,
+                "lambda_min_um": float(np.min(lam_um)) if lam_um.size else None,
+                "lambda_max_um": float(np.max(lam_um)) if lam_um.size else None,
+            }
         }
-    }
-    # Write manifest JSON alongside tables
-    (out_tables_dir / "sizyuk_manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
-    return manifest
+        # Write manifest JSON alongside tables (atomically, after the artifacts it describes)
+        tmp = mf_path.with_name(f"{mf_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        os.replace(tmp, mf_path)
+    return dict(manifest, regenerated=stale)
 
 
 if __name__ == "__main__":
@@ -262,11 +940,15 @@ if __name__ == "__main__":
     ap.add_argument("--nk-file", required=True, help="Path to n,k xlsx/csv")
     ap.add_argument("--out-root", default="./", help="Repo-root-relative output base")
     ap.add_argument("--config", help="Optional JSON/YAML config file")
+    ap.add_argument("--force", action="store_true", help="Regenerate all artifacts even if fresh")
+    ap.add_argument("--background-plots", action="store_true", help="Render plots in a worker process")
     args = ap.parse_args()
 
     root = Path(args.out_root).resolve()
     out_tables = root / "data" / "derived" / "sizyuk"
     out_plots = root / "results" / "sizyuk" / "plots"
     cfg = _load_cfg(Path(args.config)) if args.config else None
-    manifest = run_sizyuk(Path(args.nk_file), out_tables, out_plots, cfg)
+    if args.background_plots:
+        cfg = dict(cfg or {}, plot_mode="background")
+    manifest = run_sizyuk(Path(args.nk_file), out_tables, out_plots, cfg, force=args.force)
     print(json.dumps({"status": "ok", "outputs": manifest}, indent=2))
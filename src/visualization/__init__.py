@@ -1,6 +1,7 @@
 """Visualization utilities (scaffold)
 
-Common plotting helpers for post-processing. Existing plots (e.g., Sizyuk) can
-optionally import from here in future.
+Common plotting helpers for post-processing. Modules here are imported lazily by
+their callers (e.g., `sizyuk_plots` from `pp_sizyuk.run_sizyuk`) to keep matplotlib
+off the build import path.
 """
 
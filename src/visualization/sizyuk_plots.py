@@ -0,0 +1,61 @@
+"""Sizyuk inspection plots, kept out of the build/solver import path.
+
+Imported lazily by `pp_sizyuk.run_sizyuk`; figures are drawn with the object-oriented
+Agg API (no pyplot, no GUI backend initialization). `submit_plot` renders in a single
+background worker process so table output never waits on PNG generation;
+`wait_for_plots` joins outstanding renders (also registered at interpreter exit).
+"""
+
+from __future__ import annotations
+
+import atexit
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import numpy as np
+
+
+def plot_absorptivity(lambda_um: np.ndarray, A: np.ndarray, out_png: Path, dpi: int = 150) -> Path:
+    """Write the normal-incidence absorptivity A(λ) figure to ``out_png``."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    out_png = Path(out_png)
+    out_png.parent.mkdir(parents=True, exist_ok=True)
+    fig = Figure(figsize=(6, 4))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.plot(lambda_um, A, lw=2)
+    ax.set_xlabel("Wavelength λ (µm)")
+    ax.set_ylabel("Absorptivity A (normal incidence)")
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+    fig.savefig(out_png, dpi=dpi)
+    return out_png
+
+
+_EXECUTOR: Optional[ProcessPoolExecutor] = None
+_PENDING: List[Future] = []
+
+
+def submit_plot(fn: Callable[..., Path], *args, **kwargs) -> Future:
+    """Render ``fn(*args, **kwargs)`` in the background plot worker process."""
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ProcessPoolExecutor(max_workers=1)
+        atexit.register(wait_for_plots)
+    fut = _EXECUTOR.submit(fn, *args, **kwargs)
+    _PENDING.append(fut)
+    return fut
+
+
+def wait_for_plots(timeout: Optional[float] = None) -> List[Path]:
+    """Block until all submitted plots are written; returns their paths.
+
+    Render errors are re-raised here rather than in the run that submitted them.
+    """
+    done: List[Path] = []
+    while _PENDING:
+        done.append(_PENDING.pop(0).result(timeout=timeout))
+    return done
@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_nk_cache(tmp_path_factory, monkeypatch):
+    """Keep the n,k parse cache out of the repo's data/derived during tests."""
+    monkeypatch.setenv("EUV_NK_CACHE_DIR", str(tmp_path_factory.mktemp("nk_cache")))
@@ -0,0 +1,35 @@
+import math
+
+import numpy as np
+
+from src.pp_sizyuk import Scenario, integrate_absorbed_energy, integrate_q_abs_sphere, q_abs_hemisphere
+
+
+def _exact_centered(R, w0, A, E):
+    # For a centred beam the hemisphere integral reduces to A * (1 - exp(-2R^2/w0^2)) * E
+    return A * (1.0 - np.exp(-2.0 * R * R / (w0 * w0))) * E
+
+
+def test_adaptive_energy_matches_closed_form_for_narrow_and_wide_beams():
+    R = np.array([1e-5, 1e-5, 1e-5, 2e-5])
+    w0 = np.array([1e-8, 1e-6, 3e-5, 1e-5])
+    res = integrate_absorbed_energy(R, w0, 0.3, 1e-3, rtol=1e-8)
+    assert res.converged.all()
+    exact = _exact_centered(R, w0, 0.3, 1e-3)
+    assert np.allclose(res.value, exact, rtol=1e-8)
+    assert np.all(res.error <= 1e-8 * exact)
+
+
+def test_adaptive_energy_with_pulse_callable_and_offset_beam():
+    P = lambda t: np.where((t >= 0.0) & (t <= 1e-8), 1e5, 0.0)
+    res = integrate_absorbed_energy(1e-5, 2e-5, 0.3, P, t_span=(0.0, 2e-8), t_breaks=[1e-8], rtol=1e-9)
+    assert math.isclose(res.value[0], float(_exact_centered(1e-5, 2e-5, 0.3, 1e-3)), rel_tol=1e-9)
+
+    # Offset beam: fine fixed grid of the legacy helpers converges to the adaptive result
+    scn = Scenario(R=1e-5, w0=4e-6, y_beam=5e-6)
+    off = integrate_absorbed_energy(scn.R, scn.w0, 0.3, 1e-3, dy=scn.y_beam - scn.y0, rtol=1e-9)
+    t = np.array([0.0, 1e-8]); P_t = np.full(2, 1e5)
+    th, _, q = q_abs_hemisphere(scn, t, P_t, 0.3)
+    # legacy rectangle rule sums both time samples (uniform dt): E = 2 * dt * sum
+    legacy = integrate_q_abs_sphere(scn.R, th, t, q) / 2.0
+    assert math.isclose(off.value[0], legacy, rel_tol=1e-2)
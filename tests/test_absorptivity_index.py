@@ -0,0 +1,58 @@
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.core.build import _pick_A_from_precomputed
+from src.io import absorptivity
+from src.io.absorptivity import TableIndex, load_table
+from src.pp_model import load_fresnel_tables
+
+
+def _write(base: Path, rows):
+    base.mkdir(parents=True, exist_ok=True)
+    f = base / "absorptivity_vs_lambda.csv"
+    f.write_text("lambda_um,A\n" + "".join(f"{l},{a}\n" for l, a in rows), encoding="utf-8")
+    return f
+
+
+def test_index_interpolates_sorted_and_clamped():
+    t = TableIndex([1.2, 0.8, 1.0, 1.0], [0.46, 0.40, 0.44, 0.9])
+    assert t.lambda_um.tolist() == [0.8, 1.0, 1.2] and len(t) == 3
+    assert t(0.9) == pytest.approx(0.42) and t(0.1) == 0.40 and t(5.0) == 0.46
+    lam = np.linspace(0.5, 1.5, 101).reshape(1, -1)
+    assert np.allclose(t(lam), np.interp(lam, [0.8, 1.0, 1.2], [0.40, 0.44, 0.46]))
+    # scalar fast path and vectorized path agree, including the nearest-row rule
+    for q in (0.85, 0.95, 1.1, 1.19):
+        assert t(q) == pytest.approx(float(t(np.array([q]))[0]))
+        assert t(q, method="nearest") == float(t(np.array([q]), method="nearest")[0])
+
+
+def test_tables_are_shared_and_reloaded_on_change(tmp_path: Path):
+    absorptivity.clear_cache()
+    f = _write(tmp_path / "data" / "derived" / "sizyuk", [(0.8, 0.4), (1.0, 0.44), (1.2, 0.46)])
+    a = load_table(f, "A")
+    assert load_table(f, "A") is a
+    assert load_fresnel_tables(tmp_path)["absorptivity_index"] is a
+
+    cfg = SimpleNamespace(absorption=SimpleNamespace(lambda_um=1.1))
+    assert _pick_A_from_precomputed(cfg, repo_root=tmp_path) == pytest.approx(0.45)
+
+    _write(f.parent, [(0.8, 0.5), (1.2, 0.7)])
+    later = f.stat().st_mtime_ns + 10**9
+    os.utime(f, ns=(later, later))
+    b = load_table(f, "A")
+    assert b is not a and b(1.0) == pytest.approx(0.6)
+    assert len([k for k in absorptivity._CACHE if k[0] == str(f.resolve())]) == 1
+
+
+def test_cache_is_bounded(tmp_path: Path, monkeypatch):
+    absorptivity.clear_cache()
+    monkeypatch.setattr(absorptivity, "MAX_CACHED_TABLES", 2)
+    files = [_write(tmp_path / str(i), [(1.0, i), (2.0, i)]) for i in range(3)]
+    for f in files:
+        load_table(f)
+    assert len(absorptivity._CACHE) == 2
+    assert str(files[0].resolve()) not in {k[0] for k in absorptivity._CACHE}
@@ -0,0 +1,62 @@
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.core.errors import ConfigError
+from src.core.solvers.adaptive import adaptive_sweep
+
+T_BOIL = 2875.0
+
+
+def _peak_T(cfg):
+    # Peak temperature rises with pulse energy and falls with radius; boiling at E = 2 R.
+    if cfg["E"] > 9.5 and cfg["R"] < 1.5:
+        raise RuntimeError("solver diverged")
+    return {"T_max": T_BOIL + 100.0 * (cfg["E"] - 2.0 * cfg["R"]), "tag": cfg["tag"]}
+
+
+def _explode(cfg):
+    raise RuntimeError("should have been replayed from the journal")
+
+
+def test_refinement_concentrates_on_the_boiling_boundary():
+    res = adaptive_sweep({"E": (0.0, 10.0), "R": (1.0, 4.0)}, _peak_T, "T_max", budget=80,
+                         threshold=T_BOIL, fixed={"tag": "x"})
+    assert 9 < res.n_runs <= 80 and len(res.values) == res.n_runs
+    assert all(p["tag"] == "x" for p in res.params)
+    assert len({(p["E"], p["R"]) for p in res.params}) == res.n_runs  # no point run twice
+    near = [abs(p["E"] - 2.0 * p["R"]) < 2.0 for p, v in zip(res.params[9:], res.values[9:]) if not math.isnan(v)]
+    assert np.mean(near) > 0.6
+    cells = res.boundary_cells()
+    assert cells and all(c["E"][1] - c["E"][0] < 10.0 / 2 for c in cells)
+
+
+def test_without_threshold_refines_where_metric_changes_fastest():
+    steep = lambda cfg: {"m": math.tanh(20.0 * (cfg["x"] - 0.3)) + 0.01 * cfg["y"]}
+    res = adaptive_sweep({"x": (0.0, 1.0), "y": (1.0, 100.0)}, steep, "m", budget=40, log_axes=["y"])
+    assert res.n_runs <= 40
+    xs = np.array([p["x"] for p in res.params[9:]])
+    assert np.mean(np.abs(xs - 0.3) < 0.25) > 0.6
+    assert min(p["y"] for p in res.params) == pytest.approx(1.0)
+
+
+def test_parallel_and_journaled(tmp_path: Path):
+    res = adaptive_sweep({"E": (0.0, 10.0), "R": (1.0, 4.0)}, _peak_T, lambda r: r["T_max"], budget=30,
+                         threshold=T_BOIL, fixed={"tag": "p"}, max_parallel=2, journal=tmp_path / "j.jsonl")
+    assert res.n_runs <= 30 and np.isnan(res.values).any()  # failed corners are kept, as NaN
+    # A restart replays finished runs from the journal: the worker is only hit for failed ones.
+    again = adaptive_sweep({"E": (0.0, 10.0), "R": (1.0, 4.0)}, _explode, lambda r: r["T_max"], budget=30,
+                           threshold=T_BOIL, fixed={"tag": "p"}, journal=tmp_path / "j.jsonl")
+    before = {(p["E"], p["R"]): v for p, v in zip(res.params, res.values)}
+    after = {(p["E"], p["R"]): v for p, v in zip(again.params, again.values)}
+    assert before.keys() == after.keys()
+    assert all(np.isnan(v) if np.isnan(before[k]) else v == before[k] for k, v in after.items())
+
+
+def test_budget_must_cover_initial_design():
+    with pytest.raises(ConfigError):
+        adaptive_sweep({"E": (0.0, 1.0), "R": (0.0, 1.0)}, _peak_T, "T_max", budget=8)
+    with pytest.raises(ConfigError):
+        adaptive_sweep({"E": (0.0, 1.0)}, _peak_T, "T_max", budget=8, log_axes=["E"])
@@ -26,3 +26,17 @@ def test_compare_results_fail(tmp_path: Path):
     assert not ok
     assert rep["files"]["a.csv"]["ok"] is False
 
+
+
+def test_compare_results_reads_comsol_tables(tmp_path: Path):
+    from src.io.results import read_result_table, write_comsol_table
+
+    cols = {"Time (s)": [0.0, 1e-9], "intop_drop(T)/intop_drop(1) (K)": [300.0, 310.0]}
+    write_comsol_table(tmp_path / "base" / "pp_T_vs_time.csv", cols, "T_vs_time")
+    cols["intop_drop(T)/intop_drop(1) (K)"] = [300.0, 311.0]
+    write_comsol_table(tmp_path / "cand" / "pp_T_vs_time.csv", cols, "T_vs_time")
+    df = read_result_table(tmp_path / "base" / "pp_T_vs_time.csv")
+    assert list(df.columns) == ["Time (s)", "intop_drop(T)/intop_drop(1) (K)"] and df.iloc[1, 1] == 310.0
+    ok, rep = compare_results(tmp_path / "base", tmp_path / "cand", rtol=1e-6)
+    assert not ok
+    assert rep["files"]["pp_T_vs_time.csv"]["columns"]["Time (s)"]["ok"] is True
@@ -0,0 +1,78 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.core.errors import ConfigError
+from src.core.params import PARAM_RANGES, validate_schema
+from src.core.solvers.designs import design_points, design_sweep, schema_bounds, unit_design
+from src.core.solvers.sweep import SweepFailure, manifest_runs
+from src.io.sweep_manifest import read_sweep_manifest, write_sweep_manifest
+
+BOUNDS_8D = {"A_PP": None, "w0": (5e-6, 5e-5), "E_PP_total": (1e-4, 2e-3), "beta_r": None,
+             "HK_gamma": (0.1, 1.0), "R": (5e-6, 3e-5), "tau_square": (5e-9, 5e-8), "theta": (0.0, 30.0)}
+
+
+@pytest.mark.parametrize("method", ["sobol", "lhs", "halton"])
+def test_designs_are_reproducible_and_fill_the_cube(method):
+    u = unit_design(method, 256, 8, seed=7)
+    assert u.shape == (256, 8) and u.min() >= 0.0 and u.max() < 1.0
+    assert np.array_equal(u, unit_design(method, 256, 8, seed=7))
+    assert not np.array_equal(u, unit_design(method, 256, 8, seed=8))
+    # every 1-D projection is spread out: each of 16 bins holds some points
+    counts = np.stack([np.histogram(u[:, k], bins=16, range=(0, 1))[0] for k in range(8)])
+    assert counts.min() >= 8 and counts.max() <= 24
+
+
+def test_lhs_is_stratified_per_axis():
+    u = unit_design("lhs", 50, 3, seed=1)
+    for k in range(3):
+        assert sorted(np.floor(u[:, k] * 50).astype(int)) == list(range(50))
+
+
+def test_points_use_schema_bounds_log_axes_and_fixed():
+    pts = design_points(BOUNDS_8D, 128, seed=3, log_axes=["E_PP_total"], fixed={"variant": "fresnel"})
+    assert len(pts) == 128 and all(p["variant"] == "fresnel" for p in pts)
+    lo, hi = PARAM_RANGES["laser.A_PP"]
+    a = np.array([p["A_PP"] for p in pts])
+    assert lo <= a.min() and a.max() <= hi and a.max() - a.min() > 0.9 * (hi - lo)
+    e = np.log10([p["E_PP_total"] for p in pts])
+    assert np.median(e) == pytest.approx(np.log10(np.sqrt(1e-4 * 2e-3)), abs=0.1)
+    assert schema_bounds("beta_r") == schema_bounds("evaporation.beta_r") == (0.0, 1.0)
+    with pytest.raises(ConfigError):
+        design_points({"tau_square": None}, 8)
+    with pytest.raises(ConfigError):
+        design_points({"A_PP": (0.5, 0.5)}, 8)
+    with pytest.raises(ConfigError):
+        design_points({"A_PP": None}, 8, method="grid")
+
+
+def _toy(cfg):
+    if cfg["A_PP"] > 0.95:
+        raise ValueError("too hot")
+    return {"T_max": 300.0 + 1e4 * cfg["A_PP"] * cfg["E_PP_total"] / 1e-3}
+
+
+def test_design_sweep_feeds_executor_and_manifest(tmp_path: Path):
+    bounds = {"A_PP": None, "E_PP_total": (1e-4, 2e-3)}
+    seq = design_sweep(bounds, _toy, 32, method="halton", seed=5, isolate=True)
+    par = design_sweep(bounds, _toy, 32, method="halton", seed=5, max_parallel=2)
+    assert [c for c, _ in seq] == [c for c, _ in par] == design_points(bounds, 32, method="halton", seed=5)
+    runs = manifest_runs(par, prefix="halton")
+    failed = [r for r in runs if r["status"] == "failed"]
+    assert len(failed) == sum(isinstance(r, SweepFailure) for _, r in par)
+    path = write_sweep_manifest(tmp_path / "manifest.json", runs)
+    back = read_sweep_manifest(path)
+    assert back[0]["run_id"] == "halton-0000" and json.loads(path.read_text())["runs"] == back
+    assert all("T_max" in r["metrics"] for r in back if r["status"] == "ok")
+
+
+def test_schema_ranges_drive_validation():
+    cfg = {"simulation": {"time_end": 1e-6}, "geometry": {"R": 1e-5, "Lx": 1e-4, "Ly": 1e-4},
+           "laser": {"A_PP": 0.4, "w0": 1.7e-5, "illum_mode": "cos_inc"},
+           "evaporation": {"HK_gamma": 1.5}, "materials": {}}
+    with pytest.raises(ValueError, match="HK_gamma"):
+        validate_schema(cfg)
+    cfg["evaporation"]["HK_gamma"] = 0.8
+    validate_schema(cfg)
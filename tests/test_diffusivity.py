@@ -0,0 +1,68 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.core.diffusivity import TORR, diffusion_time, get_law, law_from_config, operating_pressure, pressure_table
+from src.core.errors import ConfigError
+from src.core.params import load_config
+from src.core.pulse import compile_expression
+from src.mph_core.physics import PhysicsManager
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_t175_law_is_vectorized_and_matches_its_comsol_expression():
+    cfg, _ = load_config(ROOT / "data")
+    law = law_from_config(cfg)
+    assert law.name == "t175_over_p" and law.D0 == pytest.approx(1e-3)
+    T = np.array([300.0, 600.0, 3000.0])
+    p = np.array([[0.5], [133.3]])
+    D = law(T, p)
+    assert D.shape == (2, 3)
+    assert np.allclose(D[0], 1e-3 * (T / 300.0) ** 1.75)  # below p_min = 1 Pa
+    assert np.allclose(D[1], 1e-3 * (T / 300.0) ** 1.75 / 133.3)
+    expr = law.comsol_expression("T", "133.3[Pa]")
+    assert np.allclose(compile_expression(expr, variable="T")(T), D[1], rtol=1e-9)
+
+    tables = pressure_table(law, T, [0.01, 1.0])
+    assert np.allclose(tables[1.0] * 100.0, tables[0.01])
+    assert diffusion_time(1e-3, 300.0, TORR, law) == pytest.approx(1e-6 * TORR / 1e-3)
+    assert operating_pressure(cfg.environment) is not None
+    assert get_law("constant", 2e-5)(T).tolist() == [2e-5] * 3
+    with pytest.raises(ConfigError):
+        get_law("sutherland")
+    with pytest.raises(ConfigError):
+        law(T)
+
+
+def test_physics_manager_installs_diffusivity_table():
+    sel = {k: MagicMock() for k in ("s_gas", "s_surf", "s_left", "s_right", "s_top", "s_bottom")}
+    params = {"Diffusivity_Law": "t175_over_p", "Dm0": 2e-3, "Gas_Pressure_Torr": 1.0}
+    manager = PhysicsManager(MagicMock(), sel, {}, params)
+    tds = manager._setup_species_transport()
+    tds.create.return_value.property.assert_any_call("D_c", "D_tab(T)")
+    functions = manager.model / "functions"
+    functions.create.assert_any_call("Interpolation", name="D_tab")
+    T = np.array([300.0, 1500.0, 5000.0])
+    assert np.allclose(manager.diffusivity_table(T), 2e-3 * (T / 300.0) ** 1.75 / TORR, rtol=1e-4)
+
+    plain = PhysicsManager(MagicMock(), sel, {})
+    plain._setup_species_transport().create.return_value.property.assert_any_call("D_c", "D_tin")
+    assert plain.diffusivity_table is None
+
+
+def test_physics_manager_resolves_comsol_style_dm0():
+    sel = {k: MagicMock() for k in ("s_gas", "s_surf", "s_left", "s_right", "s_top", "s_bottom")}
+    params = {"Diffusivity_Law": "constant", "Dm0": "1e-5[m^2/s]", "Gas_Pressure_Torr": 1.0}
+    manager = PhysicsManager(MagicMock(), sel, {}, params)
+    manager._setup_species_transport()
+    assert np.allclose(manager.diffusivity_table(np.array([300.0, 3000.0])), 1e-5, rtol=1e-4)
+
+    bad = PhysicsManager(MagicMock(), sel, {}, dict(params, Dm0="oops[m^2/s]"))
+    with pytest.raises(ConfigError):
+        bad._setup_species_transport()
+    unknown = PhysicsManager(MagicMock(), sel, {}, dict(params, Diffusivity_Law="sutherland"))
+    with pytest.raises(ConfigError):
+        unknown._setup_species_transport()
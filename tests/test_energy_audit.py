@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.core.properties import TinProperties
+from src.core.pulse import compile_pulse
+from src.core.solvers.lumped0d import LumpedInputs, solve_lumped, write_lumped_outputs
+from src.io.energy_audit import ENERGY_FILE, audit_runs, find_runs, main
+from src.io.results import read_result_table, write_comsol_table
+
+
+def _sweep(root: Path):
+    inp = LumpedInputs(R=1.35e-5, w0=1.7e-5, A_PP=0.3, E_scale=[1.0, 50.0, 400.0], emissivity=0.1,
+                       rho=6980.0, cp=237.0)
+    pulse = compile_pulse("E/1e-8*(flc2hs(t,1e-12[s])-flc2hs(t-1e-8,1e-12[s]))", {"E": 1e-6})
+    res = solve_lumped(inp, pulse, t_end=3e-8, t_eval=np.linspace(0, 3e-8, 601), rtol=1e-8)
+    for i in range(len(inp)):
+        write_lumped_outputs(res, root / f"run_{i}", index=i)
+    return res
+
+
+def test_lumped_runs_close_and_broken_run_is_flagged(tmp_path: Path):
+    res = _sweep(tmp_path)
+    assert len(find_runs(tmp_path)) == 3 and find_runs(tmp_path / "run_0") == [tmp_path / "run_0"]
+    audit = audit_runs(tmp_path, threshold=1e-2, geometry="sphere",
+                       props=TinProperties.from_values(rho=6980.0, cp=237.0))
+    assert audit.E_abs.shape == (3, 601) and not audit.flagged
+    assert np.allclose(audit.E_abs[:, -1], res.E_abs[:, -1], rtol=5e-3)
+    assert res.mass_lost[2] > 0 and audit.E_lat[2, -1] > 0
+
+    # double P_abs in one run: absorbed no longer matches heating + losses
+    path = tmp_path / "run_1" / ENERGY_FILE
+    df = read_result_table(path)
+    df["P_abs (W)"] *= 2.0
+    write_comsol_table(path, {c: df[c].to_numpy() for c in df.columns}, table="energy_vs_time")
+    (tmp_path / "run_2" / "pp_T_vs_time.csv").unlink()
+    audit = audit_runs(tmp_path, threshold=1e-2, geometry="sphere")
+    assert audit.flagged == [str(tmp_path / "run_1"), str(tmp_path / "run_2")]
+    assert audit.max_rel_error[1] == pytest.approx(0.5, rel=1e-2)
+    summary = audit.summary()
+    assert summary["flagged"].tolist() == [False, True, True] and "FileNotFoundError" in summary["error"].iloc[2]
+    assert main([str(tmp_path), "--geometry", "sphere", "--csv", str(tmp_path / "audit.csv")]) == 1
+    assert (tmp_path / "audit.csv").is_file()
@@ -0,0 +1,63 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.core.thermo import j_evap, psat
+from src.mph_core.interpolation import tabulate_log_t
+from src.mph_core.model_builder import ModelBuilder
+
+
+def test_tabulated_psat_meets_stated_error_bound():
+    tab = tabulate_log_t(psat, "Psat_tab", 500.0, 6000.0, rtol=1e-4, floor=0.1, fununit="Pa")
+    assert tab.max_rel_error <= 1e-4 and np.all(np.diff(tab.T) > 0)
+    assert tab.T[0] == pytest.approx(500.0) and tab.T[-1] == pytest.approx(6000.0)
+    # independent dense check between the nodes
+    T = np.geomspace(500.0, 6000.0, 200_003)
+    err = np.abs(tab(T) - psat(T)) / np.maximum(psat(T), 0.1)
+    assert err.max() <= 1.05 * tab.max_rel_error
+    with pytest.raises(ValueError):
+        tabulate_log_t(psat, "Psat_tab", 500.0, 6000.0, rtol=1e-12, floor=0.1, n_max=256)
+
+
+def _installed(functions):
+    return {c.kwargs["name"]: c for c in functions.create.call_args_list if c.args[:1] == ("Interpolation",)}
+
+
+def test_kumar_builder_installs_interpolation_functions():
+    params = {"Evaporation_Tabulated": True, "P_ref": "1[atm]", "Lv_sn": "2.96e6[J/kg]",
+              "M_sn": "118.71e-3[kg/mol]", "Tboil_sn": "2875[K]", "R_gas": 8.314, "beta_r": 0.15}
+    builder = ModelBuilder(params, variant="kumar")
+    builder.model = MagicMock()
+    builder._create_aux_features()
+
+    node = builder.model / "variables"
+    assert set(_installed(node)) == {"Psat_tab", "J_evap_tab"}
+    exprs = [c.args[1] for c in node.create.return_value.property.call_args_list if c.args[0] == "expr"]
+    assert ["Psat = Psat_tab(T)", "J_evap = J_evap_tab(T)"] in exprs
+    tab = builder.evaporation_tables["J_evap_tab"]
+    T = np.array([1500.0, 2875.0, 4000.0])
+    assert np.allclose(tab(T), j_evap(T, beta_r=0.15), rtol=1e-4)
+
+
+def test_kumar_builder_defaults_to_analytic_expressions():
+    builder = ModelBuilder({}, variant="kumar")
+    builder.model = MagicMock()
+    builder._create_aux_features()
+    assert not _installed(builder.model / "functions")
+    assert not hasattr(builder, "evaporation_tables")
+
+
+def test_fresnel_builder_tabulates_hertz_knudsen_flux():
+    from src.models.mph_fresnel import FresnelModelBuilder
+
+    builder = FresnelModelBuilder({"Evaporation_Tabulated": True})
+    builder.model = MagicMock()
+    tds = MagicMock()
+    builder.physics_manager = MagicMock(physics_interfaces={"tds": tds})
+    builder._configure_evaporation_kinetics()
+    tds.feature.return_value.property.assert_any_call("N0", "J_evap_tab(T)")
+    tab = builder.evaporation_tables["J_evap_tab"]
+    T = np.array([1000.0, 3000.0])
+    exact = 0.8 * 1e10 * np.exp(-3e5 / (8.314 * T)) / np.sqrt(2 * np.pi * 8.314 * T / 0.1187)
+    assert np.allclose(tab(T), exact, rtol=1e-4, atol=1e-6 * tab.values[-1])
@@ -0,0 +1,35 @@
+import math
+
+import numpy as np
+
+from src.pp_sizyuk import GaussianIntensityField
+
+
+def _dense(x, y, P, x0, y0, w0):
+    X, Y = np.meshgrid(x, y, indexing="xy")
+    I_sp = (2.0 / (math.pi * w0 * w0)) * np.exp(-2.0 * ((X - x0) ** 2 + (Y - y0) ** 2) / (w0 * w0))
+    return P[:, None, None] * I_sp[None, :, :]
+
+
+def test_lazy_field_matches_dense_tensor_and_slices():
+    x = np.linspace(-3e-5, 3e-5, 41); y = np.linspace(-2e-5, 4e-5, 31)
+    t = np.linspace(0.0, 1e-8, 25); P = 1e3 * np.sin(np.pi * t / 1e-8) ** 2
+    f = GaussianIntensityField(x, y, P, 1e-6, 5e-6, 1.5e-5, t=t)
+    ref = _dense(x, y, P, 1e-6, 5e-6, 1.5e-5)
+    assert f.shape == ref.shape
+    assert np.allclose(f.materialize(), ref)
+    assert np.allclose(f[3], ref[3])
+    assert np.allclose(f[2:7, :, 10], ref[2:7, :, 10])
+    assert np.allclose(np.concatenate([blk for _, blk in f.chunks(7)]), ref)
+
+
+def test_lazy_field_reductions():
+    x = np.linspace(-6e-5, 6e-5, 201); y = np.linspace(-6e-5, 6e-5, 201)
+    t = np.linspace(0.0, 1e-8, 11); P = np.full_like(t, 2e3)
+    f = GaussianIntensityField(x, y, P, 0.0, 0.0, 1e-5, t=t)
+    ref = _dense(x, y, P, 0.0, 0.0, 1e-5)
+    # Domain is 6 w0 wide: the grid captures essentially all the beam power
+    assert np.allclose(f.total_power(), 2e3, rtol=1e-6)
+    assert math.isclose(f.peak_intensity(), ref.max(), rel_tol=1e-12)
+    dt = t[1] - t[0]
+    assert np.allclose(f.fluence(), 0.5 * dt * (ref[1:] + ref[:-1]).sum(axis=0))
@@ -0,0 +1,44 @@
+import time
+from pathlib import Path
+
+from src.core.solvers.sweep import RunningMetrics, SweepFailure, grid_points, iter_sweep, reduce_sweep
+
+
+def _cheap(cfg):
+    return {"T_max": 300.0 + cfg["E"] * cfg["A"], "ok": True}
+
+
+def _touch(cfg):
+    Path(cfg["dir"], f"{cfg['i']}.started").touch()
+    time.sleep(0.01 * (cfg["i"] % 3))
+    if cfg["i"] == 7:
+        raise ValueError("diverged")
+    return {"i": cfg["i"]}
+
+
+def test_streaming_reduction_over_a_large_grid():
+    grid = {"A": [0.1 * k for k in range(1, 101)], "E": list(range(1, 201))}
+    stats = RunningMetrics({"T_max": "T_max", "twice": lambda r: 2 * r["T_max"], "missing": "nope"})
+    (result,) = reduce_sweep(grid, _cheap, reducers=[stats])
+    s = result.summary()
+    assert s["n_points"] == 20_000 and s["n_failed"] == 0 and "missing" not in s
+    A, E = 0.1 * (1 + 100) / 2, (1 + 200) / 2
+    assert abs(s["T_max"]["mean"] - (300.0 + A * E)) < 1e-9 * s["T_max"]["mean"]
+    assert s["T_max"]["argmax"] == {"A": 10.0, "E": 200} and s["twice"]["max"] == 2 * s["T_max"]["max"]
+
+
+def test_parallel_iteration_is_bounded_and_isolates_failures(tmp_path: Path):
+    grid = {"dir": [str(tmp_path)], "i": list(range(20))}
+    it = iter_sweep(grid, _touch, max_parallel=2, max_in_flight=3)
+    next(it)
+    time.sleep(0.3)
+    assert len(list(tmp_path.glob("*.started"))) <= 4  # backpressure: nothing beyond the in-flight window
+    stats = RunningMetrics({"i": "i"})
+    rest = list(iter_sweep(grid, _touch, max_parallel=2, max_in_flight=3, reducers=[stats]))
+    it.close()
+    assert sorted(c["i"] for c, _ in rest) == list(range(20))
+    assert [c["i"] for c, r in rest if isinstance(r, SweepFailure)] == [7]
+    assert stats.summary()["n_failed"] == 1 and stats.summary()["i"]["count"] == 19
+
+    ordered = list(iter_sweep(grid, _touch, max_parallel=3, max_in_flight=4, ordered=True))
+    assert [c for c, _ in ordered] == grid_points(grid)
@@ -0,0 +1,68 @@
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.core.params import load_config
+from src.core.pulse import compile_pulse, config_pulse_expression
+from src.core.solvers.lumped0d import (
+    LumpedInputs,
+    solve_from_config,
+    solve_lumped,
+    write_lumped_outputs,
+)
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _square(E=1e-6, tau=1e-8):
+    return compile_pulse(f"E/{tau}*(flc2hs(t,1e-12[s])-flc2hs(t-{tau},1e-12[s]))", {"E": E})
+
+
+def test_energy_balance_without_losses():
+    inp = LumpedInputs(R=[1e-5, 1.35e-5], w0=1.7e-5, A_PP=[0.3, 0.5], E_scale=[1.0, 2.0])
+    pulse = _square()
+    res = solve_lumped(inp, pulse, t_end=2e-8, psat=None)
+    frac = 1.0 - np.exp(-2.0 * inp.R ** 2 / inp.w0 ** 2)
+    E_abs = inp.A_PP * frac * inp.E_scale * pulse.energy(0.0, 2e-8)
+    m0 = inp.rho * 4.0 / 3.0 * math.pi * inp.R ** 3
+    assert np.allclose(res.E_abs[:, -1], E_abs, rtol=1e-6, atol=0.0)
+    assert np.allclose(res.T[:, -1] - 300.0, E_abs / (m0 * inp.cp), rtol=1e-5, atol=0.0)
+    assert np.all(res.mdot == 0.0) and not res.depleted.any()
+
+
+def test_batch_matches_single_runs_with_losses():
+    inp = LumpedInputs.from_grid(LumpedInputs(R=1.35e-5, w0=1.7e-5, A_PP=0.3, emissivity=0.1, p_amb=1.333),
+                                 E_scale=[1.0, 50.0, 400.0], R=[1e-5, 2e-5])
+    pulse = _square()
+    batch = solve_lumped(inp, pulse, t_end=3e-8, t_eval=np.linspace(0, 3e-8, 301), rtol=1e-8)
+    for i in (0, 3, 5):
+        one = solve_lumped(inp.select(i), pulse, t_end=3e-8, t_eval=batch.t, rtol=1e-8)
+        assert np.allclose(one.T[0], batch.T[i], rtol=1e-5)
+        assert np.allclose(one.mass[0], batch.mass[i], rtol=1e-7)
+    hot = int(np.argmax(batch.T_max))
+    assert batch.mass_lost[hot] > 0 and batch.E_lat[hot, -1] > 0 and batch.E_rad[hot, -1] > 0
+    # absorbed = sensible (integral of m*cp*dT) + latent + radiated
+    m, T = batch.mass[hot], batch.T[hot]
+    sensible = float(np.sum(0.5 * (m[1:] + m[:-1]) * inp.cp[hot] * np.diff(T)))
+    assert sensible + batch.E_lat[hot, -1] + batch.E_rad[hot, -1] == pytest.approx(batch.E_abs[hot, -1], rel=1e-3)
+
+
+def test_config_run_writes_comsol_layout(tmp_path: Path):
+    cfg, _ = load_config(ROOT / "data")
+    cfg.laser.temporal_profile = "square"
+    expr = config_pulse_expression(cfg.laser)
+    assert compile_pulse(expr, {"E_PP_total": 1.0}).energy() == pytest.approx(1.0, rel=1e-9)
+
+    res = solve_from_config(cfg, ROOT / "data", E_PP_total=[1e-6, 2e-6])
+    assert res.T_max[1] > res.T_max[0] > cfg.environment.T_amb
+    paths = write_lumped_outputs(res, tmp_path, index=1)
+    assert sorted(p.name for p in paths.values()) == ["pp_T_vs_time.csv", "pp_energy_vs_time.csv",
+                                                        "pp_massloss_vs_time.csv", "pp_radius_vs_time.csv"]
+    lines = paths["T"].read_text(encoding="utf-8").splitlines()
+    assert lines[0].startswith("% Model,") and lines[2] == "% Time (s),intop_drop(T)/intop_drop(1) (K)"
+    data = np.loadtxt(paths["T"], delimiter=",", comments="%")
+    assert np.array_equal(data[:, 0], res.t) and np.array_equal(data[:, 1], res.T[1])
+    energy = np.loadtxt(paths["energy"], delimiter=",", comments="%")
+    assert energy.shape == (res.t.size, 5)
@@ -0,0 +1,38 @@
+from pathlib import Path
+
+import numpy as np
+
+from src import pp_sizyuk
+
+
+def _write_nk(path: Path, k: float = 3.0) -> Path:
+    path.write_text(f"lambda_um,n,k\n0.8,2.0,{k}\n1.0,2.5,{k}\n1.2,3.0,{k}\n", encoding="utf-8")
+    return path
+
+
+def test_nk_cache_writes_npy_and_skips_parsing(tmp_path: Path, monkeypatch):
+    nk = _write_nk(tmp_path / "nk.csv")
+    lam, n, k = pp_sizyuk._load_nk_any(nk)
+    cached = list(pp_sizyuk.nk_cache_dir().glob("*.npy"))
+    assert len(cached) == 1 and cached[0].name.startswith(pp_sizyuk._sha256_file(nk))
+
+    # A fresh process (empty memo) must load from the .npy without parsing
+    pp_sizyuk._NK_MEMO.clear()
+    def _fail(_path):
+        raise AssertionError("parser should not run on a cache hit")
+    monkeypatch.setattr(pp_sizyuk, "_parse_nk_csv", _fail)
+    lam2, n2, k2 = pp_sizyuk._load_nk_any(nk)
+    assert np.array_equal(lam, lam2) and np.array_equal(n, n2) and np.array_equal(k, k2)
+
+
+def test_nk_cache_invalidates_on_content_change(tmp_path: Path):
+    nk = _write_nk(tmp_path / "nk.csv", k=3.0)
+    _, _, k1 = pp_sizyuk._load_nk_any(nk)
+    _write_nk(nk, k=4.5)
+    _, _, k2 = pp_sizyuk._load_nk_any(nk)
+    assert np.all(k1 == 3.0) and np.all(k2 == 4.5)
+    assert len(list(pp_sizyuk.nk_cache_dir().glob("*.npy"))) == 2
+
+
+def test_load_nk_excel_missing_file_returns_none(tmp_path: Path):
+    assert pp_sizyuk.load_nk_excel(str(tmp_path / "missing.xlsx")) is None
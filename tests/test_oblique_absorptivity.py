@@ -0,0 +1,50 @@
+from pathlib import Path
+import math
+
+import numpy as np
+
+from src.pp_sizyuk import (
+    ObliqueAbsorptivity,
+    Scenario,
+    fresnel_oblique,
+    fresnel_optics,
+    precompute_oblique_table,
+    q_abs_hemisphere,
+)
+
+
+LAM = np.array([0.8, 1.0, 1.2])
+N = np.array([2.0, 3.0, 4.0])
+K = np.array([3.0, 4.0, 5.0])
+
+
+def test_oblique_reduces_to_normal_incidence_and_vanishes_at_grazing():
+    th = np.array([0.0, math.pi / 4, math.pi / 2])
+    A_s, A_p, A_u = fresnel_oblique(LAM, th, LAM, N, K)
+    A0 = fresnel_optics(LAM, LAM, N, K)["A"]
+    assert np.allclose(A_s[:, 0], A0) and np.allclose(A_p[:, 0], A0)
+    assert np.allclose(A_u[:, -1], 0.0, atol=1e-12)
+    # Metals absorb p-polarized light more strongly at oblique incidence
+    assert np.all(A_p[:, 1] > A_s[:, 1])
+
+
+def test_oblique_table_lookup_matches_direct_evaluation(tmp_path: Path):
+    f = precompute_oblique_table(LAM, N, K, tmp_path / "ob.npz", n_lambda=201, n_theta=361)
+    table = ObliqueAbsorptivity.load(f)
+    lam_q = np.array([0.85, 1.0, 1.17])
+    th_q = np.array([0.1, 0.7, 1.3])
+    for pol, ref in zip(("s", "p", "unpolarized"), fresnel_oblique(lam_q, th_q, LAM, N, K)):
+        got = table(lam_q[:, None], th_q[None, :], pol)
+        assert np.allclose(got, ref, atol=2e-4)
+    # Out-of-range queries clamp to the grid edges; negative θ folds to |θ|
+    assert table(5.0, -0.1) == table(1.2, 0.1)
+
+
+def test_q_abs_hemisphere_with_oblique_table(tmp_path: Path):
+    table = ObliqueAbsorptivity.load(precompute_oblique_table(LAM, N, K, tmp_path / "ob.npz"))
+    scn = Scenario(R=1e-5, w0=2e-5)
+    t = np.array([0.0, 1e-9]); P = np.array([1.0, 1.0])
+    th, _, q_tab = q_abs_hemisphere(scn, t, P, table, lambda_um=1.0)
+    A0 = table(1.0, 0.0)
+    _, _, q_const = q_abs_hemisphere(scn, t, P, A0)
+    assert np.allclose(q_tab, q_const * table(1.0, th)[None, :] / A0)
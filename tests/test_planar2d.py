@@ -0,0 +1,57 @@
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("scipy")
+
+from src.core.params import load_config
+from src.core.solvers.planar2d import Planar2DSolver
+from src.core.solvers.radial1d import solve_from_config as solve_radial_config
+from src.io.results import read_result_table
+from src.models.base import Solver
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _cfg():
+    cfg, raw = load_config(ROOT / "data")
+    raw = dict(raw, laser=dict(raw["laser"], temporal_profile="square", E_PP_total=2e-5))
+    cfg.laser.temporal_profile = "square"
+    cfg.laser.E_PP_total = 2e-5
+    return cfg, raw
+
+
+def test_check_mode_reports_discretization_only(tmp_path: Path):
+    _, raw = _cfg()
+    solver = Planar2DSolver(params_dir=ROOT / "data", out_dir=tmp_path, n_diameter=32, n_steps=50)
+    assert isinstance(solver, Solver)
+    model = solver.build(raw)
+    info = solver.run(model, "check")
+    assert info["n_cells"] == model.n_cells and "outputs" not in info
+    assert model.length.sum() == pytest.approx(2 * math.pi * model.cfg.geometry.R, rel=1e-12)
+    w0, R = model.cfg.laser.w0, model.cfg.geometry.R
+    # centred beam: the build's I_xy is constant on the circle, cos_inc integrates to 2R
+    expected = model.cfg.laser.A_PP * 2 / (math.pi * w0 ** 2) * math.exp(-2 * R ** 2 / w0 ** 2) * 2 * R
+    assert model.absorb.sum() == pytest.approx(expected, rel=1e-4)
+    assert not list(tmp_path.iterdir())
+
+
+def test_solve_conserves_energy_and_exports_tables(tmp_path: Path):
+    cfg, _ = _cfg()
+    solver = Planar2DSolver(params_dir=ROOT / "data", out_dir=tmp_path, n_diameter=48, n_steps=200)
+    model = solver.build(cfg)
+    info = solver.run(model, "solve")
+    res = info["result"]
+    sensible = cfg.materials.rho_Sn * cfg.materials.cp_Sn * model.h ** 2 * np.nansum(res.T_field - 300.0)
+    assert sensible + res.E_lat + res.E_rad == pytest.approx(res.E_abs, rel=1e-9)
+    assert res.T_peak.max() > res.T_surf.max() > res.T[-1] > 300.0
+
+    radial = solve_radial_config(cfg, ROOT / "data", geometry="cylinder", n_steps=200)
+    assert res.T[-1] == pytest.approx(radial.T[0, -1], rel=5e-3)
+
+    assert sorted(Path(p).name for p in info["outputs"].values()) == [
+        "pp_T_vs_time.csv", "pp_energy_vs_time.csv", "pp_massloss_vs_time.csv", "pp_radius_vs_time.csv"]
+    df = read_result_table(tmp_path / "pp_energy_vs_time.csv")
+    assert list(df.columns)[:3] == ["Time (s)", "P_abs (W)", "P_lat (W)"] and len(df) == 201
@@ -0,0 +1,89 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.core.params import load_config
+from src.core.properties import ANDRADE_SN, TinProperties, load_andrade_parameters
+from src.mph_core.materials import MaterialsHandler
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_laws_are_vectorized_and_match_config():
+    cfg, _ = load_config(ROOT / "data")
+    props = TinProperties.from_config(cfg)
+    T = np.array([[505.0, 1000.0], [2000.0, 4000.0]])
+    vals = props.evaluate(T)
+    assert all(v.shape == T.shape for v in vals.values())
+    assert np.allclose(vals["cp"], float(cfg.materials.cp_Sn)) and np.allclose(vals["k"], float(cfg.materials.k_Sn))
+    assert np.allclose(vals["sigma"], 0.55 - 3e-4 * (T - 505.0))
+    # Andrade: mu(505 K) ~ 1.9 mPa s, decreasing with T down to the floor
+    assert vals["mu"][0, 0] == pytest.approx(ANDRADE_SN[0] * np.exp(ANDRADE_SN[1] / 505.0))
+    assert 1.5e-3 < vals["mu"][0, 0] < 2.2e-3 and np.all(np.diff(vals["mu"].ravel()) <= 0)
+    assert vals["mu"].min() >= 3e-4
+
+    cfg.materials.dcp_dT, cfg.materials.mu_floor = 0.01, 1e-3
+    props = TinProperties.from_config(cfg)
+    assert props.cp(1505.0) == pytest.approx(float(cfg.materials.cp_Sn) + 10.0)
+    assert props.mu(4000.0) == pytest.approx(1e-3)
+
+
+def test_params_with_units_and_implausible_andrade_file_warns():
+    props = TinProperties.from_params({"Cp_sn": "0.25[kJ/(kg*K)]", "k_sn": 30, "T_ref": "505[K]",
+                                       "mu_A": "0.4[mPa*s]", "mu_B": "800[K]"})
+    assert props.cp(900.0) == pytest.approx(250.0) and props.k(900.0) == pytest.approx(30.0)
+    assert props.mu(800.0) == pytest.approx(4e-4 * np.e)
+
+    kumar = load_andrade_parameters(ROOT / "KUMAR-2D" / "Andrade_parameters_for_Sn.txt")
+    assert set(kumar) == {"mu_A", "mu_B", "mu_floor"}
+    with pytest.warns(UserWarning, match="implausible"):
+        TinProperties.from_values(**kumar)
+
+
+def test_materials_handler_installs_property_tables():
+    params = {"Material_Tabulated": True, "k_sn": "31[W/(m*K)]", "Cp_sn": 237, "dk_dT": 0.01}
+    handler = MaterialsHandler(MagicMock(), params)
+    tin = handler._create_tin_material()
+
+    functions = handler.model / "functions"
+    names = {c.kwargs["name"] for c in functions.create.call_args_list if c.args[:1] == ("Interpolation",)}
+    assert names == {"mu_tab", "sigma_tab", "k_tab", "cp_tab"}
+    basic = tin / "Basic"
+    basic.property.assert_any_call("dynamicviscosity", "mu_tab(T)")
+    basic.property.assert_any_call("thermalconductivity", "k_tab(T)")
+    basic.property.assert_any_call("heatcapacity", "cp_tab(T)")
+    T = np.array([600.0, 2500.0, 5500.0])
+    props = TinProperties.from_params(params)
+    for name in ("mu", "sigma", "k", "cp"):
+        assert np.allclose(handler.property_tables[f"{name}_tab"](T), getattr(props, name)(T), rtol=1e-4)
+
+    constant = MaterialsHandler(MagicMock(), {"k_sn": 31})
+    (constant._create_tin_material() / "Basic").property.assert_any_call("thermalconductivity", "31[W/(m*K)]")
+    assert not constant.property_tables
+
+
+def test_kumar_surface_tension_uses_sigma_table():
+    from src.models.mph_kumar import KumarModelBuilder
+
+    params = {"Material_Tabulated": True, "sigma0": 0.55, "dSigma_dT": -1e-4}
+    builder = KumarModelBuilder(params)
+    builder.materials_handler = MaterialsHandler(MagicMock(), builder.params)
+    builder.materials_handler._create_tin_material()
+    builder.selection_manager, builder.physics_manager = MagicMock(), MagicMock()
+    spf = MagicMock()
+    builder._add_marangoni_effect(spf)
+    marangoni = spf.create.return_value
+    marangoni.property.assert_any_call("surface_tension", "sigma_tab(T)")
+    marangoni.property.assert_any_call("dsigma_dT", "d(sigma_tab(T),T)")
+    builder.physics_manager.physics_interfaces = {"ale": MagicMock()}
+    builder._configure_ale_deformation()
+    free_surf = builder.physics_manager.physics_interfaces["ale"].feature.return_value
+    free_surf.property.assert_any_call("surface_tension", "sigma_tab(T)")
+
+    constant = KumarModelBuilder({"Tin_Surface_Tension": 0.544})
+    constant.materials_handler = MaterialsHandler(MagicMock(), constant.params)
+    constant.selection_manager, spf = MagicMock(), MagicMock()
+    constant._add_marangoni_effect(spf)
+    spf.create.return_value.property.assert_any_call("surface_tension", "(0.544 + -0.0001*T)")
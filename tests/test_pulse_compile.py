@@ -0,0 +1,61 @@
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.core.errors import ConfigError
+from src.core.pulse import compile_pulse, flc2hs, load_pulse, unit_scale
+from src.pp_sizyuk import integrate_absorbed_energy
+
+DATA = Path(__file__).resolve().parents[1] / "data"
+
+
+def test_flc2hs_is_c2_smoothed_step():
+    x = np.linspace(-2.0, 2.0, 4001)
+    h = flc2hs(x, 1.0)
+    assert h[0] == 0.0 and h[-1] == 1.0 and math.isclose(float(flc2hs(0.0, 1.0)), 0.5)
+    assert np.all(np.diff(h) >= 0.0) and h.min() >= 0.0 and h.max() <= 1.0
+    # first and second derivatives vanish at the transition edges
+    d1 = np.gradient(h, x)
+    d2 = np.gradient(d1, x)
+    edge = np.abs(np.abs(x) - 1.0) < 2e-3
+    assert np.all(np.abs(d1[edge]) < 1e-4) and np.all(np.abs(d2[edge]) < 5e-2)
+
+
+def test_units_bind_to_their_operand():
+    assert unit_scale("um") == 1e-6 and unit_scale("J/(kg*K)") == 1.0
+    p = compile_pulse("exp(-((t-5[ns])/1[ns])^2)*(flc2hs(t,1[ps])-flc2hs(t-10[ns],1[ps]))")
+    assert math.isclose(p.energy(), math.sqrt(math.pi) * 1e-9, rel_tol=1e-9)
+    with pytest.raises(ConfigError):
+        unit_scale("furlong")
+
+
+def test_legacy_pulse_energy_events_and_grid():
+    p = load_pulse(DATA / "Ppp_analytic_expression.txt", DATA / "laser_parameters_pp_v2.txt")
+    E_total = p.params["E_PP_total"]
+    assert [round(e.t, 15) for e in p.events] == [0.0, 1.67e-07, 1.67e-07, 1.77e-07]
+    # ramp + square pulse defined to carry exactly E_PP_total
+    assert math.isclose(p.energy(), E_total, rel_tol=1e-12)
+    edges, E = p.piecewise_energy()
+    assert math.isclose(E.sum(), E_total, rel_tol=1e-12) and edges.size == E.size + 1
+
+    # event-aware grid: a few hundred nodes reproduce the energy through trapezoids
+    g = p.time_grid()
+    assert g.size < 500 and set(p.breakpoints).issubset(set(g))
+    P = p(g)
+    assert math.isclose(float(np.sum(0.5 * (P[1:] + P[:-1]) * np.diff(g))), E_total, rel_tol=1e-3)
+
+    # the compiled callable plugs into the adaptive absorbed-energy integrator directly
+    res = integrate_absorbed_energy(1e-5, 2e-5, 0.3, p, rtol=1e-9)
+    ref = integrate_absorbed_energy(1e-5, 2e-5, 0.3, E_total, rtol=1e-9)
+    assert math.isclose(res.value[0], ref.value[0], rel_tol=1e-8)
+
+
+def test_parameter_errors_are_reported():
+    with pytest.raises(ConfigError):
+        compile_pulse("P0*flc2hs(t, eps)", {"P0": "2*P1", "eps": "1[ns]"})
+    with pytest.raises(ConfigError):
+        compile_pulse("P0*flc2hs(t, 1[ns])", {"P0": "P1", "P1": "P0"})
+    with pytest.raises(ConfigError):
+        compile_pulse("__import__('os')")
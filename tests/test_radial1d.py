@@ -0,0 +1,61 @@
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.core.params import load_config
+from src.core.pulse import compile_pulse
+from src.core.solvers import lumped0d
+from src.core.solvers.lumped0d import LumpedInputs, solve_lumped
+from src.core.solvers.radial1d import radial_grid, solve_from_config, solve_radial, write_radial_outputs
+from src.io.results import compare_results
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _square(E=1e-6, tau=1e-8):
+    return compile_pulse(f"E/{tau}*(flc2hs(t,1e-12[s])-flc2hs(t-{tau},1e-12[s]))", {"E": E})
+
+
+def test_grid_refined_toward_surface():
+    g = radial_grid(1e-5, 80, 1.1)
+    assert g.volumes.sum() == pytest.approx(4.0 / 3.0 * math.pi * 1e-15, rel=1e-12)
+    assert g.surface_dr < 1e-3 * 1e-5 and g.surface_area == pytest.approx(4 * math.pi * 1e-10)
+    c = radial_grid(1e-5, 80, 1.1, "cylinder")
+    assert c.volumes.sum() == pytest.approx(math.pi * 1e-10) and radial_grid(1e-5, 80, 1.1) is g
+
+
+def test_energy_conserved_and_isothermal_limit_matches_lumped():
+    inp = LumpedInputs(R=1.35e-5, w0=1.7e-5, A_PP=0.3, E_scale=[1.0, 60.0, 300.0], emissivity=0.1, p_amb=1.333)
+    pulse = _square()
+    res = solve_radial(inp, k=1e4, pulse=pulse, t_end=3e-8, n_steps=3000)
+    g = res.grid
+    sensible = 6970.0 * 255.0 * (res.T_profile @ g.volumes - 300.0 * g.volumes.sum())
+    assert np.allclose(sensible + res.E_lat + res.E_rad, res.E_abs, rtol=1e-9)
+    assert res.mass_lost[-1] > 0 and not res.depleted.any()
+
+    ref = solve_lumped(inp, pulse, t_end=3e-8, t_eval=res.t[::100], rtol=1e-8)
+    assert np.allclose(res.T[:, ::100], ref.T, rtol=5e-3)  # fixed grid vs shrinking sphere, BE
+    assert res.mass_lost == pytest.approx(ref.mass_lost, rel=2e-2)
+
+
+def test_surface_heats_before_core_and_outputs_compare(tmp_path: Path):
+    cfg, _ = load_config(ROOT / "data")
+    cfg.laser.temporal_profile = "square"
+    t_out = np.linspace(0.0, cfg.simulation.time_end, 51)
+    res = solve_from_config(cfg, ROOT / "data", E_PP_total=[1e-5, 2e-5], t_out=t_out)
+    assert np.all(res.T_surf_max > res.T.max(axis=1))
+    assert res.T_surf_max[1] > res.T_surf_max[0]
+
+    write_radial_outputs(res, tmp_path / "a", index=0)
+    write_radial_outputs(res, tmp_path / "b", index=0)
+    ok, rep = compare_results(tmp_path / "a", tmp_path / "b")
+    assert ok and set(rep["files"]) == {"pp_T_vs_time.csv", "pp_energy_vs_time.csv",
+                                        "pp_massloss_vs_time.csv", "pp_radius_vs_time.csv"}
+    assert "intop_drop(T)/intop_drop(1) (K)" in rep["files"]["pp_T_vs_time.csv"]["columns"]
+
+    lumped = lumped0d.solve_from_config(cfg, ROOT / "data", E_PP_total=[1e-5])
+    lumped0d.write_lumped_outputs(lumped, tmp_path / "c")
+    ok, rep = compare_results(tmp_path / "a", tmp_path / "c", rtol=1e-3)
+    assert not ok and "T_surf (K)" not in rep["files"]["pp_T_vs_time.csv"]["columns"]
@@ -0,0 +1,131 @@
+import stat
+from pathlib import Path
+
+import pytest
+
+from src.core.solvers.sweep import sweep
+from src.io.result_cache import CachedWorker, ResultCache, cache_key, run_inputs_config
+
+
+def _write_run(out: Path, text: str) -> dict:
+    out.mkdir(parents=True, exist_ok=True)
+    (out / "pp_T_vs_time.csv").write_text(text, encoding="utf-8")
+    (out / "pp_model_created.mph").write_bytes(b"\0" * 1000)
+    return {"T_file": out / "pp_T_vs_time.csv", "mph": out / "pp_model_created.mph"}
+
+
+def test_key_depends_on_config_variant_and_version():
+    cfg = {"laser": {"A_PP": 0.4, "w0": 1.7e-5}, "geometry": {"R": 1.5e-5}}
+    k = cache_key(cfg, "fresnel", version="abc")
+    assert k == cache_key({"geometry": {"R": 1.5e-5}, "laser": {"w0": 1.7e-5, "A_PP": 0.4}}, "fresnel", "abc")
+    assert k != cache_key(cfg, "kumar", version="abc")
+    assert k != cache_key(cfg, "fresnel", version="abd")
+    assert k != cache_key({**cfg, "laser": {"A_PP": 0.41, "w0": 1.7e-5}}, "fresnel", version="abc")
+
+
+def test_run_inputs_config_ignores_yaml_formatting(tmp_path: Path):
+    a, b = tmp_path / "a" / "config.yaml", tmp_path / "b" / "config.yaml"
+    a.parent.mkdir(); b.parent.mkdir()
+    a.write_text("laser:\n  A_PP: 0.4  # absorptivity\n", encoding="utf-8")
+    b.write_text("laser: {A_PP: 0.4}\n", encoding="utf-8")
+    (tmp_path / "pulse.txt").write_text("P(t)", encoding="utf-8")
+    ka = cache_key(run_inputs_config([a, tmp_path / "pulse.txt"]), "fresnel", "v")
+    assert ka == cache_key(run_inputs_config([b, tmp_path / "pulse.txt"]), "fresnel", "v")
+    (tmp_path / "pulse.txt").write_text("P(t)*2", encoding="utf-8")
+    assert ka != cache_key(run_inputs_config([a, tmp_path / "pulse.txt"]), "fresnel", "v")
+
+
+@pytest.mark.parametrize("link", ["auto", "hardlink", "copy"])
+def test_hit_materializes_outputs_read_only(tmp_path: Path, link):
+    cache = ResultCache(tmp_path / "cache", link=link)
+    outs = _write_run(tmp_path / "run1", "t,T\n0,300\n")
+    assert cache.get("k" * 64) is None
+    cache.put("k" * 64, outs, result={"T_max": 300.0})
+    (tmp_path / "run1" / "pp_T_vs_time.csv").write_text("overwritten", encoding="utf-8")  # run dir stays writable
+    entry = cache.materialize("k" * 64, tmp_path / "run2")
+    assert entry is not None and entry.meta["result"] == {"T_max": 300.0}
+    got = tmp_path / "run2" / "pp_T_vs_time.csv"
+    assert got.read_text(encoding="utf-8") == "t,T\n0,300\n"
+    assert (tmp_path / "run2" / "pp_model_created.mph").stat().st_size == 1000
+    if link == "hardlink":
+        assert got.stat().st_nlink == 2 and not got.stat().st_mode & stat.S_IWUSR
+
+
+def test_lru_eviction_respects_size_budget(tmp_path: Path):
+    cache = ResultCache(tmp_path / "cache", max_bytes=2500)
+    for i, key in enumerate(["a" * 64, "b" * 64]):
+        cache.put(key, _write_run(tmp_path / f"r{i}", "x"))
+    assert cache.materialize("a" * 64, tmp_path / "hit")  # "a" is now the most recently used
+    cache.put("c" * 64, _write_run(tmp_path / "r2", "x"))
+    assert "a" * 64 in cache and "c" * 64 in cache and "b" * 64 not in cache
+    assert cache.size_bytes() <= 2500
+    assert cache.put("d" * 64, {"big": _big(tmp_path)}) is None  # larger than the whole budget
+
+
+def _big(tmp_path: Path) -> Path:
+    p = tmp_path / "big.bin"
+    p.write_bytes(b"\1" * 4000)
+    return p
+
+
+def _solve(cfg):
+    counter = Path(cfg["out_dir"]).parent / "solves"
+    counter.mkdir(parents=True, exist_ok=True)
+    (counter / f"{len(list(counter.iterdir()))}").touch()
+    outs = _write_run(Path(cfg["out_dir"]), f"t,T\n0,{cfg['A_PP']}\n")
+    return {"T_max": 1000.0 * cfg["A_PP"], "outputs": {k: str(v) for k, v in outs.items()}}
+
+
+def test_cached_worker_short_circuits_duplicate_sweep_points(tmp_path: Path):
+    worker = CachedWorker(_solve, tmp_path / "cache", "fresnel", version="test")
+    grid = {"A_PP": [0.3, 0.4], "out_dir": [str(tmp_path / "s1" / "a"), str(tmp_path / "s1" / "b")]}
+    first = sweep(grid, worker)
+    assert len(list((tmp_path / "s1" / "solves").iterdir())) == 2  # second out_dir of each A_PP is a hit
+    assert [r.get("cache_hit", False) for _, r in first] == [False, True, False, True]
+    again = sweep({"A_PP": [0.4], "out_dir": [str(tmp_path / "s2" / "x")]}, worker, max_parallel=2)
+    (cfg, res), = again
+    assert res["cache_hit"] and res["T_max"] == 400.0
+    assert Path(res["outputs"]["T_file"]) == tmp_path / "s2" / "x" / "pp_T_vs_time.csv"
+    assert Path(res["outputs"]["T_file"]).read_text(encoding="utf-8") == "t,T\n0,0.4\n"
+    assert not (tmp_path / "s2" / "solves").exists()
+
+
+def test_run_input_files_follow_params_dir_and_absorption_options(tmp_path: Path, monkeypatch):
+    from src.core.build import run_input_files
+
+    monkeypatch.chdir(tmp_path)
+    sizyuk = tmp_path / "data" / "derived" / "sizyuk"
+    sizyuk.mkdir(parents=True)
+    for name in ("absorptivity_vs_lambda.csv", "sizyuk_manifest.json", "absorptivity_oblique.npz"):
+        (sizyuk / name).write_text(name, encoding="utf-8")
+    (tmp_path / "nk.xlsx").write_text("nk", encoding="utf-8")
+    a, b = tmp_path / "a", tmp_path / "b"
+    a.mkdir(); b.mkdir()
+    (a / "config.yaml").write_text("laser: {A_PP: 0.4}\nabsorption: {use_nk: true, nk_file: nk.xlsx}\n",
+                                   encoding="utf-8")
+    (b / "config.yaml").write_text("laser: {A_PP: 0.5}\nabsorption: {angle_resolved: true}\n", encoding="utf-8")
+
+    files_a = run_input_files(a)  # only config.yaml: no legacy TXT files, no error
+    assert {p.name for p in files_a} == {"config.yaml", "absorptivity_vs_lambda.csv", "sizyuk_manifest.json",
+                                         "nk.xlsx"}
+    assert {p.name for p in run_input_files(b)} == {"config.yaml", "absorptivity_vs_lambda.csv",
+                                                    "sizyuk_manifest.json", "absorptivity_oblique.npz"}
+    assert [p.name for p in run_input_files(a, "kumar")] == ["config.yaml"]
+    key = lambda d: cache_key(run_inputs_config(run_input_files(d)), "fresnel", "v")
+    assert key(a) != key(b)
+    k_a = key(a)
+    (tmp_path / "nk.xlsx").write_text("nk v2", encoding="utf-8")
+    assert key(a) != k_a
+
+
+def test_code_version_marks_uncommitted_source_changes(monkeypatch):
+    import src.io.result_cache as rc
+
+    outputs = {"rev-parse": b"abc123\n", "diff": b"", "ls-files": b""}
+    monkeypatch.setattr(rc, "_git", lambda root, cmd, *args: outputs[cmd])
+    assert rc.code_version() == "abc123"
+    outputs["diff"] = b"--- a/src/core/build.py\n+++ b/src/core/build.py\n"
+    dirty = rc.code_version()
+    assert dirty.startswith("abc123+dirty.")
+    outputs["diff"] = b"--- a/src/core/build.py\n+++ b/src/core/build.py\n+x\n"
+    assert rc.code_version() not in ("abc123", dirty)
@@ -0,0 +1,77 @@
+import math
+
+import numpy as np
+
+from src.pp_sizyuk import (
+    Scenario,
+    ScenarioBatch,
+    absorbed_energy_batch,
+    integrate_absorbed_energy,
+    integrate_q_abs_sphere,
+    integrate_q_abs_sphere_batch,
+    intercepted_fraction_gaussian,
+    intercepted_fraction_gaussian_batch,
+    q_abs_hemisphere,
+    q_abs_hemisphere_batch,
+)
+
+
+def test_batch_matches_scalar_helpers():
+    scns = [
+        Scenario(R=1e-5, w0=8e-6),
+        Scenario(R=1.5e-5, w0=2e-5, y_beam=4e-6),
+        Scenario(R=8e-6, w0=5e-6, y0=1e-6, y_beam=-2e-6),
+    ]
+    A = np.array([0.1, 0.3, 0.5])
+    batch = ScenarioBatch.from_scenarios(scns, A=A)
+    assert len(batch) == 3 and batch.scenario(1) == scns[1]
+
+    t = np.linspace(0.0, 1e-8, 5)
+    P_t = np.full(t.size, 1e5)
+    th, _, qb = q_abs_hemisphere_batch(batch, t, P_t)
+    Eb = integrate_q_abs_sphere_batch(batch, th, t, qb)
+    for i, scn in enumerate(scns):
+        th_s, _, q = q_abs_hemisphere(scn, t, P_t, A[i])
+        assert np.allclose(qb[i], q, rtol=1e-12)
+        assert math.isclose(Eb[i], integrate_q_abs_sphere(scn.R, th_s, t, q), rel_tol=1e-12)
+
+    res = absorbed_energy_batch(batch, 1e-3, rtol=1e-9)
+    for i, scn in enumerate(scns):
+        ref = integrate_absorbed_energy(scn.R, scn.w0, A[i], 1e-3, dy=scn.y_beam - scn.y0, rtol=1e-9)
+        assert math.isclose(res.value[i], ref.value[0], rel_tol=1e-9)
+
+
+def test_intercepted_fraction_centred_and_offset():
+    R, w0 = 1e-5, np.array([1e-8, 1e-5, 1e-3])
+    frac = intercepted_fraction_gaussian_batch(ScenarioBatch(R=R, w0=w0))
+    assert np.allclose(frac, [intercepted_fraction_gaussian(R, w) for w in w0], rtol=1e-9)
+
+    # offset beam against a fine 2D quadrature of the disk
+    d, w = 6e-6, 8e-6
+    g = np.linspace(-R, R, 2001)
+    X, Y = np.meshgrid(g, g)
+    I = 2.0 / (math.pi * w * w) * np.exp(-2.0 * ((X - d) ** 2 + Y ** 2) / (w * w))
+    ref = np.sum(I * (X * X + Y * Y <= R * R)) * (g[1] - g[0]) ** 2
+    got = intercepted_fraction_gaussian_batch(ScenarioBatch(R=R, w0=w, x_beam=d))[0]
+    assert math.isclose(got, ref, rel_tol=2e-3)
+
+    # narrow beam centred on the rim intercepts half its power; far off misses entirely
+    rim = intercepted_fraction_gaussian_batch(ScenarioBatch(R=R, w0=1e-8, y_beam=[R, 3 * R]))
+    assert math.isclose(rim[0], 0.5, rel_tol=1e-3) and rim[1] == 0.0
+
+
+def test_grid_scan_is_single_vectorized_call():
+    batch = ScenarioBatch.from_grid(
+        R=np.linspace(5e-6, 2e-5, 20), w0=np.linspace(5e-6, 5e-5, 25),
+        y_offset=np.linspace(0.0, 2e-5, 10), A=[0.2, 0.4],
+    )
+    assert len(batch) == 20 * 25 * 10 * 2
+    res = absorbed_energy_batch(batch, 1e-3, rtol=1e-6)
+    assert res.converged.all()
+    frac = intercepted_fraction_gaussian_batch(batch)
+    # centred beams reduce to A * intercepted fraction * E_pulse; energy is linear in A
+    v = res.value.reshape(20, 25, 10, 2)
+    centred = (batch.A * frac * 1e-3).reshape(20, 25, 10, 2)[:, :, 0]
+    assert np.allclose(v[:, :, 0], centred, rtol=1e-5)
+    assert np.allclose(v[..., 1], 2.0 * v[..., 0], rtol=1e-5)
+    assert np.all((frac >= 0.0) & (frac <= 1.0))
@@ -23,3 +23,64 @@ def test_sizyuk_outputs(tmp_path: Path):
     js = json.loads(mf.read_text(encoding="utf-8"))
     assert js.get("tables") and js.get("plots")
 
+
+
+def test_sizyuk_incremental_regeneration(tmp_path: Path):
+    nk_csv = tmp_path / "nk.csv"
+    nk_csv.write_text("lambda_um,n,k\n0.8,2.0,3.0\n1.0,2.0,3.0\n1.2,2.0,3.0\n", encoding="utf-8")
+    out_tables, out_plots = tmp_path / "tables", tmp_path / "plots"
+    cfg = {"oblique_n_lambda": 8, "oblique_n_theta": 5}
+
+    first = run_sizyuk(nk_csv, out_tables, out_plots, config=cfg)
+    assert sorted(first["regenerated"]) == ["absorptivity_oblique", "plots", "tables"]
+    js = json.loads((out_tables / "sizyuk_manifest.json").read_text(encoding="utf-8"))
+    assert js["nk_sha256"] and set(js["artifacts"]) == {"tables", "absorptivity_oblique", "plots"}
+
+    # unchanged inputs: nothing is rebuilt
+    assert run_sizyuk(nk_csv, out_tables, out_plots, config=cfg)["regenerated"] == []
+    # plot-only change replots without touching the tables
+    csv_mtime = (out_tables / "absorptivity_vs_lambda.csv").stat().st_mtime_ns
+    assert run_sizyuk(nk_csv, out_tables, out_plots, config=dict(cfg, plot_dpi=72))["regenerated"] == ["plots"]
+    assert (out_tables / "absorptivity_vs_lambda.csv").stat().st_mtime_ns == csv_mtime
+    # new n_medium invalidates everything; edited n,k contents too
+    assert len(run_sizyuk(nk_csv, out_tables, out_plots, config=dict(cfg, plot_dpi=72, n_medium=1.5))["regenerated"]) == 3
+    nk_csv.write_text("lambda_um,n,k\n0.8,2.0,3.5\n1.0,2.0,3.5\n1.2,2.0,3.5\n", encoding="utf-8")
+    assert len(run_sizyuk(nk_csv, out_tables, out_plots, config=dict(cfg, plot_dpi=72, n_medium=1.5))["regenerated"]) == 3
+    # a deleted artifact is rebuilt on its own
+    (out_tables / "reflectivity_vs_lambda.csv").unlink()
+    assert run_sizyuk(nk_csv, out_tables, out_plots, config=dict(cfg, plot_dpi=72, n_medium=1.5))["regenerated"] == ["tables"]
+
+
+def test_sizyuk_concurrent_callers_build_once(tmp_path: Path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    nk_csv = tmp_path / "nk.csv"
+    nk_csv.write_text("lambda_um,n,k\n0.8,2.0,3.0\n1.0,2.0,3.0\n1.2,2.0,3.0\n", encoding="utf-8")
+    cfg = {"oblique_n_lambda": 8, "oblique_n_theta": 5, "plot": False}
+    with ThreadPoolExecutor(4) as ex:
+        results = list(ex.map(lambda _: run_sizyuk(nk_csv, tmp_path / "t", tmp_path / "p", config=cfg), range(4)))
+    rebuilt = [r["regenerated"] for r in results if r["regenerated"]]
+    assert len(rebuilt) == 1
+
+
+def test_build_import_does_not_load_matplotlib():
+    import subprocess
+    import sys
+
+    code = "import sys, src.core.build, src.pp_sizyuk; print('matplotlib' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                         cwd=Path(__file__).resolve().parents[1], check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_sizyuk_background_plots(tmp_path: Path):
+    from src.visualization.sizyuk_plots import wait_for_plots
+
+    nk_csv = tmp_path / "nk.csv"
+    nk_csv.write_text("lambda_um,n,k\n0.8,2.0,3.0\n1.0,2.0,3.0\n1.2,2.0,3.0\n", encoding="utf-8")
+    cfg = {"oblique_n_lambda": 8, "oblique_n_theta": 5, "plot_mode": "background"}
+    manifest = run_sizyuk(nk_csv, tmp_path / "tables", tmp_path / "plots", config=cfg)
+    # tables are complete when run_sizyuk returns; the PNG arrives from the worker
+    assert (tmp_path / "tables" / "absorptivity_vs_lambda.csv").is_file()
+    assert [str(p) for p in wait_for_plots(timeout=120)] == [manifest["plots"]["absorptivity_vs_lambda"]]
+    assert (tmp_path / "plots" / "absorptivity_vs_lambda.png").is_file()
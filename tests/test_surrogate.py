@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.core.surrogate import GaussianProcessSurrogate, dataset_from_runs
+from src.io.sweep_manifest import write_sweep_manifest
+
+
+def _peak_T(A, E, R):
+    # smooth stand-in for a peak-temperature metric: absorbed energy over heat capacity
+    frac = 1.0 - np.exp(-2.0 * R ** 2 / (1.7e-5) ** 2)
+    return 300.0 + A * frac * E / (6980.0 * 4.0 / 3.0 * np.pi * R ** 3 * 237.0)
+
+
+def _manifest(path: Path, n: int = 60, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    A, E, R = rng.uniform(0.2, 0.6, n), 10 ** rng.uniform(-8, -7, n), rng.uniform(1e-5, 2e-5, n)
+    runs = [{"run_id": f"r{i}", "params": {"laser": {"A_PP": A[i], "E_PP_total": E[i]}, "geometry.R": R[i]},
+             "metrics": {"T_max": float(_peak_T(A[i], E[i], R[i]))}} for i in range(n)]
+    runs.append({"run_id": "failed", "params": {"laser": {"A_PP": 0.3, "E_PP_total": 1e-8}, "geometry.R": 1e-5},
+                 "metrics": {"T_max": None}})
+    return write_sweep_manifest(path, runs)
+
+
+def test_gp_learns_manifest_metric_and_round_trips(tmp_path: Path):
+    path = _manifest(tmp_path / "sweep.json")
+    inputs = ["A_PP", "E_PP_total", "R"]
+    gp = GaussianProcessSurrogate.from_manifests(path, inputs, "T_max", log_inputs=["E_PP_total", "R"],
+                                                 log_output=True)
+    assert gp._z.size == 60
+
+    rng = np.random.default_rng(1)
+    X = np.column_stack([rng.uniform(0.25, 0.55, 500), 10 ** rng.uniform(-7.9, -7.1, 500),
+                         rng.uniform(1.1e-5, 1.9e-5, 500)])
+    truth = _peak_T(*X.T)
+    pred = gp.predict(X)
+    center = np.exp(pred.mean)
+    assert np.max(np.abs(center - truth) / truth) < 0.02
+    assert np.mean((pred.lower <= truth) & (truth <= pred.upper)) > 0.9
+    by_name = gp.predict({"A_PP": X[:, 0], "E_PP_total": X[:, 1], "R": X[:, 2]})
+    assert np.array_equal(by_name.mean, pred.mean)
+    # far outside the training box the band widens and points are not "confident"
+    far = np.array([[0.9, 1e-5, 5e-5]])
+    assert gp.predict(far).std[0] > 10 * pred.std.mean()
+    assert gp.confident(X, rtol=0.05).mean() > 0.9 and not gp.confident(far, rtol=0.05)[0]
+
+    loaded = GaussianProcessSurrogate.load(gp.save(tmp_path / "gp.npz"))
+    assert np.allclose(loaded.predict(X).mean, pred.mean, rtol=0, atol=1e-12)
+
+
+def test_lml_gradient_matches_finite_differences():
+    rng = np.random.default_rng(2)
+    X = rng.uniform(size=(25, 2))
+    y = np.sin(3 * X[:, 0]) + X[:, 1] ** 2 + 0.01 * rng.standard_normal(25)
+    gp = GaussianProcessSurrogate(["a", "b"], "y").fit(X, y, max_iter=5)
+    theta = np.array([-0.3, 0.2, 0.1, np.log(0.05)])
+    _, g = gp._lml(theta)
+    for k in range(theta.size):
+        e = np.zeros_like(theta)
+        e[k] = 1e-6
+        fd = (gp._lml(theta + e, grad=False)[0] - gp._lml(theta - e, grad=False)[0]) / 2e-6
+        assert g[k] == pytest.approx(fd, rel=1e-4, abs=1e-6)
+
+
+def test_dataset_skips_incomplete_runs():
+    runs = [{"params": {"A_PP": 0.3}, "metrics": {"T_max": 1000.0}},
+            {"params": {"A_PP": "nan"}, "metrics": {"T_max": 900.0}},
+            {"params": {}, "metrics": {"T_max": 800.0}}]
+    X, y = dataset_from_runs(runs, ["A_PP"], "T_max")
+    assert X.shape == (1, 1) and y.tolist() == [1000.0]
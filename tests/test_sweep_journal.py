@@ -0,0 +1,61 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.core.solvers.sweep import failures, sweep
+from src.io.sweep_journal import SweepJournal, point_key
+
+CALLS = []
+
+
+def _make_worker(out_dir: Path, crash_at=None):
+    def worker(cfg):
+        if crash_at is not None and cfg == crash_at:
+            raise RuntimeError("licence dropped")
+        CALLS.append(dict(cfg))
+        path = out_dir / f"a{cfg['a']}_b{cfg['b']}.csv"
+        path.write_text(f"{cfg['a'] * cfg['b']}\n", encoding="utf-8")
+        return {"value": cfg["a"] * cfg["b"], "outputs": {"csv": path}}
+    return worker
+
+
+def test_journaled_sweep_resumes_in_any_grid_order(tmp_path: Path):
+    journal = tmp_path / "journal.jsonl"
+    CALLS.clear()
+    with pytest.raises(RuntimeError):
+        sweep({"a": [1, 2, 3], "b": [10, 20]}, _make_worker(tmp_path, crash_at={"a": 2, "b": 20}), journal=journal)
+    assert len(CALLS) == 3 and len(journal.read_text().splitlines()) == 3
+
+    # crash mid-write leaves a torn line; the restart also reorders the grid
+    with journal.open("a") as f:
+        f.write('{"key": "trunc')
+    CALLS.clear()
+    results = sweep({"b": [20, 10], "a": [3, 2, 1]}, _make_worker(tmp_path), journal=journal)
+    assert sorted((c["a"], c["b"]) for c in CALLS) == [(2, 20), (3, 10), (3, 20)]
+    assert [r["value"] for _, r in results] == [60, 40, 20, 30, 20, 10]
+
+    # a changed output invalidates its point only
+    (tmp_path / "a1_b10.csv").write_text("corrupted\n", encoding="utf-8")
+    CALLS.clear()
+    sweep({"a": [1, 2, 3], "b": [10, 20]}, _make_worker(tmp_path), journal=journal)
+    assert CALLS == [{"a": 1, "b": 10}]
+    rec = SweepJournal(journal).verified({"b": 10, "a": 1})
+    assert rec is not None and rec["key"] == point_key({"a": 1, "b": 10})
+    assert len(SweepJournal(journal).manifest_runs()) == 6
+
+
+def _flaky(cfg):
+    if cfg["a"] == 2:
+        raise ValueError("diverged")
+    return {"value": cfg["a"]}
+
+
+def test_parallel_sweep_journals_failures_for_rerun(tmp_path: Path):
+    journal = tmp_path / "journal.jsonl"
+    results = sweep({"a": [1, 2, 3]}, _flaky, max_parallel=2, journal=journal)
+    assert [f.cfg for f in failures(results)] == [{"a": 2}]
+    records = [json.loads(line) for line in journal.read_text().splitlines()]
+    assert sorted(r["status"] for r in records) == ["failed", "ok", "ok"]
+    jr = SweepJournal(journal)
+    assert jr.verified({"a": 2}) is None and jr.verified({"a": 3})["result"] == {"value": 3}
@@ -1,4 +1,4 @@
-from src.core.solvers.sweep import sweep
+from src.core.solvers.sweep import iter_sweep, parallel_sweep, sweep
 
 
 def test_sweep_stub_runs_worker():
@@ -9,3 +9,57 @@ def test_sweep_stub_runs_worker():
     pairs = dict((tuple(sorted(cfg.items())), res) for cfg, res in results)
     assert (('a', 1), ('b', 'x')) in pairs
     assert (('a', 2), ('b', 'x')) in pairs
+
+
+
+def test_sweep_accepts_one_shot_iterables():
+    def worker(cfg):
+        return cfg["a"] * cfg["b"]
+    results = sweep({"a": iter([1, 2]), "b": (x for x in (10,))}, worker)
+    assert [r for _, r in results] == [10, 20]
+    streamed = list(iter_sweep({"a": iter([3]), "b": (x for x in (2, 4))}, worker))
+    assert [r for _, r in streamed] == [6, 12]
+    pooled = parallel_sweep({"a": iter([1, 2]), "b": (x for x in (5,))}, _square, max_parallel=2)
+    assert [r for _, r in pooled] == [1, 4]
+
+def _square(cfg):
+    import os
+    if cfg["a"] == 3:
+        raise ValueError("bad point")
+    if cfg["a"] == 5 and cfg["b"] == "y":
+        os._exit(1)  # simulate a JVM crash taking the worker process down
+    return cfg["a"] ** 2
+
+
+def _with_client(cfg, client):
+    import os
+    return os.getpid(), client.pid, cfg["a"]
+
+
+def test_parallel_sweep_keeps_grid_order_and_isolates_failures():
+    from src.core.solvers.sweep import SweepFailure, failures, grid_points
+
+    grid = {"a": [1, 2, 3, 4, 5], "b": ["x", "y"]}
+    results = sweep(grid, _square, max_parallel=3)
+    assert [cfg for cfg, _ in results] == grid_points(grid)
+    bad = failures(results)
+    assert [(f.cfg["a"], f.cfg["b"], f.error) for f in bad] == [(3, "x", "ValueError"), (3, "y", "ValueError"),
+                                                                (5, "y", "BrokenProcessPool")]
+    ok = [(cfg["a"], res) for cfg, res in results if not isinstance(res, SweepFailure)]
+    assert ok == [(a, a * a) for a in (1, 1, 2, 2, 4, 4, 5)]
+
+
+def test_parallel_sweep_starts_one_session_per_worker(monkeypatch):
+    import os
+    import sys
+    import types
+
+    class DummyClient:
+        def __init__(self):
+            self.pid = os.getpid()
+
+    monkeypatch.setitem(sys.modules, "mph", types.SimpleNamespace(start=DummyClient))
+    results = sweep({"a": list(range(12))}, _with_client, max_parallel=2, session=True)
+    assert [res[2] for _, res in results] == list(range(12))
+    assert all(pid == client_pid for pid, client_pid, _ in (res for _, res in results))
+    assert len({pid for _, (pid, _, _) in results}) <= 2
@@ -0,0 +1,57 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.core.thermo import (
+    MATERIALS,
+    VaporPressureLaw,
+    dpsat_dT,
+    get_p_sat_callable,
+    j_evap,
+    p_sat_kumar,
+    psat,
+    recoil_pressure,
+    register_material,
+)
+
+T = np.linspace(600.0, 3500.0, 50)
+
+
+def test_kumar_matches_model_builder_expressions():
+    # ModelBuilder._create_aux_features: Psat, J_evap with KUMAR-2D parameters
+    P_ref, Lv_sn, M_sn, Tboil_sn, R_gas, beta_r = 101325.0, 2.96e6, 118.71e-3, 2875.0, 8.314, 0.15
+    for Ti in (800.0, 2875.0, 3200.0):
+        Psat = P_ref * math.exp((Lv_sn * M_sn / R_gas) * (1 / Tboil_sn - 1 / Ti))
+        J = (1 - beta_r) * Psat * math.sqrt(M_sn / (2 * math.pi * R_gas * Ti))
+        assert psat(Ti) == pytest.approx(Psat, rel=1e-12)
+        assert p_sat_kumar(Ti, P_ref, Lv_sn * M_sn, Tboil_sn) == pytest.approx(Psat, rel=1e-12)
+        assert j_evap(Ti, beta_r=beta_r) == pytest.approx(J, rel=1e-12)
+        assert recoil_pressure(Ti, beta_r=beta_r) == pytest.approx((1 + beta_r / 2) * Psat, rel=1e-12)
+    assert psat(2875.0) == pytest.approx(101325.0)
+
+
+def test_alcock_matches_legacy_expression_and_hk_form():
+    expr = np.exp((-1.5332e4 / T + 8.14281) * np.log(10)) * 1.3332e2
+    assert np.allclose(psat(T, "alcock_sn"), expr, rtol=1e-12)
+    hk = 0.8 * (expr - 10.0) / np.sqrt(2 * np.pi * 8.314 * T / 118.71e-3)
+    assert np.allclose(j_evap(T, "alcock_sn", form="hk", HK_gamma=0.8, p_amb=10.0), hk, rtol=1e-12)
+
+
+@pytest.mark.parametrize("material", sorted(MATERIALS))
+def test_derivative_and_vectorized_shapes(material):
+    h = 1e-3
+    fd = (psat(T + h, material) - psat(T - h, material)) / (2 * h)
+    assert np.allclose(dpsat_dT(T, material), fd, rtol=1e-6)
+    grid = T.reshape(5, 10)
+    assert psat(grid, material).shape == (5, 10) and np.all(np.diff(psat(T, material)) > 0)
+    assert np.allclose(get_p_sat_callable(material)(T), psat(T, material))
+
+
+def test_registry_and_fallback():
+    register_material(VaporPressureLaw("test_metal", M=0.1, Lv=1e6, T_boil=2000.0))
+    assert psat(2000.0, "TEST_METAL") == pytest.approx(101325.0)
+    MATERIALS.pop("test_metal")
+    with pytest.raises(KeyError):
+        psat(1000.0, "unobtainium")
+    assert np.all(get_p_sat_callable(None)(T) == 0.0)